@@ -8,11 +8,18 @@ cross-reference management, and visual diagram support.
 __version__ = "0.1.0"
 __author__ = "ARXML Editor Team"
 
-from .core.arxml_model import ARXMLModel
-from .core.schema_manager import SchemaManager
-from .core.reference_manager import ReferenceManager
-from .validation.validator import ARXMLValidator
-from .ui.main_window import MainWindow
+import importlib
+
+# Public names and the modules providing them. They are imported on first
+# access so that importing a submodule (e.g. arxml_editor.main for --help)
+# does not pull in Qt and the schema libraries.
+_EXPORTS = {
+    "ARXMLModel": ".core.arxml_model",
+    "SchemaManager": ".core.schema_manager",
+    "ReferenceManager": ".core.reference_manager",
+    "ARXMLValidator": ".validation.validator",
+    "MainWindow": ".ui.main_window",
+}
 
 __all__ = [
     "ARXMLModel",
@@ -20,4 +27,14 @@ __all__ = [
     "ReferenceManager",
     "ARXMLValidator",
     "MainWindow"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import public names lazily."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
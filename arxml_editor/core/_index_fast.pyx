@@ -0,0 +1,78 @@
+# cython: language_level=3
+"""
+Compiled tree indexer for ElementIndex.
+
+Optional accelerator for ``ElementIndex.index_tree``. It performs the same
+walk as the pure Python implementation (same paths, same order) but keeps
+the per-element glue - SHORT-NAME lookup, path building and bookkeeping of
+inherited path segments - in C. Built by setup.py when Cython is available;
+ElementIndex falls back to the Python loop otherwise.
+
+``group_duplicates`` mirrors ``ElementIndex.find_duplicate_groups`` in the
+same way.
+"""
+
+from cpython.unicode cimport PyUnicode_Join
+
+import sys
+
+cdef object _intern = sys.intern
+
+
+def index_tree(object index, object root, object file_path):
+    """Index all named elements of ``root`` into ``index``."""
+    cdef str tag = root.tag
+    cdef str short_name_tag
+    cdef dict inherited = {root: ()}
+    cdef tuple segments
+    cdef object add_element = index.add_element
+    cdef object element, child, short_name_elem
+
+    if tag.startswith("{"):
+        short_name_tag = tag[:tag.index("}") + 1] + "SHORT-NAME"
+    else:
+        short_name_tag = "SHORT-NAME"
+
+    for element in root.iter():
+        segments = inherited.pop(element)
+
+        short_name_elem = element.find(short_name_tag)
+        if short_name_elem is not None and short_name_elem.text:
+            segments = segments + (_intern(short_name_elem.text),)
+            add_element(element, "/" + PyUnicode_Join("/", segments), file_path, segments)
+
+        for child in element:
+            inherited[child] = segments
+
+
+def _first_row(list group):
+    return group[0].row
+
+
+def group_duplicates(list elements, object skip_types):
+    """Group elements sharing parent path, type and SHORT-NAME."""
+    cdef dict first_seen = {}
+    cdef dict duplicates = {}
+    cdef object element_info, first, parent_path
+    cdef str short_name, element_type
+    cdef tuple key
+    cdef list group
+
+    for element_info in elements:
+        short_name = element_info.short_name
+        parent_path = element_info.parent_path
+        if not short_name or parent_path is None:
+            continue
+        element_type = element_info.element_type
+        if element_type in skip_types:
+            continue
+        key = (parent_path, element_type, short_name)
+        first = first_seen.setdefault(key, element_info)
+        if first is not element_info:
+            group = duplicates.get(key)
+            if group is None:
+                duplicates[key] = [first, element_info]
+            else:
+                group.append(element_info)
+
+    return sorted(duplicates.values(), key=_first_row)
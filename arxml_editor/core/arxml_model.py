@@ -6,10 +6,13 @@ and cross-reference management.
 """
 
 import os
+import sys
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .schema_manager import SchemaManager, AUTOSARRelease
 from .element_index import ElementIndex, ElementInfo
@@ -23,13 +26,93 @@ from ..utils.naming_conventions import ARXMLNamingConventions
 class ARXMLFile:
     """Represents an ARXML file with metadata."""
     path: Path
-    content: str
     root_element: ET.Element
     schema_version: Optional[AUTOSARRelease]
     is_modified: bool = False
     file_size: int = 0
 
 
+def _parse_file(file_path: Path) -> Tuple[ET.Element, int]:
+    """Parse an ARXML file straight from a memory map.
+    
+    The parser reads the mapped bytes directly, so the file is never decoded
+    into an intermediate Python string. Returns the root element and the file
+    size in bytes.
+    """
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            parser = ET.XMLParser()
+            parser.feed(mapped)
+            return parser.close(), len(mapped)
+
+
+def _parse_and_index_file(file_path: Path) -> Tuple[ET.Element, int, List[ElementInfo]]:
+    """Parse and index a single ARXML file.
+    
+    Runs in a worker process for ``ARXMLModel.load_files``. The root element and
+    the element infos are pickled together, so the infos still point into the
+    returned tree once they arrive in the parent process.
+    """
+    root_element, file_size = _parse_file(file_path)
+    
+    index = ElementIndex()
+    index.index_tree(root_element, str(file_path))
+    
+    return root_element, file_size, index.get_all_elements()
+
+
+@dataclass
+class ElementTreeNode:
+    """Node of the element tree returned by ``ARXMLModel.get_element_tree``.
+    
+    ``children`` is resolved from the element index on first access and kept,
+    so walking only the visible part of a tree never builds the rest of it.
+    """
+    path: str
+    short_name: Optional[str]
+    element_type: Optional[str]
+    uuid: Optional[str] = None
+    is_reference: bool = False
+    _element_index: Optional[ElementIndex] = field(default=None, repr=False, compare=False)
+    _children: Optional[List["ElementTreeNode"]] = field(default=None, repr=False, compare=False)
+    
+    @classmethod
+    def from_element_info(cls, element_index: ElementIndex, element_info: ElementInfo) -> "ElementTreeNode":
+        """Create a node for an indexed element."""
+        return cls(
+            path=element_info.path,
+            short_name=element_info.short_name,
+            element_type=element_info.element_type,
+            uuid=element_info.uuid,
+            is_reference=element_info.is_reference,
+            _element_index=element_index
+        )
+    
+    @property
+    def children(self) -> List["ElementTreeNode"]:
+        """Child nodes, resolved from the element index on first access."""
+        if self._children is None:
+            if self._element_index is None:
+                self._children = []
+            else:
+                self._children = [
+                    ElementTreeNode.from_element_info(self._element_index, child)
+                    for child in self._element_index.get_children(self.path)
+                ]
+        return self._children
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the node and its whole subtree as plain dicts."""
+        return {
+            "path": self.path,
+            "short_name": self.short_name,
+            "element_type": self.element_type,
+            "uuid": self.uuid,
+            "is_reference": self.is_reference,
+            "children": [child.to_dict() for child in self.children]
+        }
+
+
 class ARXMLModel:
     """Main ARXML model for file management and editing."""
     
@@ -46,40 +129,41 @@ class ARXMLModel:
         # Performance optimization
         self._lazy_loading = True
         self._loaded_packages: Set[str] = set()
+        
+        # Fully qualified SHORT-NAME tag of the loaded documents
+        self._short_name_tag = "SHORT-NAME"
     
     def load_file(self, file_path: Union[str, Path]) -> bool:
         """Load an ARXML file into the model."""
         file_path = Path(file_path)
         
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Parse XML
-            root_element = ET.fromstring(content)
+            root_element, file_size = _parse_file(file_path)
             
             # Detect schema version
-            schema_version = self.schema_manager.detect_schema_version(content)
+            schema_version = self.schema_manager.detect_schema_version_from_root(root_element)
             
             # Create file object
             arxml_file = ARXMLFile(
                 path=file_path,
-                content=content,
                 root_element=root_element,
                 schema_version=schema_version,
-                file_size=len(content)
+                file_size=file_size
             )
             
             # Store file
             self.files[file_path] = arxml_file
             self.current_file = file_path
+            self._update_namespace_tags(root_element)
             
             # Index elements
             self._index_file(arxml_file)
             
-            # Analyze references
-            self.reference_manager.analyze_references()
+            # Analyze references of the new elements
+            self.reference_manager.analyze_references_incremental(
+                self.element_index.take_recently_added()
+            )
             
             return True
             
@@ -87,6 +171,50 @@ class ARXMLModel:
             print(f"Error loading file {file_path}: {e}")
             return False
     
+    def load_files(self, file_paths: List[Union[str, Path]]) -> bool:
+        """Load several ARXML files, parsing and indexing them in parallel.
+        
+        Each file is parsed and indexed in a worker process; the partial indexes
+        are merged here and references are analyzed once at the end. Returns
+        True if every file was loaded.
+        """
+        file_paths = [Path(p) for p in file_paths]
+        if len(file_paths) <= 1:
+            return all(self.load_file(p) for p in file_paths)
+        
+        success = True
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(p, executor.submit(_parse_and_index_file, p)) for p in file_paths]
+            
+            for file_path, future in futures:
+                try:
+                    root_element, file_size, element_infos = future.result()
+                except Exception as e:
+                    print(f"Error loading file {file_path}: {e}")
+                    success = False
+                    continue
+                
+                arxml_file = ARXMLFile(
+                    path=file_path,
+                    root_element=root_element,
+                    schema_version=self.schema_manager.detect_schema_version_from_root(root_element),
+                    file_size=file_size
+                )
+                
+                self.files[file_path] = arxml_file
+                self.current_file = file_path
+                self._update_namespace_tags(root_element)
+                self.element_index.merge(element_infos)
+        
+        # Analyze references of all newly loaded files in one batch
+        self.reference_manager.analyze_references_incremental(
+            self.element_index.take_recently_added()
+        )
+        
+        return success
+    
     def save_file(self, file_path: Optional[Path] = None, target_schema: Optional[AUTOSARRelease] = None) -> bool:
         """Save current model to file."""
         if not self.current_file and not file_path:
@@ -160,7 +288,7 @@ class ARXMLModel:
             # If we're performing a Save As (writing to a new path), create a new
             # ARXMLFile entry so subsequent operations know about it.
             if target_file in self.files:
-                self.files[target_file].content = content
+                self.files[target_file].file_size = len(content)
                 self.files[target_file].is_modified = False
                 self.files[target_file].schema_version = schema_version
             else:
@@ -168,7 +296,6 @@ class ARXMLModel:
                 src = self.files[in_memory_file_path]
                 new_file = ARXMLFile(
                     path=Path(target_file),
-                    content=content,
                     root_element=src.root_element,
                     schema_version=schema_version,
                     is_modified=False,
@@ -187,36 +314,18 @@ class ARXMLModel:
             logging.getLogger(__name__).exception("Error saving file %s", target_file)
             return False
     
+    def _update_namespace_tags(self, root_element: ET.Element) -> None:
+        """Derive namespaced tag names from a loaded document's root."""
+        tag = root_element.tag
+        if tag.startswith("{"):
+            namespace = tag[1:tag.index("}")]
+            self._short_name_tag = sys.intern(f"{{{namespace}}}SHORT-NAME")
+        else:
+            self._short_name_tag = "SHORT-NAME"
+    
     def _index_file(self, arxml_file: ARXMLFile) -> None:
         """Index all elements in an ARXML file."""
-        self._index_element_recursive(
-            arxml_file.root_element, 
-            "", 
-            str(arxml_file.path)
-        )
-    
-    def _index_element_recursive(self, element: ET.Element, parent_path: str, file_path: str) -> None:
-        """Recursively index elements in the tree."""
-        # Build current path
-        short_name = XMLUtils.get_short_name(element)
-        if short_name:
-            current_path = PathUtils.build_autosar_path(
-                PathUtils.parse_autosar_path(parent_path) + [short_name]
-            )
-        else:
-            current_path = parent_path
-        
-        # Only index elements that have SHORT-NAME (actual named elements)
-        # Skip container elements that don't have names themselves
-        should_index = short_name is not None and short_name != ""
-        
-        if should_index:
-            # Index element
-            self.element_index.add_element(element, current_path, file_path)
-        
-        # Process children
-        for child in element:
-            self._index_element_recursive(child, current_path, file_path)
+        self.element_index.index_tree(arxml_file.root_element, str(arxml_file.path))
     
     def _serialize_file(self, file_path: Path, schema_version: AUTOSARRelease) -> str:
         """Serialize file content with proper formatting."""
@@ -251,35 +360,29 @@ class ARXMLModel:
         """Get direct children of element at path."""
         return self.element_index.get_children(path)
     
-    def get_element_tree(self, root_path: str = "") -> Dict[str, Any]:
-        """Get hierarchical tree structure of elements."""
+    def get_element_tree(self, root_path: str = "") -> Optional[ElementTreeNode]:
+        """Get hierarchical tree structure of elements.
+        
+        Without ``root_path`` the tree starts at a synthetic ROOT node above
+        the top-level packages. Returns None for an unknown path. Children are
+        resolved lazily; use ``ElementTreeNode.to_dict`` for a plain, fully
+        expanded copy.
+        """
         if not root_path:
-            # Get root elements
-            root_elements = self.element_index.get_children("")
-            return {
-                "path": "",
-                "short_name": "ROOT",
-                "element_type": "AUTOSAR",
-                "children": [self._build_tree_node(elem) for elem in root_elements]
-            }
-        else:
-            element_info = self.get_element_by_path(root_path)
-            if element_info:
-                return self._build_tree_node(element_info)
-            return {}
+            return ElementTreeNode(
+                path="",
+                short_name="ROOT",
+                element_type="AUTOSAR",
+                _children=[self._build_tree_node(elem) for elem in self.element_index.iter_roots()]
+            )
+        element_info = self.get_element_by_path(root_path)
+        if element_info:
+            return self._build_tree_node(element_info)
+        return None
     
-    def _build_tree_node(self, element_info: ElementInfo) -> Dict[str, Any]:
+    def _build_tree_node(self, element_info: ElementInfo) -> ElementTreeNode:
         """Build tree node from element info."""
-        children = self.element_index.get_children(element_info.path)
-        
-        return {
-            "path": element_info.path,
-            "short_name": element_info.short_name,
-            "element_type": element_info.element_type,
-            "uuid": element_info.uuid,
-            "is_reference": element_info.is_reference,
-            "children": [self._build_tree_node(child) for child in children]
-        }
+        return ElementTreeNode.from_element_info(self.element_index, element_info)
     
     def create_element(self, parent_path: str, element_type: str, short_name: str, 
                       attributes: Optional[Dict[str, str]] = None) -> Optional[str]:
@@ -355,6 +458,8 @@ class ARXMLModel:
         # Update index if this affects indexing
         if attribute == "UUID":
             self.element_index.update_element(path, element_info.element)
+        elif attribute == "DEST":
+            self.element_index.refresh_reference(path)
         
         # Mark as modified
         self.is_modified = True
@@ -372,9 +477,11 @@ class ARXMLModel:
             return False
         
         XMLUtils.set_element_text(element_info.element, text)
+        self.element_index.refresh_reference(path)
         
         # Update index if this affects SHORT-NAME
-        if element_info.element.tag.endswith("SHORT-NAME"):
+        tag = element_info.element.tag
+        if tag == self._short_name_tag or tag == "SHORT-NAME":
             # This is a SHORT-NAME element, need to update parent
             parent_path = PathUtils.get_parent_path(path)
             if parent_path:
@@ -407,22 +514,33 @@ class ARXMLModel:
         # XSD validation errors
         for file_path, arxml_file in self.files.items():
             if arxml_file.schema_version:
-                xsd_errors = self.schema_manager.validate_xsd(
-                    arxml_file.content, 
+                xsd_errors = self.schema_manager.validate_xsd_from_file(
+                    arxml_file.path,
                     arxml_file.schema_version
                 )
                 for error in xsd_errors:
                     errors.append((str(file_path), error))
         
-        # Reference validation errors
-        ref_errors = self.reference_manager.validate_all_references()
-        errors.extend(ref_errors)
-        
-        # Element structure validation
-        for element_info in self.element_index.get_all_elements():
-            struct_errors = XMLUtils.validate_xml_structure(element_info.element)
-            for error in struct_errors:
-                errors.append((element_info.path, error))
+        # Structure and reference validation in a single pass over the index
+        get_short_name = XMLUtils.get_short_name
+        validate_structure = XMLUtils.validate_xml_structure
+        get_references_from = self.reference_manager.get_references_from
+        
+        for path, element, is_reference, ref_value, reference_dest in \
+                self.element_index.iter_validation_items():
+            # Check the element and the unnamed elements it owns; named
+            # descendants are indexed and get checked on their own turn
+            stack = [element]
+            while stack:
+                node = stack.pop()
+                for error in validate_structure(node, recursive=False):
+                    errors.append((path, error))
+                stack.extend(child for child in node if not get_short_name(child))
+            
+            if is_reference and ref_value:
+                for ref_info in get_references_from(path):
+                    if not ref_info.is_valid:
+                        errors.append((path, ref_info.error_message or "Invalid reference"))
         
         return errors
     
@@ -448,6 +566,7 @@ class ARXMLModel:
         self.files.clear()
         self.current_file = None
         self.is_modified = False
+        self._short_name_tag = "SHORT-NAME"
         self.element_index.clear()
         self.reference_manager = ReferenceManager(self.element_index)
     
@@ -4,13 +4,23 @@ Element index for efficient ARXML element lookup and cross-referencing.
 Provides fast access to elements by path, UUID, and other identifiers.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any, Callable
+import sys
+from array import array
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Any, Callable
 from dataclasses import dataclass
 from collections import defaultdict
 import xml.etree.ElementTree as ET
 from ..utils.path_utils import PathUtils
 from ..utils.xml_utils import XMLUtils
 
+try:
+    # Optional compiled indexer, built by setup.py when Cython is available
+    from ._index_fast import index_tree as _index_tree_fast
+    from ._index_fast import group_duplicates as _group_duplicates_fast
+except ImportError:
+    _index_tree_fast = None
+    _group_duplicates_fast = None
+
 
 @dataclass
 class ElementInfo:
@@ -24,6 +34,9 @@ class ElementInfo:
     file_path: Optional[str] = None
     is_reference: bool = False
     reference_dest: Optional[str] = None
+    ref_value: Optional[str] = None
+    segments: Tuple[str, ...] = ()
+    row: int = -1  # Integer id of the element, unique within its index
 
 
 class ElementIndex:
@@ -36,20 +49,37 @@ class ElementIndex:
         self._by_type: Dict[str, List[ElementInfo]] = defaultdict(list)
         self._by_file: Dict[str, List[ElementInfo]] = defaultdict(list)
         self._children: Dict[str, List[ElementInfo]] = defaultdict(list)
-        self._references: Dict[str, List[ElementInfo]] = defaultdict(list)
+        # Reference adjacency is kept as compact arrays of row ids into _rows
+        self._rows: List[Optional[ElementInfo]] = []
+        self._references: Dict[str, array] = {}
         self._referenced_by: Dict[str, List[ElementInfo]] = defaultdict(list)
+        
+        # Elements added since the last take_recently_added() call and still
+        # indexed, by path, so removals and updates don't pile up stale entries
+        self._recently_added: Dict[str, ElementInfo] = {}
+        
+        # Bumped on every change so dependent caches can tell they are stale
+        self.generation = 0
     
-    def add_element(self, element: ET.Element, path: str, file_path: Optional[str] = None) -> ElementInfo:
-        """Add element to index."""
+    def add_element(self, element: ET.Element, path: str, file_path: Optional[str] = None,
+                    segments: Optional[Tuple[str, ...]] = None) -> ElementInfo:
+        """Add element to index.
+        
+        ``segments`` are the SHORT-NAMEs making up ``path``; callers that already
+        have them (such as ``index_tree``) pass them to avoid re-parsing the path.
+        """
+        if segments is None:
+            segments = tuple(PathUtils.parse_autosar_path(path))
         short_name = XMLUtils.get_short_name(element)
         uuid = XMLUtils.get_element_attribute(element, "UUID")
-        parent_path = PathUtils.get_parent_path(path)
+        parent_path = "/" + "/".join(segments[:-1]) if len(segments) > 1 else ""
         element_type = self._get_element_type(element)
         is_reference = XMLUtils.is_reference_element(element)
+        ref_value = None
         reference_dest = None
         
         if is_reference:
-            _, reference_dest = XMLUtils.get_reference_value(element)
+            ref_value, reference_dest = XMLUtils.get_reference_value(element)
         
         element_info = ElementInfo(
             element=element,
@@ -60,11 +90,39 @@ class ElementIndex:
             element_type=element_type,
             file_path=file_path,
             is_reference=is_reference,
-            reference_dest=reference_dest
+            reference_dest=reference_dest,
+            ref_value=ref_value,
+            segments=segments
         )
         
+        self._register(element_info)
+        return element_info
+    
+    def _register(self, element_info: ElementInfo) -> None:
+        """Add an already built ElementInfo to all lookup tables."""
+        # Siblings share parent path, type and often SHORT-NAME strings; interning
+        # them saves memory and lets key comparisons succeed on identity
+        if element_info.parent_path:
+            element_info.parent_path = sys.intern(element_info.parent_path)
+        if element_info.element_type:
+            element_info.element_type = sys.intern(element_info.element_type)
+        if element_info.short_name:
+            element_info.short_name = sys.intern(element_info.short_name)
+        
+        path = element_info.path
+        uuid = element_info.uuid
+        short_name = element_info.short_name
+        element_type = element_info.element_type
+        file_path = element_info.file_path
+        parent_path = element_info.parent_path
+        reference_dest = element_info.reference_dest
+        
         # Index by path
         self._by_path[path] = element_info
+        self.generation += 1
+        element_info.row = len(self._rows)
+        self._rows.append(element_info)
+        self._recently_added[path] = element_info
         
         # Index by UUID if available
         if uuid:
@@ -87,11 +145,76 @@ class ElementIndex:
             self._children[parent_path].append(element_info)
         
         # Index references
-        if is_reference and reference_dest:
-            self._references[reference_dest].append(element_info)
+        if element_info.is_reference and reference_dest:
+            rows = self._references.get(reference_dest)
+            if rows is None:
+                rows = self._references[reference_dest] = array('l')
+            rows.append(element_info.row)
+    
+    def refresh_reference(self, path: str) -> Optional[ElementInfo]:
+        """Re-read the cached reference value and DEST after a reference element was edited."""
+        element_info = self._by_path.get(path)
+        if element_info is None or not element_info.is_reference:
+            return element_info
+        
+        ref_value, reference_dest = XMLUtils.get_reference_value(element_info.element)
+        old_dest = element_info.reference_dest
+        if reference_dest != old_dest:
+            if old_dest and old_dest in self._references:
+                self._references[old_dest].remove(element_info.row)
+            if reference_dest:
+                rows = self._references.get(reference_dest)
+                if rows is None:
+                    rows = self._references[reference_dest] = array('l')
+                rows.append(element_info.row)
         
+        element_info.ref_value = ref_value
+        element_info.reference_dest = reference_dest
+        self.generation += 1
         return element_info
     
+    def take_recently_added(self) -> List[ElementInfo]:
+        """Return the elements added since the last call and reset the list."""
+        added = list(self._recently_added.values())
+        self._recently_added = {}
+        return added
+    
+    def merge(self, element_infos: List[ElementInfo]) -> None:
+        """Merge elements indexed elsewhere (e.g. in a worker process)."""
+        register = self._register
+        for element_info in element_infos:
+            register(element_info)
+    
+    def index_tree(self, root: ET.Element, file_path: Optional[str] = None) -> None:
+        """Index all named elements of a parsed ARXML tree."""
+        if _index_tree_fast is not None:
+            _index_tree_fast(self, root, file_path)
+            return
+        
+        add_element = self.add_element
+        intern = sys.intern
+        
+        # Named elements carry a SHORT-NAME child in the document namespace;
+        # an exact tag lets find() stay on the C fast path
+        tag = root.tag
+        short_name_tag = tag[:tag.index("}") + 1] + "SHORT-NAME" if tag.startswith("{") else "SHORT-NAME"
+        
+        # Path segments each pending element inherits from its named ancestors
+        inherited: Dict[ET.Element, Tuple[str, ...]] = {root: ()}
+        
+        for element in root.iter():
+            segments = inherited.pop(element)
+            
+            # Only index elements that have SHORT-NAME (actual named elements)
+            # Skip container elements that don't have names themselves
+            short_name_elem = element.find(short_name_tag)
+            if short_name_elem is not None and short_name_elem.text:
+                segments = segments + (intern(short_name_elem.text),)
+                add_element(element, "/" + "/".join(segments), file_path, segments)
+            
+            for child in element:
+                inherited[child] = segments
+    
     def remove_element(self, path: str) -> bool:
         """Remove element from index."""
         element_info = self._by_path.get(path)
@@ -116,10 +239,14 @@ class ElementIndex:
         
         if element_info.is_reference and element_info.reference_dest:
             if element_info.reference_dest in self._references:
-                self._references[element_info.reference_dest].remove(element_info)
+                self._references[element_info.reference_dest].remove(element_info.row)
         
         # Remove from main index
+        if self._recently_added.get(path) is element_info:
+            del self._recently_added[path]
         del self._by_path[path]
+        self._rows[element_info.row] = None
+        self.generation += 1
         
         return True
     
@@ -160,7 +287,8 @@ class ElementIndex:
     
     def get_references_to(self, target_path: str) -> List[ElementInfo]:
         """Get all elements that reference the target path."""
-        return self._references.get(target_path, [])
+        rows = self._rows
+        return [rows[row] for row in self._references.get(target_path, ())]
     
     def get_referenced_by(self, source_path: str) -> List[ElementInfo]:
         """Get all elements referenced by the source path."""
@@ -194,6 +322,39 @@ class ElementIndex:
         
         return results
     
+    def iter_validation_items(self) -> Iterator[Tuple[str, ET.Element, bool, Optional[str], Optional[str]]]:
+        """Iterate (path, element, is_reference, ref_value, reference_dest) for all elements."""
+        for element_info in self._by_path.values():
+            yield (element_info.path, element_info.element, element_info.is_reference,
+                   element_info.ref_value, element_info.reference_dest)
+    
+    def find_duplicate_groups(self, skip_types: FrozenSet[str] = frozenset()) -> List[List[ElementInfo]]:
+        """Find named elements that share parent path, type and SHORT-NAME.
+        
+        Returns one list per duplicated key, ordered by the first element of
+        each group. Elements whose type is in ``skip_types`` are ignored.
+        """
+        elements = list(self._by_path.values())
+        if _group_duplicates_fast is not None:
+            return _group_duplicates_fast(elements, skip_types)
+        
+        # Lists are only built for keys seen twice, which is rare
+        first_seen: Dict[Tuple[str, str, str], ElementInfo] = {}
+        duplicates: Dict[Tuple[str, str, str], List[ElementInfo]] = {}
+        for element_info in elements:
+            if (element_info.short_name and element_info.parent_path is not None
+                    and element_info.element_type not in skip_types):
+                key = (element_info.parent_path, element_info.element_type, element_info.short_name)
+                first = first_seen.setdefault(key, element_info)
+                if first is not element_info:
+                    group = duplicates.get(key)
+                    if group is None:
+                        duplicates[key] = [first, element_info]
+                    else:
+                        group.append(element_info)
+        
+        return sorted(duplicates.values(), key=lambda group: group[0].row)
+    
     def get_all_paths(self) -> List[str]:
         """Get all indexed paths."""
         return list(self._by_path.keys())
@@ -202,6 +363,12 @@ class ElementIndex:
         """Get all indexed elements."""
         return list(self._by_path.values())
     
+    def iter_roots(self) -> Iterator[ElementInfo]:
+        """Iterate over elements without a parent, in indexing order."""
+        for element_info in self._by_path.values():
+            if not element_info.parent_path:
+                yield element_info
+    
     def clear(self) -> None:
         """Clear all indexes."""
         self._by_path.clear()
@@ -210,8 +377,11 @@ class ElementIndex:
         self._by_type.clear()
         self._by_file.clear()
         self._children.clear()
+        self._rows.clear()
         self._references.clear()
         self._referenced_by.clear()
+        self._recently_added.clear()
+        self.generation += 1
     
     def get_statistics(self) -> Dict[str, int]:
         """Get index statistics."""
@@ -221,7 +391,7 @@ class ElementIndex:
             "unique_short_names": len(self._by_short_name),
             "unique_types": len(self._by_type),
             "files": len(self._by_file),
-            "reference_relationships": sum(len(refs) for refs in self._references.values())
+            "reference_relationships": sum(map(len, self._references.values()))
         }
     
     def _get_element_type(self, element: ET.Element) -> str:
@@ -268,7 +438,8 @@ class ElementIndex:
         
         for element_info in self._by_path.values():
             if element_info.is_reference:
-                ref_value, dest = XMLUtils.get_reference_value(element_info.element)
+                ref_value = element_info.ref_value
+                dest = element_info.reference_dest
                 if not ref_value:
                     errors.append((element_info.path, "Reference has empty value"))
                     continue
@@ -51,9 +51,36 @@ class ReferenceManager:
             if element_info.is_reference:
                 self._process_reference(element_info)
     
+    def analyze_references_incremental(self, added_elements: List[ElementInfo]) -> None:
+        """Analyze references of newly added elements without redoing the rest.
+        
+        Stale entries of re-added elements (a file loaded again) are dropped
+        first. References that were invalid before are re-checked as well,
+        since the new elements may be exactly what they were pointing at.
+        """
+        added_paths = {element_info.path for element_info in added_elements}
+        stale_keys = [key for key, ref in self.references.items() if ref.source_path in added_paths]
+        for key in stale_keys:
+            del self.references[key]
+        for path in added_paths:
+            self._reference_cache.pop(path, None)
+
+        invalid_keys = [key for key, ref in self.references.items() if not ref.is_valid]
+        invalid_sources = {self.references.pop(key).source_path for key in invalid_keys}
+        
+        for source_path in invalid_sources:
+            self._reference_cache.pop(source_path, None)
+            element_info = self.element_index.get_element_by_path(source_path)
+            if element_info is not None and element_info.is_reference:
+                self._process_reference(element_info)
+        
+        for element_info in added_elements:
+            if element_info.is_reference and element_info.path not in invalid_sources:
+                self._process_reference(element_info)
+    
     def _process_reference(self, element_info: ElementInfo) -> None:
         """Process a single reference element."""
-        ref_value, dest = XMLUtils.get_reference_value(element_info.element)
+        ref_value, dest = element_info.ref_value, element_info.reference_dest
         if not ref_value:
             return
         
@@ -201,36 +228,143 @@ class ReferenceManager:
         }
     
     def find_reference_cycles(self) -> List[List[str]]:
-        """Find circular references in the model."""
+        """Find circular references in the model.
+        
+        Iterative depth-first search over the integer-id reference graph, so
+        long reference chains cannot hit the recursion limit. Every edge is
+        followed at most once.
+        """
+        paths, adjacency = self._build_reference_graph()
+        count = len(paths)
+        visited = bytearray(count)
+        in_stack = bytearray(count)
         cycles = []
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(node_path: str, path: List[str]) -> None:
-            if node_path in rec_stack:
-                # Found a cycle
-                cycle_start = path.index(node_path)
-                cycles.append(path[cycle_start:] + [node_path])
-                return
-            
-            if node_path in visited:
-                return
-            
-            visited.add(node_path)
-            rec_stack.add(node_path)
+        
+        for root in range(count):
+            if visited[root]:
+                continue
             
-            # Check all references from this node
-            for ref_info in self.get_references_from(node_path):
-                if ref_info.is_resolved:
-                    dfs(ref_info.target_path, path + [node_path])
+            visited[root] = in_stack[root] = 1
+            # Current DFS path and, per entry, the next edge to follow
+            trail = [root]
+            positions = [0]
             
-            rec_stack.remove(node_path)
+            while trail:
+                node = trail[-1]
+                position = positions[-1]
+                edges = adjacency[node]
+                
+                if position < len(edges):
+                    positions[-1] = position + 1
+                    successor = edges[position]
+                    if in_stack[successor]:
+                        # Found a cycle
+                        cycle_start = trail.index(successor)
+                        cycles.append([paths[member] for member in trail[cycle_start:]] + [paths[successor]])
+                    elif not visited[successor]:
+                        visited[successor] = in_stack[successor] = 1
+                        trail.append(successor)
+                        positions.append(0)
+                else:
+                    in_stack[node] = 0
+                    trail.pop()
+                    positions.pop()
+        
+        return cycles
+    
+    def _build_reference_graph(self) -> Tuple[List[str], List[List[int]]]:
+        """Build the resolved reference graph with integer node ids.
+        
+        Returns the path of every node (indexed by id) and, per node, the ids
+        of the nodes it references.
+        """
+        node_ids: Dict[str, int] = {}
+        paths: List[str] = []
+        adjacency: List[List[int]] = []
+        
+        def node_id(path: str) -> int:
+            node = node_ids.get(path)
+            if node is None:
+                node = node_ids[path] = len(paths)
+                paths.append(path)
+                adjacency.append([])
+            return node
         
         for element_info in self.element_index.get_all_elements():
-            if element_info.path not in visited:
-                dfs(element_info.path, [])
+            refs = self._reference_cache.get(element_info.path)
+            if not refs:
+                continue
+            source = node_id(element_info.path)
+            for ref_info in refs:
+                if ref_info.is_resolved:
+                    adjacency[source].append(node_id(ref_info.target_path))
         
-        return cycles
+        return paths, adjacency
+    
+    def find_reference_sccs(self) -> List[List[str]]:
+        """Find groups of elements that reference each other in a cycle.
+        
+        Uses an iterative Tarjan strongly connected components pass, so it is
+        linear in the size of the reference graph. Each component with more
+        than one element, or a single self-referencing element, is returned
+        once with its paths in depth-first order.
+        """
+        paths, adjacency = self._build_reference_graph()
+        count = len(paths)
+        index = [-1] * count
+        lowlink = [0] * count
+        on_stack = bytearray(count)
+        stack: List[int] = []
+        sccs: List[List[str]] = []
+        counter = 0
+        
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # Explicit DFS stack of (node, next edge position)
+            work = [(root, 0)]
+            
+            while work:
+                node, position = work[-1]
+                edges = adjacency[node]
+                if position < len(edges):
+                    work[-1] = (node, position + 1)
+                    successor = edges[position]
+                    if index[successor] == -1:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = 1
+                        work.append((successor, 0))
+                    elif on_stack[successor] and index[successor] < lowlink[node]:
+                        lowlink[node] = index[successor]
+                    continue
+                
+                # All edges done: propagate lowlink and pop a finished component
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in adjacency[node]:
+                        component.reverse()
+                        sccs.append([paths[member] for member in component])
+        
+        return sccs
     
     def update_reference(self, source_path: str, new_target: str) -> bool:
         """Update a reference to point to a new target."""
@@ -242,6 +376,7 @@ class ReferenceManager:
         # Update the reference value
         ref_elem = source_element.element
         XMLUtils.set_element_text(ref_elem, new_target)
+        self.element_index.refresh_reference(source_path)
         
         # Re-analyze this reference
         self._process_reference(source_element)
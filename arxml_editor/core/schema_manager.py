@@ -6,16 +6,44 @@ Handles schema version detection, validation, and cross-version compatibility.
 
 import os
 import re
+import hashlib
+import pickle
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass
 import xml.etree.ElementTree as ET
+import xmlschema
 from xmlschema import XMLSchema, XMLSchemaValidationError
 
+try:
+    # libxml2-backed parsing and XSD validation, used when available
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
 from ..utils.naming_conventions import ARXMLNamingConventions
 
 
+# Number of XSD validation results kept per SchemaManager
+_VALIDATION_CACHE_SIZE = 128
+
+# Number of leading characters/bytes inspected when sniffing the root element
+_SNIFF_SIZE = 4096
+
+# Root start tag after an optional BOM, XML declaration, comments and DOCTYPE
+_ROOT_TAG_PATTERN = (r'\s*(?:(?:<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^>]*>)\s*)*'
+                     r'<([^\s/>!?]+)([^>]*)>')
+_XMLNS_PATTERN = r'\sxmlns(?::([^\s=]+))?\s*=\s*(["\'])(.*?)\2'
+
+_ROOT_TAG_RE = re.compile('\ufeff?' + _ROOT_TAG_PATTERN, re.DOTALL)
+_XMLNS_RE = re.compile(_XMLNS_PATTERN, re.DOTALL)
+_ROOT_TAG_RE_BYTES = re.compile(b'(?:\xef\xbb\xbf)?' + _ROOT_TAG_PATTERN.encode("ascii"), re.DOTALL)
+_XMLNS_RE_BYTES = re.compile(_XMLNS_PATTERN.encode("ascii"), re.DOTALL)
+
+
 class AUTOSARRelease(Enum):
     """Supported AUTOSAR releases."""
     R20_11 = "R20-11"
@@ -24,6 +52,24 @@ class AUTOSARRelease(Enum):
     R24_11 = "R24-11"
 
 
+# Serialization rules that apply across releases
+_BASE_SERIALIZATION_RULES = {
+    "tag_naming": "UPPERCASE-HYPHENATED",
+    "attribute_naming": "camelCase",
+    "indentation": "2 spaces",
+    "root_element": "AUTOSAR",
+    "file_extension": ".arxml"
+}
+
+# Release-specific schema namespace versions (anything else is "4.0")
+_NS_VERSION_BY_RELEASE = {
+    AUTOSARRelease.R24_11: "4.4",
+    AUTOSARRelease.R22_11: "4.2",
+    AUTOSARRelease.R21_11: "4.1",
+    AUTOSARRelease.R20_11: "4.0"
+}
+
+
 @dataclass
 class SchemaInfo:
     """Information about an ARXML schema."""
@@ -32,15 +78,18 @@ class SchemaInfo:
     schema_path: Optional[Path]
     xsd_validator: Optional[XMLSchema]
     serialization_rules: Dict[str, str]
+    lxml_schema: Optional[Any] = None  # Compiled lazily; False if lxml could not compile it
 
 
 class SchemaManager:
     """Manages AUTOSAR schema versions and validation."""
     
-    def __init__(self, schema_dir: Optional[Path] = None):
+    def __init__(self, schema_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         self.schema_dir = schema_dir or Path(__file__).parent / "schemas"
+        self.cache_dir = cache_dir or self._default_cache_dir()
         self.schemas: Dict[AUTOSARRelease, SchemaInfo] = {}
         self.naming_conventions = ARXMLNamingConventions()
+        self._validation_cache: "OrderedDict[Tuple[AUTOSARRelease, bytes], List[str]]" = OrderedDict()
         self._load_schemas()
     
     def _load_schemas(self) -> None:
@@ -70,7 +119,7 @@ class SchemaManager:
             
             if schema_path.exists():
                 try:
-                    xsd_validator = XMLSchema(str(schema_path))
+                    xsd_validator = self._load_xsd_validator(schema_path)
                 except Exception as e:
                     print(f"Warning: Could not load schema for {release.value}: {e}")
             
@@ -81,52 +130,144 @@ class SchemaManager:
                 xsd_validator=xsd_validator,
                 serialization_rules=self._get_serialization_rules(release)
             )
+        
+        # Reverse lookups used by schema detection
+        self._ns_to_release: Dict[str, AUTOSARRelease] = {
+            info.namespace: release for release, info in self.schemas.items()
+        }
+        self._version_to_release: Dict[str, AUTOSARRelease] = {
+            release.value.replace("-", "."): release for release in self.schemas
+        }
+    
+    @staticmethod
+    def _default_cache_dir() -> Path:
+        """Get the per-user directory for compiled schema caches."""
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+        return (Path(cache_home) if cache_home else Path.home() / ".cache") / "arxml_editor"
+    
+    def _load_xsd_validator(self, schema_path: Path) -> XMLSchema:
+        """Load a compiled XSD, reusing a pickled copy from an earlier run when possible.
+        
+        Compiling the AUTOSAR XSDs takes seconds, so compiled validators are
+        cached on disk keyed by schema path, mtime, size and xmlschema version.
+        """
+        stat = schema_path.stat()
+        key_source = f"{schema_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{xmlschema.__version__}"
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        cache_file = self.cache_dir / f"{key}.pkl"
+        
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable schema cache {cache_file}: {e}")
+        
+        validator = XMLSchema(str(schema_path))
+        
+        # Write to a temporary file first so concurrent runs never see a partial pickle
+        temp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=str(self.cache_dir), delete=False) as tf:
+                temp_name = tf.name
+                pickle.dump(validator, tf, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, cache_file)
+        except Exception as e:
+            print(f"Warning: Could not cache compiled schema {schema_path.name}: {e}")
+            # Don't leave a partial pickle behind in the cache directory
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+        
+        return validator
     
     def _get_serialization_rules(self, release: AUTOSARRelease) -> Dict[str, str]:
         """Get serialization rules for a specific AUTOSAR release."""
-        # Base rules that apply across releases
-        rules = {
-            "tag_naming": "UPPERCASE-HYPHENATED",
-            "attribute_naming": "camelCase", 
-            "indentation": "2 spaces",
-            "root_element": "AUTOSAR",
-            "file_extension": ".arxml"
-        }
-        
-        # Release-specific customizations
-        if release in [AUTOSARRelease.R24_11]:
-            rules["namespace_version"] = "4.4"
-        elif release in [AUTOSARRelease.R22_11]:
-            rules["namespace_version"] = "4.2"
-        elif release in [AUTOSARRelease.R21_11]:
-            rules["namespace_version"] = "4.1"
-        else:
-            rules["namespace_version"] = "4.0"
-            
+        rules = dict(_BASE_SERIALIZATION_RULES)
+        rules["namespace_version"] = _NS_VERSION_BY_RELEASE.get(release, "4.0")
         return rules
     
-    def detect_schema_version(self, arxml_content: str) -> Optional[AUTOSARRelease]:
+    def detect_schema_version(self, arxml_content: Union[str, bytes]) -> Optional[AUTOSARRelease]:
         """Detect AUTOSAR release from ARXML content."""
-        try:
-            root = ET.fromstring(arxml_content)
-            
-            # Check namespace
-            namespace = root.tag.split('}')[0].lstrip('{') if '}' in root.tag else ""
-            
-            for release, schema_info in self.schemas.items():
-                if schema_info.namespace in namespace:
+        # The root namespace is almost always declared in the first few KB
+        release = self._sniff_schema_version(arxml_content[:_SNIFF_SIZE])
+        if release is not None:
+            return release
+        
+        if LET is not None:
+            if isinstance(arxml_content, str):
+                arxml_content = arxml_content.encode("utf-8")
+            try:
+                root = LET.fromstring(arxml_content)
+            except LET.XMLSyntaxError:
+                return None
+        else:
+            try:
+                root = ET.fromstring(arxml_content)
+            except ET.ParseError:
+                return None
+        
+        return self.detect_schema_version_from_root(root)
+    
+    def _sniff_schema_version(self, head: Union[str, bytes]) -> Optional[AUTOSARRelease]:
+        """Detect AUTOSAR release from the root start tag without parsing the document.
+        
+        Returns None when the root namespace cannot be read from ``head`` or does
+        not identify a release; callers then fall back to a full parse.
+        """
+        if isinstance(head, bytes):
+            match = _ROOT_TAG_RE_BYTES.match(head)
+            xmlns_re = _XMLNS_RE_BYTES
+            colon, empty = b":", b""
+        else:
+            match = _ROOT_TAG_RE.match(head)
+            xmlns_re = _XMLNS_RE
+            colon, empty = ":", ""
+        if match is None:
+            return None
+        
+        tag, attributes = match.groups()
+        prefix = tag.split(colon, 1)[0] if colon in tag else empty
+        for xmlns_match in xmlns_re.finditer(attributes):
+            if (xmlns_match.group(1) or empty) == prefix:
+                namespace = xmlns_match.group(3)
+                if isinstance(namespace, bytes):
+                    namespace = namespace.decode("utf-8", "replace")
+                return self._release_for_namespace(namespace) if namespace else None
+        
+        return None
+    
+    def _release_for_namespace(self, namespace: str) -> Optional[AUTOSARRelease]:
+        """Get the release whose schema namespace matches the given namespace."""
+        release = self._ns_to_release.get(namespace)
+        if release is not None:
+            return release
+        
+        # Namespaces that merely contain a known one (rare)
+        for release, schema_info in self.schemas.items():
+            if schema_info.namespace in namespace:
+                return release
+        return None
+    
+    def detect_schema_version_from_root(self, root: ET.Element) -> Optional[AUTOSARRelease]:
+        """Detect AUTOSAR release from an already parsed root element."""
+        # Check namespace
+        namespace = root.tag.split('}')[0].lstrip('{') if '}' in root.tag else ""
+        
+        release = self._release_for_namespace(namespace)
+        if release is not None:
+            return release
+        
+        # Fallback: check xsi:schemaLocation
+        schema_location = root.get("{http://www.w3.org/2001/XMLSchema-instance}schemaLocation")
+        if schema_location:
+            for version, release in self._version_to_release.items():
+                if version in schema_location:
                     return release
-            
-            # Fallback: check xsi:schemaLocation
-            schema_location = root.get("{http://www.w3.org/2001/XMLSchema-instance}schemaLocation")
-            if schema_location:
-                for release, schema_info in self.schemas.items():
-                    if release.value.replace("-", ".") in schema_location:
-                        return release
-                        
-        except ET.ParseError:
-            pass
-            
+        
         return None
     
     def get_schema_validator(self, release: AUTOSARRelease) -> Optional[XMLSchema]:
@@ -136,12 +277,72 @@ class SchemaManager:
     
     def validate_xsd(self, arxml_content: str, release: AUTOSARRelease) -> List[str]:
         """Validate ARXML content against XSD schema."""
+        # Identical content validates identically; skip the schema walk on a hit
+        data = arxml_content.encode("utf-8") if isinstance(arxml_content, str) else arxml_content
+        key = (release, hashlib.blake2b(data, digest_size=16).digest())
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            self._validation_cache.move_to_end(key)
+            return list(cached)
+        
+        lxml_schema = self._get_lxml_schema(release)
+        if lxml_schema is not None:
+            errors = self._validate_with_lxml(lxml_schema, content=data)
+        else:
+            errors = self._validate_xsd_source(arxml_content, release)
+        
+        self._validation_cache[key] = list(errors)
+        if len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+        return errors
+    
+    def validate_xsd_from_file(self, file_path: Union[str, Path], release: AUTOSARRelease) -> List[str]:
+        """Validate an ARXML file against XSD schema without loading it into a string."""
+        lxml_schema = self._get_lxml_schema(release)
+        if lxml_schema is not None:
+            return self._validate_with_lxml(lxml_schema, file_path=file_path)
+        return self._validate_xsd_source(str(file_path), release)
+    
+    def _get_lxml_schema(self, release: AUTOSARRelease) -> Optional[Any]:
+        """Get the lxml-compiled XSD for a release, compiling it on first use."""
+        schema_info = self.schemas.get(release)
+        if LET is None or not schema_info or not schema_info.schema_path:
+            return None
+        
+        if schema_info.lxml_schema is None:
+            try:
+                schema_info.lxml_schema = LET.XMLSchema(LET.parse(str(schema_info.schema_path)))
+            except (LET.XMLSchemaParseError, LET.XMLSyntaxError) as e:
+                print(f"Warning: Could not compile schema for {release.value} with lxml: {e}")
+                schema_info.lxml_schema = False  # Don't retry; use xmlschema instead
+        
+        return schema_info.lxml_schema or None
+    
+    def _validate_with_lxml(self, lxml_schema: Any, content: Optional[Union[str, bytes]] = None,
+                            file_path: Optional[Union[str, Path]] = None) -> List[str]:
+        """Validate XML text or a file with an lxml XMLSchema."""
+        try:
+            if file_path is not None:
+                document = LET.parse(str(file_path))
+            else:
+                if isinstance(content, str):
+                    content = content.encode("utf-8")
+                document = LET.fromstring(content)
+            
+            if lxml_schema.validate(document):
+                return []
+            return [f"XSD Validation Error: {lxml_schema.error_log[0].message}"]
+        except Exception as e:
+            return [f"Schema validation failed: {str(e)}"]
+    
+    def _validate_xsd_source(self, source: str, release: AUTOSARRelease) -> List[str]:
+        """Validate XML text or a file path against the XSD schema of a release."""
         validator = self.get_schema_validator(release)
         if not validator:
             return [f"No XSD validator available for {release.value}"]
         
         try:
-            validator.validate(arxml_content)
+            validator.validate(source)
             return []
         except XMLSchemaValidationError as e:
             return [f"XSD Validation Error: {e.message}"]
@@ -4,24 +4,40 @@ Main entry point for ARXML Editor application.
 Launches the PySide6 GUI application with proper error handling and logging.
 """
 
+import argparse
 import sys
 import logging
 import os
 from pathlib import Path
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon
-
-try:
-    # Preferred: when package is imported or run as a module
-    from arxml_editor.ui.main_window import MainWindow
-    from arxml_editor.core.arxml_model import ARXMLModel
-except ImportError:
-    # Fallback: allow running the file directly (python arxml_editor/main.py)
-    # by using script-local imports which work when executed from the repo root.
-    # Note: catching ImportError only avoids masking other unexpected exceptions.
-    from ui.main_window import MainWindow
-    from core.arxml_model import ARXMLModel
+
+# Qt and the main window are imported in main() once the command line has been
+# parsed, so --help and plain imports of this module stay fast.
+
+# Qt settings applied at startup unless already set in the environment
+_COMPAT_ENVIRONMENT = {
+    'QT_AUTO_SCREEN_SCALE_FACTOR': '1',
+    'QT_SCALE_FACTOR': '1',
+    'QT_X11_NO_MITSHM': '1',
+}
+
+
+def parse_arguments(argv=None):
+    """Parse command line arguments.
+    
+    Unknown options are left for QApplication (e.g. -style), positional
+    arguments are collected so they can be reported as ignored.
+    """
+    parser = argparse.ArgumentParser(
+        prog="arxml-editor",
+        description="ARXML Editor - Professional AUTOSAR XML Editor"
+    )
+    parser.add_argument(
+        "-o", "--open", metavar="FILE", nargs="?", const="",
+        help="ARXML file to open on startup"
+    )
+    parser.add_argument("positional", nargs="*", help=argparse.SUPPRESS)
+    args, _ = parser.parse_known_args(argv)
+    return args
 
 
 def setup_logging():
@@ -38,23 +54,28 @@ def setup_logging():
 
 def setup_display_environment():
     """Set up display environment to handle Wayland issues."""
-    # Always use X11 backend for maximum compatibility and proper window decorations
-    os.environ['QT_QPA_PLATFORM'] = 'xcb'
+    environ = os.environ
     logger = logging.getLogger(__name__)
     
-    if 'WAYLAND_DISPLAY' in os.environ:
+    if 'WAYLAND_DISPLAY' in environ:
         logger.info("Wayland detected, using X11 backend for compatibility")
     else:
         logger.info("Using X11 backend for maximum compatibility")
     
-    # Set additional environment variables for better compatibility
-    os.environ.setdefault('QT_AUTO_SCREEN_SCALE_FACTOR', '1')
-    os.environ.setdefault('QT_SCALE_FACTOR', '1')
-    os.environ.setdefault('QT_X11_NO_MITSHM', '1')
+    # Set additional environment variables for better compatibility, keeping
+    # any the user already set
+    settings = {key: value for key, value in _COMPAT_ENVIRONMENT.items() if key not in environ}
+    
+    # Always use X11 backend for maximum compatibility and proper window decorations
+    settings['QT_QPA_PLATFORM'] = 'xcb'
+    environ.update(settings)
 
 
 def handle_window_state(main_window):
     """Handle window state and positioning for multi-monitor setups."""
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QTimer
+    
     try:
         # Get available screens
         screens = QApplication.screens()
@@ -87,6 +108,21 @@ def handle_window_state(main_window):
 
 def main():
     """Main application entry point."""
+    # Handle --help before anything heavy is imported
+    args = parse_arguments(sys.argv[1:])
+    
+    from PySide6.QtWidgets import QApplication, QMessageBox
+    from PySide6.QtCore import Qt
+    
+    try:
+        # Preferred: when package is imported or run as a module
+        from arxml_editor.ui.main_window import MainWindow
+    except ImportError:
+        # Fallback: allow running the file directly (python arxml_editor/main.py)
+        # by using script-local imports which work when executed from the repo root.
+        # Note: catching ImportError only avoids masking other unexpected exceptions.
+        from ui.main_window import MainWindow
+    
     # Set up logging
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -123,16 +159,9 @@ def main():
         
         # Handle command line arguments.
         # Require explicit --open <file.arxml> or -o <file.arxml> to auto-open files.
-        if '--open' in sys.argv or '-o' in sys.argv:
-            try:
-                flag = '--open' if '--open' in sys.argv else '-o'
-                idx = sys.argv.index(flag)
-                file_arg = sys.argv[idx + 1] if len(sys.argv) > idx + 1 else None
-            except Exception:
-                file_arg = None
-
-            if file_arg:
-                file_path = Path(file_arg)
+        if args.open is not None:
+            if args.open:
+                file_path = Path(args.open)
                 if file_path.exists() and file_path.suffix.lower() == '.arxml':
                     main_window._load_file(file_path)
                 else:
@@ -143,8 +172,8 @@ def main():
                     )
             else:
                 logger.warning("--open flag provided but no file argument found; nothing opened.")
-        elif len(sys.argv) > 1:
-            ignored = sys.argv[1:]
+        elif args.positional:
+            ignored = args.positional
             logger.info("Ignoring positional arguments on startup (use --open <file.arxml> to open files): %s", ignored)
             print(f"Note: positional arguments were ignored. To auto-open a file use: --open <file.arxml>)")
         
@@ -1,7 +1,7 @@
 """Serialization modules for ARXML processing."""
 
-from .arxml_serializer import ARXMLSerializer
+from .arxml_serializer import ARXMLSerializer, get_serializer
 from .naming_converter import NamingConverter
 from .xml_formatter import XMLFormatter
 
-__all__ = ["ARXMLSerializer", "NamingConverter", "XMLFormatter"]
\ No newline at end of file
+__all__ = ["ARXMLSerializer", "get_serializer", "NamingConverter", "XMLFormatter"]
\ No newline at end of file
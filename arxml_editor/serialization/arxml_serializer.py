@@ -4,14 +4,19 @@ ARXML serialization with proper naming conventions and deterministic output.
 Implements AUTOSAR serialization rules for consistent XML output.
 """
 
+import io
+import sys
 import xml.etree.ElementTree as ET
+from collections import deque
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 from .naming_converter import NamingConverter
+from .xml_names import NS_PREFIXES, local_name
 from .xml_formatter import XMLFormatter
+from .element_order import ELEMENT_ORDER, ATTR_ORDER
 from ..core.schema_manager import AUTOSARRelease
 from ..utils.naming_conventions import ARXMLNamingConventions
 
@@ -23,9 +28,13 @@ class SerializationMode(Enum):
     MINIMAL = "minimal"  # Minimal whitespace
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SerializationOptions:
-    """Options for ARXML serialization."""
+    """Options for ARXML serialization (immutable; use dataclasses.replace to derive)."""
     mode: SerializationMode = SerializationMode.DETERMINISTIC
     indent_size: int = 2
     line_ending: str = "\n"
@@ -37,14 +46,42 @@ class SerializationOptions:
     canonical_naming: bool = True
 
 
+_DEFAULT_OPTIONS = SerializationOptions()
+
+
+# Namespace and schemaLocation written for each release
+_NAMESPACE_BY_RELEASE = {
+    AUTOSARRelease.R20_11: "http://autosar.org/schema/r4.0",
+    AUTOSARRelease.R21_11: "http://autosar.org/schema/r4.1",
+    AUTOSARRelease.R22_11: "http://autosar.org/schema/r4.2",
+    AUTOSARRelease.R24_11: "http://autosar.org/schema/r4.4"
+}
+
+_SCHEMA_LOCATION_BY_RELEASE = {
+    AUTOSARRelease.R20_11: "http://autosar.org/schema/r4.0 AUTOSAR_4-0-0.xsd",
+    AUTOSARRelease.R21_11: "http://autosar.org/schema/r4.1 AUTOSAR_4-1-0.xsd",
+    AUTOSARRelease.R22_11: "http://autosar.org/schema/r4.2 AUTOSAR_4-2-0.xsd",
+    AUTOSARRelease.R24_11: "http://autosar.org/schema/r4.4 AUTOSAR_4-4-0.xsd"
+}
+
+# Helpers shared by all serializers; they hold no per-document state
+_NAMING_CONVERTER = NamingConverter()
+_XML_FORMATTER = XMLFormatter()
+_NAMING_CONVENTIONS = ARXMLNamingConventions()
+
+
 class ARXMLSerializer:
-    """Serializes ARXML elements with proper naming conventions."""
+    """Serializes ARXML elements with proper naming conventions.
+    
+    All serializers share one NamingConverter, so custom mappings added
+    through ``naming_converter`` apply process-wide.
+    """
     
     def __init__(self, schema_release: AUTOSARRelease = AUTOSARRelease.R22_11):
         self.schema_release = schema_release
-        self.naming_converter = NamingConverter()
-        self.xml_formatter = XMLFormatter()
-        self.naming_conventions = ARXMLNamingConventions()
+        self.naming_converter = _NAMING_CONVERTER
+        self.xml_formatter = _XML_FORMATTER
+        self.naming_conventions = _NAMING_CONVENTIONS
         
         # Get serialization rules for this release
         self.serialization_rules = self._get_serialization_rules()
@@ -64,39 +101,22 @@ class ARXMLSerializer:
     
     def _get_namespace_for_release(self) -> str:
         """Get namespace for current release."""
-        namespaces = {
-            AUTOSARRelease.R20_11: "http://autosar.org/schema/r4.0",
-            AUTOSARRelease.R21_11: "http://autosar.org/schema/r4.1",
-            AUTOSARRelease.R22_11: "http://autosar.org/schema/r4.2",
-            AUTOSARRelease.R24_11: "http://autosar.org/schema/r4.4"
-        }
-        return namespaces.get(self.schema_release, namespaces[AUTOSARRelease.R22_11])
+        return _NAMESPACE_BY_RELEASE.get(self.schema_release, _NAMESPACE_BY_RELEASE[AUTOSARRelease.R22_11])
     
     def _get_schema_location_for_release(self) -> str:
         """Get schema location for current release."""
-        schema_locations = {
-            AUTOSARRelease.R20_11: "http://autosar.org/schema/r4.0 AUTOSAR_4-0-0.xsd",
-            AUTOSARRelease.R21_11: "http://autosar.org/schema/r4.1 AUTOSAR_4-1-0.xsd",
-            AUTOSARRelease.R22_11: "http://autosar.org/schema/r4.2 AUTOSAR_4-2-0.xsd",
-            AUTOSARRelease.R24_11: "http://autosar.org/schema/r4.4 AUTOSAR_4-4-0.xsd"
-        }
-        return schema_locations.get(self.schema_release, schema_locations[AUTOSARRelease.R22_11])
+        return _SCHEMA_LOCATION_BY_RELEASE.get(self.schema_release,
+                                               _SCHEMA_LOCATION_BY_RELEASE[AUTOSARRelease.R22_11])
     
     def serialize_element(self, element: ET.Element, options: Optional[SerializationOptions] = None) -> str:
         """Serialize a single element to ARXML string."""
         if options is None:
-            options = SerializationOptions()
-        
-        # Apply naming conventions
-        if options.canonical_naming:
-            element = self._apply_naming_conventions(element)
+            options = _DEFAULT_OPTIONS
         
-        # Sort elements and attributes if requested
-        if options.sort_elements:
-            element = self._sort_element_children(element)
-        
-        if options.sort_attributes:
-            element = self._sort_element_attributes(element)
+        # Apply naming conventions and sort elements/attributes in one pass
+        if options.canonical_naming or options.sort_elements or options.sort_attributes:
+            element = self._transform_inplace(element, options.canonical_naming,
+                                              options.sort_elements, options.sort_attributes)
         
         # Format XML
         if options.mode == SerializationMode.DETERMINISTIC:
@@ -109,135 +129,103 @@ class ARXMLSerializer:
     def serialize_document(self, root_element: ET.Element, options: Optional[SerializationOptions] = None) -> str:
         """Serialize a complete ARXML document."""
         if options is None:
-            options = SerializationOptions()
+            options = _DEFAULT_OPTIONS
         
-        # Create document structure
-        lines = []
+        # Write the document structure straight into one buffer
+        buffer = io.StringIO()
+        write = buffer.write
+        line_ending = options.line_ending
         
         # XML declaration
         if options.include_xml_declaration:
-            declaration = self.naming_conventions.format_xml_declaration(options.encoding)
-            lines.append(declaration)
+            write(self.naming_conventions.format_xml_declaration(options.encoding))
+            write(line_ending)
         
         # Root element with namespace
         namespace = self.serialization_rules["namespace"]
         schema_location = self.serialization_rules["schema_location"]
-        root_start = self.naming_conventions.format_root_element(namespace, schema_location)
-        lines.append(root_start)
+        write(self.naming_conventions.format_root_element(namespace, schema_location))
+        write(line_ending)
         
         # Serialize content
-        content = self.serialize_element(root_element, options)
-        lines.append(content)
+        write(self.serialize_element(root_element, options))
+        write(line_ending)
         
         # Close root element
-        lines.append("</AUTOSAR>")
+        write("</AUTOSAR>")
         
-        return options.line_ending.join(lines)
+        return buffer.getvalue()
     
-    def _apply_naming_conventions(self, element: ET.Element) -> ET.Element:
-        """Apply AUTOSAR naming conventions to element."""
-        # Convert element tag to UPPERCASE-HYPHENATED
-        if '}' in element.tag:
-            namespace, local_name = element.tag.split('}', 1)
-            converted_name = self.naming_converter.to_uppercase_hyphenated(local_name)
-            element.tag = f"{namespace}}}{converted_name}"
-        else:
-            element.tag = self.naming_converter.to_uppercase_hyphenated(element.tag)
-        
-        # Convert attributes to camelCase
-        new_attrib = {}
-        for attr_name, attr_value in element.attrib.items():
-            if not attr_name.startswith('xmlns') and not attr_name.startswith('xsi:'):
-                converted_name = self.naming_converter.to_camel_case(attr_name)
-                new_attrib[converted_name] = attr_value
-            else:
-                new_attrib[attr_name] = attr_value
-        element.attrib = new_attrib
-        
-        # Recursively apply to children
-        for child in element:
-            self._apply_naming_conventions(child)
-        
-        return element
-    
-    def _sort_element_children(self, element: ET.Element) -> ET.Element:
-        """Sort element children for deterministic output."""
-        if not element:
-            return element
+    def _transform_inplace(self, element: ET.Element, canonical_naming: bool = True,
+                           sort_elements: bool = True, sort_attributes: bool = True) -> ET.Element:
+        """Apply naming conventions and sorting to the tree in a single walk.
         
-        # Define element ordering
-        element_order = {
-            "SHORT-NAME": 0,
-            "LONG-NAME": 1,
-            "DESC": 2,
-            "L-1": 3, "L-2": 4, "L-3": 5, "L-4": 6, "L-5": 7,
-            "L-6": 8, "L-7": 9, "L-8": 10, "L-9": 11, "L-10": 12,
-            "ELEMENTS": 20,
-            "ELEMENT": 21,
-            "CONTAINERS": 30,
-            "CONTAINER": 31,
-            "PARAMETERS": 40,
-            "PARAMETER": 41,
-            "REFERENCES": 50,
-            "REFERENCE": 51,
-            "REF": 60,
-            "DEST": 61,
-            "DEFINITION-REF": 70,
-            "VALUE-REF": 71,
-            "VALUE": 80,
-            "ECUC-VALUE-COLLECTION": 90,
-            "ECUC-PARAM-CONF-CONTAINER-VALUE": 91,
-            "ECUC-TEXTUAL-PARAM-VALUE": 92,
-            "ECUC-NUMERICAL-PARAM-VALUE": 93,
-            "ECUC-BOOLEAN-PARAM-VALUE": 94,
-            "ECUC-ENUMERATION-PARAM-VALUE": 95
-        }
-        
-        # Sort children
-        children = list(element)
-        children.sort(key=lambda child: self._get_element_order(child, element_order))
+        Tags become UPPERCASE-HYPHENATED and attribute names (other than
+        namespace declarations) camelCase. Each element's children are then
+        stably sorted by the canonical element order, using the renamed
+        tags. Only the top-level element has its attributes reordered. The
+        result is the same as renaming the whole tree first and sorting it
+        afterwards.
+        """
+        canonical_tag = self._canonical_tag
+        canonical_attrib = self._canonical_attrib
+        order_key = lambda child: ELEMENT_ORDER.get(local_name(child.tag), 999)
         
-        # Remove all children
-        for child in children:
-            element.remove(child)
+        if canonical_naming:
+            element.tag = canonical_tag(element.tag)
+            element.attrib = canonical_attrib(element.attrib)
         
-        # Add back in sorted order
-        for child in children:
-            element.append(child)
+        # Only elements with children are pushed; leaves (most of an ARXML tree,
+        # e.g. SHORT-NAME or VALUE) are fully handled while visiting their parent.
+        # Note that `not element` is also true for a leaf Element, so test len().
+        stack = deque([element] if len(element) else ())
+        while stack:
+            current = stack.pop()
+            
+            if canonical_naming:
+                # Children are renamed before sorting so the order keys see final tags
+                for child in current:
+                    child.tag = canonical_tag(child.tag)
+                    if child.attrib:
+                        child.attrib = canonical_attrib(child.attrib)
+            
+            if sort_elements and len(current) > 1:
+                current[:] = sorted(current, key=order_key)
+            
+            stack.extend(child for child in current if len(child))
         
-        # Recursively sort children
-        for child in element:
-            self._sort_element_children(child)
+        # Only the top-level element gets its attributes reordered
+        if sort_attributes:
+            self._sort_element_attributes(element)
         
         return element
     
-    def _get_element_order(self, element: ET.Element, order_map: Dict[str, int]) -> int:
-        """Get sort order for element."""
-        tag_name = element.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}', 1)[1]
-        
-        return order_map.get(tag_name, 999)
+    def _canonical_tag(self, tag: str) -> str:
+        """Convert tag to UPPERCASE-HYPHENATED, keeping any namespace."""
+        name = local_name(tag)
+        # Interned so that all nodes with the same tag share one string object
+        return sys.intern(tag[:len(tag) - len(name)] + self.naming_converter.to_uppercase_hyphenated(name))
     
-    def _sort_element_attributes(self, element: ET.Element) -> ET.Element:
+    def _canonical_attrib(self, attrib: Dict[str, str]) -> Dict[str, str]:
+        """Convert attribute names to camelCase, leaving namespace declarations alone."""
+        to_camel_case = self.naming_converter.to_camel_case
+        new_attrib = {}
+        for attr_name, attr_value in attrib.items():
+            if not attr_name.startswith(NS_PREFIXES):
+                new_attrib[sys.intern(to_camel_case(attr_name))] = attr_value
+            else:
+                new_attrib[attr_name] = attr_value
+        return new_attrib
+    
+    def _sort_element_attributes(self, element: ET.Element,
+                                 _order: Dict[str, int] = ATTR_ORDER) -> ET.Element:
         """Sort element attributes for deterministic output."""
         if not element.attrib:
             return element
         
-        # Define attribute ordering
-        attr_order = {
-            "xmlns": 0,
-            "xmlns:xsi": 1,
-            "xsi:schemaLocation": 2,
-            "DEST": 10,
-            "UUID": 11,
-            "S": 12,
-            "T": 13
-        }
-        
         # Sort attributes
         sorted_attrs = sorted(element.attrib.items(), 
-                            key=lambda item: attr_order.get(item[0], 999))
+                            key=lambda item: _order.get(item[0], 999))
         
         # Clear and re-add in sorted order
         element.attrib.clear()
@@ -248,6 +236,8 @@ class ARXMLSerializer:
     
     def _serialize_deterministic(self, element: ET.Element, options: SerializationOptions) -> str:
         """Serialize with deterministic formatting."""
+        # serialize_element has already sorted the tree; don't sort it again
+        options = replace(options, sort_elements=False, sort_attributes=False)
         return self.xml_formatter.format_deterministic(element, options)
     
     def _serialize_preserve_formatting(self, element: ET.Element, options: SerializationOptions) -> str:
@@ -263,39 +253,47 @@ class ARXMLSerializer:
         errors = []
         
         try:
-            # Parse XML to check well-formedness
-            ET.fromstring(xml_content)
+            # Parse XML once to check well-formedness and get the root
+            root = ET.fromstring(xml_content)
         except ET.ParseError as e:
             errors.append(f"XML parsing error: {e}")
+            return errors
         
         # Check for proper namespace
-        try:
-            root = ET.fromstring(xml_content)
-            if root.tag != "AUTOSAR":
-                errors.append("Root element must be AUTOSAR")
-            
-            # Check namespace
-            if '}' in root.tag:
-                namespace = root.tag.split('}', 1)[0].lstrip('{')
-                expected_namespace = self.serialization_rules["namespace"]
-                if namespace != expected_namespace:
-                    errors.append(f"Namespace mismatch: expected {expected_namespace}, found {namespace}")
-        except ET.ParseError:
-            pass  # Already caught above
+        if root.tag != "AUTOSAR":
+            errors.append("Root element must be AUTOSAR")
+        
+        # Check namespace
+        if '}' in root.tag:
+            namespace = root.tag.split('}', 1)[0].lstrip('{')
+            expected_namespace = self.serialization_rules["namespace"]
+            if namespace != expected_namespace:
+                errors.append(f"Namespace mismatch: expected {expected_namespace}, found {namespace}")
         
         return errors
     
     def convert_to_release(self, element: ET.Element, target_release: AUTOSARRelease) -> ET.Element:
         """Convert element to different AUTOSAR release."""
-        # Create new serializer for target release
-        target_serializer = ARXMLSerializer(target_release)
+        # Reuse the shared serializer for the target release
+        target_serializer = get_serializer(target_release)
+        canonical_tag = target_serializer._canonical_tag
+        canonical_attrib = target_serializer._canonical_attrib
         
-        # Deep copy element
-        import copy
-        converted_element = copy.deepcopy(element)
+        # Build the converted copy in a single walk instead of deep-copying
+        # the tree and then renaming every node of the copy
+        converted_element = ET.Element(canonical_tag(element.tag), canonical_attrib(element.attrib))
+        converted_element.text = element.text
+        converted_element.tail = element.tail
         
-        # Apply target release naming conventions
-        converted_element = target_serializer._apply_naming_conventions(converted_element)
+        stack = deque([(element, converted_element)])
+        while stack:
+            source, target = stack.pop()
+            for child in source:
+                converted_child = ET.SubElement(target, canonical_tag(child.tag),
+                                                canonical_attrib(child.attrib))
+                converted_child.text = child.text
+                converted_child.tail = child.tail
+                stack.append((child, converted_child))
         
         return converted_element
     
@@ -306,4 +304,19 @@ class ARXMLSerializer:
     def set_schema_release(self, release: AUTOSARRelease):
         """Set schema release for serialization."""
         self.schema_release = release
-        self.serialization_rules = self._get_serialization_rules()
\ No newline at end of file
+        self.serialization_rules = self._get_serialization_rules()
+
+
+_SERIALIZER_POOL: Dict[AUTOSARRelease, ARXMLSerializer] = {}
+
+
+def get_serializer(release: AUTOSARRelease) -> ARXMLSerializer:
+    """Get the shared serializer for a release, creating it on first use.
+    
+    Pooled serializers are shared; use a dedicated ARXMLSerializer instead if
+    you need to call set_schema_release on it.
+    """
+    serializer = _SERIALIZER_POOL.get(release)
+    if serializer is None:
+        serializer = _SERIALIZER_POOL[release] = ARXMLSerializer(release)
+    return serializer
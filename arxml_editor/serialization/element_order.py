@@ -0,0 +1,45 @@
+"""
+Canonical element and attribute ordering for deterministic ARXML output.
+"""
+
+from typing import Dict
+
+
+# Canonical child element ordering used for deterministic output
+ELEMENT_ORDER: Dict[str, int] = {
+    "SHORT-NAME": 0,
+    "LONG-NAME": 1,
+    "DESC": 2,
+    "L-1": 3, "L-2": 4, "L-3": 5, "L-4": 6, "L-5": 7,
+    "L-6": 8, "L-7": 9, "L-8": 10, "L-9": 11, "L-10": 12,
+    "ELEMENTS": 20,
+    "ELEMENT": 21,
+    "CONTAINERS": 30,
+    "CONTAINER": 31,
+    "PARAMETERS": 40,
+    "PARAMETER": 41,
+    "REFERENCES": 50,
+    "REFERENCE": 51,
+    "REF": 60,
+    "DEST": 61,
+    "DEFINITION-REF": 70,
+    "VALUE-REF": 71,
+    "VALUE": 80,
+    "ECUC-VALUE-COLLECTION": 90,
+    "ECUC-PARAM-CONF-CONTAINER-VALUE": 91,
+    "ECUC-TEXTUAL-PARAM-VALUE": 92,
+    "ECUC-NUMERICAL-PARAM-VALUE": 93,
+    "ECUC-BOOLEAN-PARAM-VALUE": 94,
+    "ECUC-ENUMERATION-PARAM-VALUE": 95
+}
+
+# Canonical attribute ordering used for deterministic output
+ATTR_ORDER: Dict[str, int] = {
+    "xmlns": 0,
+    "xmlns:xsi": 1,
+    "xsi:schemaLocation": 2,
+    "DEST": 10,
+    "UUID": 11,
+    "S": 12,
+    "T": 13
+}
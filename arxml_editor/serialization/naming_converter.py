@@ -5,11 +5,66 @@ Converts between different naming conventions used in AUTOSAR.
 """
 
 import re
+import string
+from collections import Counter, deque
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+from .xml_names import NS_PREFIXES, local_name
+
+
+# Insert position before every uppercase letter except the first character
+_CAMEL_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+
+# Character classes for the naming-format checks (ASCII only, like the XSD names)
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE_HYPHENATED_CHARS = frozenset(string.ascii_uppercase + string.digits + '-')
+_CAMEL_CASE_CHARS = frozenset(string.ascii_letters + string.digits)
+
+
+def _is_uppercase_hyphenated_name(name: str) -> bool:
+    """Check for [A-Z][A-Z0-9]* segments joined by single hyphens."""
+    if not name or name[0] not in _UPPERCASE or not _UPPERCASE_HYPHENATED_CHARS.issuperset(name):
+        return False
+    if '-' in name:
+        # Every segment after a hyphen must start with a letter
+        for segment in name.split('-')[1:]:
+            if not segment or segment[0] not in _UPPERCASE:
+                return False
+    return True
+
+
+def _is_camel_case_name(name: str) -> bool:
+    """Check for a lowercase letter followed by ASCII letters and digits."""
+    return bool(name) and name[0] in _LOWERCASE and _CAMEL_CASE_CHARS.issuperset(name)
+
+
+@lru_cache(maxsize=4096)
+def _camel_to_uppercase_hyphenated(name: str) -> str:
+    """Convert camelCase to UPPERCASE-HYPHENATED, keeping names already in that format."""
+    if _is_uppercase_hyphenated_name(name):
+        return name
+    # Insert hyphen before uppercase letters (except the first one)
+    return _CAMEL_BOUNDARY.sub('-', name).upper()
+
+
+@lru_cache(maxsize=4096)
+def _uppercase_hyphenated_to_camel(name: str) -> str:
+    """Convert UPPERCASE-HYPHENATED to camelCase, keeping names already in that format."""
+    if _is_camel_case_name(name):
+        return name
+    parts = name.split('-')
+    return parts[0].lower() + ''.join(part.capitalize() for part in parts[1:])
+
 
 class NamingConverter:
-    """Converts between different naming conventions."""
+    """Converts between different naming conventions.
+    
+    The mapping-free string conversions are memoized at module level, since
+    documents reuse a small set of tag names over and over. The mappings
+    are looked up on every call, so changes to them apply immediately.
+    """
     
     def __init__(self):
         # Common AUTOSAR element name mappings
@@ -68,38 +123,26 @@ class NamingConverter:
         if not name:
             return name
         
-        # Check if already in correct format
-        if self._is_uppercase_hyphenated(name):
-            return name
-        
-        # Check direct mapping first
-        if name in self.element_mappings:
-            return self.element_mappings[name]
+        # Names already in the right format are kept; otherwise a direct
+        # mapping wins over the generic conversion
+        mapped = self.element_mappings.get(name)
+        if mapped is not None and not _is_uppercase_hyphenated_name(name):
+            return mapped
         
-        # Convert camelCase to UPPERCASE-HYPHENATED
-        # Insert hyphen before uppercase letters (except the first one)
-        result = re.sub(r'(?<!^)(?=[A-Z])', '-', name)
-        return result.upper()
+        return _camel_to_uppercase_hyphenated(name)
     
     def to_camel_case(self, name: str) -> str:
         """Convert UPPERCASE-HYPHENATED to camelCase."""
         if not name:
             return name
         
-        # Check if already in correct format
-        if self._is_camel_case(name):
-            return name
-        
-        # Check direct mapping first
-        if name in self.reverse_element_mappings:
-            return self.reverse_element_mappings[name]
-        
-        # Convert UPPERCASE-HYPHENATED to camelCase
-        parts = name.split('-')
-        if not parts:
-            return ""
+        # Names already in the right format are kept; otherwise a direct
+        # mapping wins over the generic conversion
+        mapped = self.reverse_element_mappings.get(name)
+        if mapped is not None and not _is_camel_case_name(name):
+            return mapped
         
-        return parts[0].lower() + ''.join(part.capitalize() for part in parts[1:])
+        return _uppercase_hyphenated_to_camel(name)
     
     def to_uppercase_hyphenated_attribute(self, name: str) -> str:
         """Convert camelCase attribute to UPPERCASE-HYPHENATED."""
@@ -131,8 +174,7 @@ class NamingConverter:
             return False
         
         # Pattern: starts with uppercase letter, contains only uppercase letters, numbers, and hyphens
-        pattern = r'^[A-Z][A-Z0-9]*(?:-[A-Z][A-Z0-9]*)*$'
-        return bool(re.match(pattern, name))
+        return _is_uppercase_hyphenated_name(name)
     
     def _is_camel_case(self, name: str) -> bool:
         """Check if name is in camelCase format."""
@@ -140,8 +182,7 @@ class NamingConverter:
             return False
         
         # Pattern: starts with lowercase letter, contains only letters and numbers
-        pattern = r'^[a-z][a-zA-Z0-9]*$'
-        return bool(re.match(pattern, name))
+        return _is_camel_case_name(name)
     
     def validate_element_name(self, name: str) -> Tuple[bool, str]:
         """Validate element name format."""
@@ -149,7 +190,7 @@ class NamingConverter:
             return False, "Element name cannot be empty"
         
         # Check for valid characters
-        if not re.match(r'^[A-Z][A-Z0-9]*(?:-[A-Z][A-Z0-9]*)*$', name):
+        if not _is_uppercase_hyphenated_name(name):
             return False, "Element name must be in UPPERCASE-HYPHENATED format"
         
         # Check for reserved names
@@ -165,11 +206,11 @@ class NamingConverter:
             return False, "Attribute name cannot be empty"
         
         # Namespace attributes are allowed
-        if name.startswith('xmlns') or name.startswith('xsi:'):
+        if name.startswith(NS_PREFIXES):
             return True, ""
         
         # Check for valid camelCase format
-        if not re.match(r'^[a-z][a-zA-Z0-9]*$', name):
+        if not _is_camel_case_name(name):
             return False, "Attribute name must be in camelCase format"
         
         # Check for reserved names
@@ -203,76 +244,67 @@ class NamingConverter:
     def convert_element_tree(self, element, to_uppercase: bool = True):
         """Convert entire element tree naming conventions."""
         if to_uppercase:
-            # Convert to UPPERCASE-HYPHENATED
-            element.tag = self.to_uppercase_hyphenated(element.tag)
-            
-            # Convert attributes
-            new_attrib = {}
-            for attr_name, attr_value in element.attrib.items():
-                if not attr_name.startswith('xmlns') and not attr_name.startswith('xsi:'):
-                    converted_name = self.to_uppercase_hyphenated_attribute(attr_name)
-                    new_attrib[converted_name] = attr_value
-                else:
-                    new_attrib[attr_name] = attr_value
-            element.attrib = new_attrib
+            convert_tag = self.to_uppercase_hyphenated
+            convert_attribute = self.to_uppercase_hyphenated_attribute
         else:
-            # Convert to camelCase
-            element.tag = self.to_camel_case(element.tag)
+            convert_tag = self.to_camel_case
+            convert_attribute = self.to_camel_case_attribute
+        
+        stack = deque([element])
+        while stack:
+            current = stack.pop()
+            current.tag = convert_tag(current.tag)
             
             # Convert attributes
             new_attrib = {}
-            for attr_name, attr_value in element.attrib.items():
-                if not attr_name.startswith('xmlns') and not attr_name.startswith('xsi:'):
-                    converted_name = self.to_camel_case_attribute(attr_name)
-                    new_attrib[converted_name] = attr_value
+            for attr_name, attr_value in current.attrib.items():
+                if not attr_name.startswith(NS_PREFIXES):
+                    new_attrib[convert_attribute(attr_name)] = attr_value
                 else:
                     new_attrib[attr_name] = attr_value
-            element.attrib = new_attrib
-        
-        # Recursively convert children
-        for child in element:
-            self.convert_element_tree(child, to_uppercase)
+            current.attrib = new_attrib
+            
+            stack.extend(current)
     
     def get_naming_statistics(self, element) -> Dict[str, int]:
         """Get statistics about naming conventions in element tree."""
-        stats = {
-            "total_elements": 0,
-            "uppercase_hyphenated": 0,
-            "camel_case": 0,
-            "other_format": 0,
-            "total_attributes": 0,
-            "camel_case_attributes": 0,
-            "other_attribute_format": 0
-        }
+        stats = Counter(dict.fromkeys((
+            "total_elements",
+            "uppercase_hyphenated",
+            "camel_case",
+            "other_format",
+            "total_attributes",
+            "camel_case_attributes",
+            "other_attribute_format"
+        ), 0))
+        is_uppercase_hyphenated = self._is_uppercase_hyphenated
+        is_camel_case = self._is_camel_case
         
-        def count_element(elem):
+        # element.iter() walks the tree in C; no explicit stack needed
+        for elem in element.iter():
             stats["total_elements"] += 1
             
             # Count element naming
-            tag_name = elem.tag
-            if '}' in tag_name:
-                tag_name = tag_name.split('}', 1)[1]
+            tag_name = local_name(elem.tag)
             
-            if self._is_uppercase_hyphenated(tag_name):
+            if is_uppercase_hyphenated(tag_name):
                 stats["uppercase_hyphenated"] += 1
-            elif self._is_camel_case(tag_name):
+            elif is_camel_case(tag_name):
                 stats["camel_case"] += 1
             else:
                 stats["other_format"] += 1
             
             # Count attributes
-            for attr_name in elem.attrib.keys():
-                stats["total_attributes"] += 1
-                
-                if not attr_name.startswith('xmlns') and not attr_name.startswith('xsi:'):
-                    if self._is_camel_case(attr_name):
+            attrib = elem.attrib
+            if not attrib:
+                continue
+            stats["total_attributes"] += len(attrib)
+            
+            for attr_name in attrib:
+                if not attr_name.startswith(NS_PREFIXES):
+                    if is_camel_case(attr_name):
                         stats["camel_case_attributes"] += 1
                     else:
                         stats["other_attribute_format"] += 1
-            
-            # Recursively count children
-            for child in elem:
-                count_element(child)
         
-        count_element(element)
-        return stats
\ No newline at end of file
+        return dict(stats)
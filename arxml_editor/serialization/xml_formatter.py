@@ -5,10 +5,14 @@ Provides deterministic, minimal, and preserve formatting options.
 """
 
 import xml.etree.ElementTree as ET
+from collections import deque
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .element_order import ELEMENT_ORDER, ATTR_ORDER
+from .xml_names import local_name
+
 
 class FormattingMode(Enum):
     """XML formatting modes."""
@@ -87,9 +91,7 @@ class XMLFormatter:
         indent = " " * (level * options.indent_size)
         
         # Start tag
-        tag_name = element.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}', 1)[1]
+        tag_name = local_name(element.tag)
         
         if element.attrib:
             # Element with attributes
@@ -161,84 +163,36 @@ class XMLFormatter:
         # In practice, you'd need to track and preserve original whitespace
         return ET.tostring(element, encoding=options.encoding).decode(options.encoding)
     
-    def _sort_elements(self, element: ET.Element) -> ET.Element:
-        """Sort child elements for deterministic output."""
-        if not element:
-            return element
-        
-        # Define element ordering
-        element_order = {
-            "SHORT-NAME": 0,
-            "LONG-NAME": 1,
-            "DESC": 2,
-            "L-1": 3, "L-2": 4, "L-3": 5, "L-4": 6, "L-5": 7,
-            "L-6": 8, "L-7": 9, "L-8": 10, "L-9": 11, "L-10": 12,
-            "ELEMENTS": 20,
-            "ELEMENT": 21,
-            "CONTAINERS": 30,
-            "CONTAINER": 31,
-            "PARAMETERS": 40,
-            "PARAMETER": 41,
-            "REFERENCES": 50,
-            "REFERENCE": 51,
-            "REF": 60,
-            "DEST": 61,
-            "DEFINITION-REF": 70,
-            "VALUE-REF": 71,
-            "VALUE": 80,
-            "ECUC-VALUE-COLLECTION": 90,
-            "ECUC-PARAM-CONF-CONTAINER-VALUE": 91,
-            "ECUC-TEXTUAL-PARAM-VALUE": 92,
-            "ECUC-NUMERICAL-PARAM-VALUE": 93,
-            "ECUC-BOOLEAN-PARAM-VALUE": 94,
-            "ECUC-ENUMERATION-PARAM-VALUE": 95
-        }
-        
-        # Sort children
-        children = list(element)
-        children.sort(key=lambda child: self._get_element_order(child, element_order))
-        
-        # Remove all children
-        for child in children:
-            element.remove(child)
-        
-        # Add back in sorted order
-        for child in children:
-            element.append(child)
-        
-        # Recursively sort children
-        for child in element:
-            self._sort_elements(child)
+    def _sort_elements(self, element: ET.Element, _order: Dict[str, int] = ELEMENT_ORDER) -> ET.Element:
+        """Sort child elements (recursively) for deterministic output."""
+        order_key = lambda child: self._get_element_order(child, _order)
+        
+        # Only elements with children need a visit; len() rather than `not`,
+        # which is also true for a leaf Element
+        stack = deque([element] if len(element) else ())
+        while stack:
+            current = stack.pop()
+            
+            # Sort children in place with a single slice assignment
+            if len(current) > 1:
+                current[:] = sorted(current, key=order_key)
+            
+            stack.extend(child for child in current if len(child))
         
         return element
     
     def _get_element_order(self, element: ET.Element, order_map: Dict[str, int]) -> int:
         """Get sort order for element."""
-        tag_name = element.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}', 1)[1]
-        
-        return order_map.get(tag_name, 999)
+        return order_map.get(local_name(element.tag), 999)
     
-    def _sort_attributes(self, element: ET.Element) -> ET.Element:
+    def _sort_attributes(self, element: ET.Element, _order: Dict[str, int] = ATTR_ORDER) -> ET.Element:
         """Sort element attributes for deterministic output."""
         if not element.attrib:
             return element
         
-        # Define attribute ordering
-        attr_order = {
-            "xmlns": 0,
-            "xmlns:xsi": 1,
-            "xsi:schemaLocation": 2,
-            "DEST": 10,
-            "UUID": 11,
-            "S": 12,
-            "T": 13
-        }
-        
         # Sort attributes
         sorted_attrs = sorted(element.attrib.items(), 
-                            key=lambda item: attr_order.get(item[0], 999))
+                            key=lambda item: _order.get(item[0], 999))
         
         # Clear and re-add in sorted order
         element.attrib.clear()
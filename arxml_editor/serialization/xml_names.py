@@ -0,0 +1,15 @@
+"""
+Tag and attribute name helpers shared by the serialization modules.
+"""
+
+from functools import lru_cache
+
+
+# Attribute prefixes of namespace declarations, which keep their names
+NS_PREFIXES = ('xmlns', 'xsi:')
+
+
+@lru_cache(maxsize=2048)
+def local_name(tag: str) -> str:
+    """Strip the Clark-notation namespace ("{uri}") from a tag."""
+    return tag.split('}', 1)[1] if '}' in tag else tag
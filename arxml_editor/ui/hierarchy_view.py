@@ -4,10 +4,13 @@ Hierarchy view widget for ARXML tree-based visualization.
 Provides interactive tree-based views showing parent-child relationships in ARXML structure.
 """
 
+import logging
+import math
+from collections import defaultdict, deque
 from typing import Optional, List, Dict, Any, Tuple, Set
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, QGraphicsScene,
-    QGraphicsItem, QGraphicsRectItem, QGraphicsTextItem, QGraphicsLineItem,
+    QGraphicsItem, QGraphicsRectItem, QGraphicsTextItem, QGraphicsPathItem,
     QPushButton, QComboBox, QLabel, QSlider, QCheckBox, QGroupBox,
     QMenu, QMessageBox, QDialog, QFormLayout, QLineEdit, QTreeWidget,
     QTreeWidgetItem, QSplitter, QScrollArea, QFrame
@@ -19,9 +22,57 @@ from ..core.arxml_model import ARXMLModel
 from ..core.element_index import ElementInfo
 from ..core.reference_manager import ReferenceInfo
 
+logger = logging.getLogger(__name__)
+
+
+# Fonts shared by all hierarchy nodes
+_NAME_FONT = QFont()
+_NAME_FONT.setPointSize(10)
+_NAME_FONT.setBold(True)
+_TYPE_FONT = QFont()
+_TYPE_FONT.setPointSize(8)
+_EXPAND_FONT = QFont()
+_EXPAND_FONT.setPointSize(8)
+
+# Text and line colors shared by all hierarchy nodes and connections
+_NAME_COLOR = QColor(0, 0, 0)
+_TYPE_COLOR = QColor(100, 100, 100)
+_EXPAND_COLOR = QColor(50, 50, 50)
+_EDGE_COLOR = QColor(100, 100, 100)
+
+# Node colors by hierarchy level; the last entry is used for deeper levels
+_LEVEL_COLORS = [
+    QColor(100, 150, 200),   # Level 0 - Root
+    QColor(150, 200, 100),   # Level 1
+    QColor(200, 150, 100),   # Level 2
+    QColor(200, 100, 150),   # Level 3
+    QColor(150, 100, 200),   # Level 4+
+]
+_LEVEL_BRUSHES = [QBrush(color.lighter(180)) for color in _LEVEL_COLORS]
+_LEVEL_PENS = [QPen(color.darker(120), 2) for color in _LEVEL_COLORS]
+
+# Zoom levels below which nodes are drawn without any text, or with the
+# name only
+_LOD_BOX_ONLY = 0.35
+_LOD_NAME_ONLY = 0.7
+
+# Element types that show an expand/collapse indicator
+_EXPANDABLE_TYPES = frozenset({"AR-PACKAGE", "ELEMENT", "CONTAINER"})
+
+# Hierarchies with more nodes than this are laid out in chunks of this many
+# nodes, returning to the event loop in between
+_LAYOUT_CHUNK_SIZE = 1000
+
+# Text of the dummy child that marks a navigation tree item as not yet populated
+_PLACEHOLDER_TEXT = "…"
+
 
 class HierarchyTreeNode(QGraphicsRectItem):
-    """Represents a node in the hierarchy tree."""
+    """Represents a node in the hierarchy tree.
+    
+    Text, level strip and expand indicator are drawn in ``paint`` rather than
+    held as child items, so a node is a single item in the scene.
+    """
     
     def __init__(self, element_info: ElementInfo, x: float = 0, y: float = 0, 
                  width: float = 150, height: float = 60, level: int = 0):
@@ -33,81 +84,80 @@ class HierarchyTreeNode(QGraphicsRectItem):
         self.children_nodes: List['HierarchyTreeNode'] = []
         self.parent_node: Optional['HierarchyTreeNode'] = None
         
-        self.setFlag(QGraphicsItem.ItemIsMovable, True)
+        # Hidden because it does not match the type filter
+        self.is_filtered_out = False
+        
+        # Display options toggled from the toolbar
+        self.show_type = True
+        self.show_expand_indicator = True
+        
+        self._short_name = element_info.short_name or element_info.element_type or "Unnamed"
+        self._type_text = element_info.element_type or "Unknown"
+        self._has_expand_indicator = element_info.element_type in _EXPANDABLE_TYPES
+        
+        # Positions come from the tree layout, so nodes are not movable
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
-        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        
+        # Panning and zooming blit the cached pixmap instead of repainting text
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Visual properties based on level
         self._setup_visual_properties()
-        self._create_content()
     
     def _setup_visual_properties(self):
         """Set up visual properties based on hierarchy level."""
-        # Color scheme based on level
-        colors = [
-            QColor(100, 150, 200),   # Level 0 - Root
-            QColor(150, 200, 100),   # Level 1
-            QColor(200, 150, 100),   # Level 2
-            QColor(200, 100, 150),   # Level 3
-            QColor(150, 100, 200),   # Level 4+
-        ]
-        
-        level_color = colors[min(self.level, len(colors) - 1)]
+        level = min(self.level, len(_LEVEL_COLORS) - 1)
         
         # Set visual properties
-        self.setBrush(QBrush(level_color.lighter(180)))
-        self.setPen(QPen(level_color.darker(120), 2))
+        self.setBrush(_LEVEL_BRUSHES[level])
+        self.setPen(_LEVEL_PENS[level])
         
-        # Add level indicator
-        if self.level > 0:
-            level_rect = QGraphicsRectItem(0, 0, 8, self.rect().height(), self)
-            level_rect.setBrush(QBrush(level_color))
-            level_rect.setPen(QPen(Qt.NoPen))
-    
-    def _create_content(self):
-        """Create text content for the node."""
-        # Main name
-        short_name = self.element_info.short_name or self.element_info.element_type or "Unnamed"
-        self.name_item = QGraphicsTextItem(short_name, self)
-        self.name_item.setDefaultTextColor(QColor(0, 0, 0))
-        font = QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        self.name_item.setFont(font)
-        
-        # Element type
-        element_type = self.element_info.element_type or "Unknown"
-        self.type_item = QGraphicsTextItem(element_type, self)
-        self.type_item.setDefaultTextColor(QColor(100, 100, 100))
-        type_font = QFont()
-        type_font.setPointSize(8)
-        self.type_item.setFont(type_font)
-        
-        # Position text elements
-        self._position_text()
-        
-        # Add expand/collapse indicator
-        if self.element_info.element_type in ["AR-PACKAGE", "ELEMENT", "CONTAINER"]:
-            self.expand_indicator = QGraphicsTextItem("▼" if self.is_expanded else "▶", self)
-            self.expand_indicator.setDefaultTextColor(QColor(50, 50, 50))
-            expand_font = QFont()
-            expand_font.setPointSize(8)
-            self.expand_indicator.setFont(expand_font)
-            self.expand_indicator.setPos(5, 5)
-    
-    def _position_text(self):
-        """Position text elements within the node."""
+        # Level indicator strip, drawn in paint()
+        self._level_color = _LEVEL_COLORS[level]
+    
+    def paint(self, painter: QPainter, option, widget=None):
+        """Draw the node box, level strip, name, type and expand indicator.
+        
+        When zoomed out, text that would be too small to read is skipped.
+        """
+        super().paint(painter, option, widget)
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < _LOD_BOX_ONLY:
+            return
         rect = self.rect()
-        name_rect = self.name_item.boundingRect()
-        type_rect = self.type_item.boundingRect()
         
-        # Center the name
-        name_x = max(15, (rect.width() - name_rect.width()) / 2)
-        self.name_item.setPos(name_x, 8)
+        if self.level > 0:
+            painter.fillRect(QRectF(rect.x(), rect.y(), 8, rect.height()), self._level_color)
+        
+        # Name centered near the top, type centered below it
+        painter.setPen(_NAME_COLOR)
+        painter.setFont(_NAME_FONT)
+        self._draw_centered_text(painter, rect, 12, self._short_name)
+        if lod < _LOD_NAME_ONLY:
+            return
         
-        # Center the type below the name
-        type_x = max(15, (rect.width() - type_rect.width()) / 2)
-        self.type_item.setPos(type_x, 25)
+        if self.show_type:
+            painter.setPen(_TYPE_COLOR)
+            painter.setFont(_TYPE_FONT)
+            self._draw_centered_text(painter, rect, 29, self._type_text)
+        
+        if self._has_expand_indicator and self.show_expand_indicator:
+            painter.setPen(_EXPAND_COLOR)
+            painter.setFont(_EXPAND_FONT)
+            painter.drawText(QPointF(rect.x() + 9, rect.y() + 9 + painter.fontMetrics().ascent()),
+                             "▼" if self.is_expanded else "▶")
+    
+    def _draw_centered_text(self, painter: QPainter, rect: QRectF, top: float, text: str):
+        """Draw one line of text centered in the node, right of the indicator.
+        
+        Text wider than the node is elided so nothing is drawn outside the
+        item's bounding rect.
+        """
+        metrics = painter.fontMetrics()
+        available = int(rect.width()) - 23
+        text = metrics.elidedText(text, Qt.ElideRight, available)
+        x = max(19, (rect.width() - metrics.horizontalAdvance(text)) / 2)
+        painter.drawText(QPointF(rect.x() + x, rect.y() + top + metrics.ascent()), text)
     
     def add_child(self, child_node: 'HierarchyTreeNode'):
         """Add a child node."""
@@ -125,8 +175,8 @@ class HierarchyTreeNode(QGraphicsRectItem):
     def toggle_expansion(self):
         """Toggle the expansion state."""
         self.is_expanded = not self.is_expanded
-        if hasattr(self, 'expand_indicator'):
-            self.expand_indicator.setPlainText("▼" if self.is_expanded else "▶")
+        if self._has_expand_indicator:
+            self.update()
     
     def get_all_descendants(self) -> List['HierarchyTreeNode']:
         """Get all descendant nodes."""
@@ -135,21 +185,6 @@ class HierarchyTreeNode(QGraphicsRectItem):
             descendants.append(child)
             descendants.extend(child.get_all_descendants())
         return descendants
-    
-    def itemChange(self, change, value):
-        """Handle item changes."""
-        if change == QGraphicsItem.ItemPositionChange:
-            # Update child positions when this node moves
-            self._update_children_positions()
-        return super().itemChange(change, value)
-    
-    def _update_children_positions(self):
-        """Update positions of child nodes."""
-        if not self.is_expanded:
-            return
-        
-        # This will be handled by the layout algorithm
-        pass
 
 
 class HierarchyTreeScene(QGraphicsScene):
@@ -166,18 +201,48 @@ class HierarchyTreeScene(QGraphicsScene):
         self.layout_timer = QTimer()
         self.layout_timer.timeout.connect(self._apply_tree_layout)
         self.layout_timer.setSingleShot(True)
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        
+        # Chunked layout in progress and the callback to run when it ends
+        self._pending_layout = None
+        self._pending_layout_done = None
+        
+        # Nodes and connection lines are children of one container item; a
+        # new hierarchy is built under a detached container that is added to
+        # the scene in one call by show_hierarchy()
+        self._container = self._create_container()
+        self.addItem(self._container)
+        
+        # All connection lines are segments of one path item
+        self._edge_path = QPainterPath()
         
         # Layout parameters
         self.node_spacing_x = 200
         self.node_spacing_y = 100
         self.level_indent = 50
     
+    def _create_container(self) -> QGraphicsRectItem:
+        """Create the invisible parent item for nodes and connection lines."""
+        container = QGraphicsRectItem()
+        container.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        
+        # Lines are drawn over the nodes
+        self._edges_item = QGraphicsPathItem(container)
+        self._edges_item.setPen(QPen(_EDGE_COLOR, 1, Qt.SolidLine))
+        self._edges_item.setZValue(1)
+        return container
+    
+    def show_hierarchy(self):
+        """Add the nodes built since the last clear to the scene."""
+        if self._container.scene() is None:
+            self.addItem(self._container)
+    
     def add_root_node(self, element_info: ElementInfo) -> HierarchyTreeNode:
         """Add a root node to the hierarchy."""
         node = HierarchyTreeNode(element_info, level=0)
         self.root_nodes.append(node)
         self.all_nodes[element_info.path] = node
-        self.addItem(node)
+        node.setParentItem(self._container)
         return node
     
     def add_child_node(self, parent_path: str, element_info: ElementInfo) -> Optional[HierarchyTreeNode]:
@@ -189,18 +254,10 @@ class HierarchyTreeScene(QGraphicsScene):
         child_node = HierarchyTreeNode(element_info, level=parent_node.level + 1)
         parent_node.add_child(child_node)
         self.all_nodes[element_info.path] = child_node
-        self.addItem(child_node)
-        
-        # Add visual connection
-        self._add_connection_line(parent_node, child_node)
+        child_node.setParentItem(self._container)
         
         return child_node
     
-    def _add_connection_line(self, parent: HierarchyTreeNode, child: HierarchyTreeNode):
-        """Add a visual connection line between parent and child."""
-        # This will be handled by the layout algorithm
-        pass
-    
     def get_node(self, path: str) -> Optional[HierarchyTreeNode]:
         """Get a node by its path."""
         return self.all_nodes.get(path)
@@ -214,60 +271,136 @@ class HierarchyTreeScene(QGraphicsScene):
             self._update_visibility()
             self._apply_tree_layout()
     
+    def bulk_set_expanded(self, paths, expanded: bool):
+        """Expand or collapse many nodes with one visibility and layout pass."""
+        # Visibility changes are not indexed; the layout rebuilds the index
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            for path in paths:
+                node = self.all_nodes.get(path)
+                if node is not None and node.is_expanded != expanded:
+                    node.is_expanded = expanded
+                    if node._has_expand_indicator:
+                        node.update()
+            self._update_visibility()
+            self._apply_tree_layout()
+        finally:
+            self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+    
     def _update_visibility(self):
         """Update visibility of nodes based on expansion state."""
-        for node in self.all_nodes.values():
-            # Hide if any parent is collapsed
-            should_show = True
-            current = node.parent_node
-            while current:
-                if not current.is_expanded:
-                    should_show = False
-                    break
-                current = current.parent_node
-            
-            node.setVisible(should_show)
+        # Push visibility down from the roots so each node is visited once:
+        # a node is hidden if filtered out or any parent is collapsed
+        stack = [(root, True) for root in self.root_nodes]
+        while stack:
+            node, parents_expanded = stack.pop()
+            node.setVisible(parents_expanded and not node.is_filtered_out)
+            children_expanded = parents_expanded and node.is_expanded
+            stack.extend((child, children_expanded) for child in node.children_nodes)
     
     def _apply_tree_layout(self):
         """Apply tree layout algorithm."""
+        # This layout finishes what a pending chunked one would have
+        on_done = self._cancel_pending_layout()
+        for _ in self._layout_steps():
+            pass
+        if on_done is not None:
+            on_done()
+    
+    def apply_tree_layout_deferred(self, on_done=None):
+        """Apply the tree layout, in chunks between event loop iterations if large.
+        
+        ``on_done`` is called once the layout has finished. It is dropped
+        when the layout is superseded by another chunked layout or the
+        hierarchy is cleared, so it only runs for nodes in final position.
+        """
+        self._cancel_pending_layout()
+        steps = self._layout_steps()
+        self._pending_layout = steps
+        self._pending_layout_done = on_done
+        
+        def _step():
+            if self._pending_layout is not steps:
+                return
+            try:
+                next(steps)
+            except StopIteration:
+                self._finish_pending_layout()
+            except Exception:
+                logger.exception("Hierarchy layout failed")
+                self._finish_pending_layout()
+            else:
+                QTimer.singleShot(0, _step)
+        
+        _step()
+    
+    def _cancel_pending_layout(self):
+        """Abandon a chunked layout that has not finished yet.
+        
+        Returns its completion callback without running it.
+        """
+        on_done = self._pending_layout_done
+        if self._pending_layout is not None:
+            self._pending_layout.close()
+        self._pending_layout = None
+        self._pending_layout_done = None
+        return on_done
+    
+    def _finish_pending_layout(self):
+        """Forget the chunked layout and run its completion callback."""
+        on_done = self._pending_layout_done
+        self._pending_layout = None
+        self._pending_layout_done = None
+        if on_done is not None:
+            on_done()
+    
+    def _layout_steps(self):
+        """Lay out the tree, yielding after every chunk of placed nodes.
+        
+        Visible nodes are placed one row each in depth-first order, children
+        indented below their parent.
+        """
         if not self.root_nodes:
             return
         
-        print(f"Debug: Applying layout to {len(self.root_nodes)} root nodes")
+        logger.debug("Applying layout to %d root nodes", len(self.root_nodes))
         
-        # Clear existing connections
-        self._clear_connections()
-        
-        # Apply layout starting from root nodes
-        y_offset = 50
-        for root in self.root_nodes:
-            print(f"Debug: Layout root node {root.element_info.short_name}, visible: {root.isVisible()}")
-            y_offset = self._layout_subtree(root, 50, y_offset)
-    
-    def _layout_subtree(self, node: HierarchyTreeNode, x: float, y: float) -> float:
-        """Layout a subtree starting from the given node."""
-        if not node.isVisible():
-            return y
-        
-        # Position the current node
-        node.setPos(x, y)
-        
-        if not node.is_expanded or not node.children_nodes:
-            return y + self.node_spacing_y
-        
-        # Layout children
-        child_y = y + self.node_spacing_y
-        child_x = x + self.level_indent
-        
-        for child in node.children_nodes:
-            child_y = self._layout_subtree(child, child_x, child_y)
-            # Add connection line
-            self._add_connection_line(node, child)
-        
-        return child_y
-    
-    def _add_connection_line(self, parent: HierarchyTreeNode, child: HierarchyTreeNode):
-        """Add a connection line between parent and child."""
+        # Without an index every setPos is cheap; the BSP tree is rebuilt
+        # once when indexing is switched back on
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            # Clear existing connections
+            self._clear_connections()
+            
+            # Apply layout starting from root nodes
+            y = 50
+            placed = 0
+            stack: List[Tuple[HierarchyTreeNode, float, Optional[HierarchyTreeNode]]] = [
+                (root, 50, None) for root in reversed(self.root_nodes) if root.isVisible()
+            ]
+            while stack:
+                node, node_x, parent = stack.pop()
+                node.setPos(node_x, y)
+                y += self.node_spacing_y
+                if parent is not None:
+                    self._queue_edge(parent, node)
+                
+                if node.is_expanded:
+                    child_x = node_x + self.level_indent
+                    stack.extend((child, child_x, node)
+                                 for child in reversed(node.children_nodes) if child.isVisible())
+                
+                placed += 1
+                if placed % _LAYOUT_CHUNK_SIZE == 0:
+                    yield
+            self._edges_item.setPath(self._edge_path)
+        finally:
+            self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+            # Match the partition depth to the number of nodes
+            self.setBspTreeDepth(int(math.log2(max(4, len(self.all_nodes)))) + 1)
+    
+    def _queue_edge(self, parent: HierarchyTreeNode, child: HierarchyTreeNode):
+        """Add a connection line between parent and child to the edge path."""
         # Calculate connection points
         parent_rect = parent.rect()
         child_rect = child.rect()
@@ -280,25 +413,22 @@ class HierarchyTreeScene(QGraphicsScene):
         child_x = child.x() + child_rect.width() / 2
         child_y = child.y()
         
-        # Create connection line
-        line = QGraphicsLineItem(parent_x, parent_y, child_x, child_y)
-        line.setPen(QPen(QColor(100, 100, 100), 1, Qt.SolidLine))
-        self.addItem(line)
+        self._edge_path.moveTo(parent_x, parent_y)
+        self._edge_path.lineTo(child_x, child_y)
     
     def _clear_connections(self):
         """Clear all connection lines."""
-        # Remove all line items
-        items_to_remove = []
-        for item in self.items():
-            if isinstance(item, QGraphicsLineItem):
-                items_to_remove.append(item)
-        
-        for item in items_to_remove:
-            self.removeItem(item)
+        # The edge item keeps showing the old path until the layout sets
+        # the new one
+        self._edge_path = QPainterPath()
     
     def clear_hierarchy(self):
         """Clear all nodes and connections."""
-        self.clear()
+        self._cancel_pending_layout()
+        # Removing the container takes all nodes and lines with it
+        if self._container.scene() is self:
+            self.removeItem(self._container)
+        self._container = self._create_container()
         self.root_nodes.clear()
         self.all_nodes.clear()
 
@@ -314,6 +444,23 @@ class HierarchyViewWidget(QWidget):
         self.arxml_model = arxml_model
         self.current_element: Optional[ElementInfo] = None
         
+        # Root paths, filter matches and index generation of the scene, for
+        # incremental refiltering
+        self._root_paths: List[str] = []
+        self._visible_paths: Set[str] = set()
+        self._index_generation = -1
+        
+        # Navigation tree items by element path
+        self._tree_items: Dict[str, QTreeWidgetItem] = {}
+        
+        # Child elements by parent path and the index generation they were
+        # grouped at, shared by rebuilds and refilters
+        self._children_map: Dict[str, List[ElementInfo]] = {}
+        self._children_map_generation = -1
+        
+        # Index generation the type selector was filled at
+        self._types_generation = -1
+        
         self._setup_ui()
         self._setup_connections()
     
@@ -340,14 +487,18 @@ class HierarchyViewWidget(QWidget):
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setDragMode(QGraphicsView.RubberBandDrag)
         self.view.setContextMenuPolicy(Qt.CustomContextMenu)
-        # Use full viewport updates to avoid partial buffer commits that can
-        # cause Wayland buffer-size mismatches on some compositors when the
-        # window is maximized and the scene is updated heavily.
+        # Repaint only what changed. Resizes still repaint the whole viewport
+        # (see resizeEvent) to avoid partial buffer commits that can cause
+        # Wayland buffer-size mismatches on some compositors when the window
+        # is maximized.
         try:
-            self.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+            self.view.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
         except Exception:
             # QGraphicsView may not expose the mode on some bindings; ignore.
             pass
+        # Every item sets its own pen, brush and font when painting
+        self.view.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.view.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         
         splitter.addWidget(self.view)
         splitter.setSizes([300, 700])
@@ -359,6 +510,11 @@ class HierarchyViewWidget(QWidget):
         self.status_label.setStyleSheet("color: gray; font-style: italic;")
         layout.addWidget(self.status_label)
     
+    def resizeEvent(self, event):
+        """Repaint the whole hierarchy view after a resize."""
+        super().resizeEvent(event)
+        self.view.viewport().update()
+    
     def _create_toolbar(self, layout: QVBoxLayout):
         """Create hierarchy toolbar."""
         toolbar_layout = QHBoxLayout()
@@ -454,14 +610,15 @@ class HierarchyViewWidget(QWidget):
         self._populate_type_selector()
 
         self._build_hierarchy()
-        self._populate_tree_widget()
 
     def _populate_type_selector(self):
         """Populate the type selector with available element types from the model."""
-        types = set()
-        for elem in self.arxml_model.element_index.get_all_elements():
-            if elem.element_type:
-                types.add(elem.element_type)
+        element_index = self.arxml_model.element_index
+        if element_index.generation == self._types_generation:
+            return
+        self._types_generation = element_index.generation
+        
+        types = {elem.element_type for elem in element_index.get_all_elements() if elem.element_type}
 
         current = self.type_selector.currentText()
         self.type_selector.blockSignals(True)
@@ -475,43 +632,38 @@ class HierarchyViewWidget(QWidget):
             self.type_selector.setCurrentIndex(idx)
         self.type_selector.blockSignals(False)
     
-    def _build_hierarchy(self):
-        """Build the hierarchy visualization."""
+    def _build_hierarchy(self, rebuild_tree: bool = True):
+        """Build the hierarchy visualization and, unless told not to, the navigation tree."""
         if not self.current_element:
             return
         
         self.scene.clear_hierarchy()
-        # If user requested full hierarchy, start from top-level packages
-        if self.show_full_hierarchy_checkbox.isChecked():
-            # build roots from all top-level elements (parent_path empty)
-            root_elements = [e for e in self.arxml_model.element_index.get_all_elements() if not e.parent_path]
-            for elem in root_elements:
-                root_node = self.scene.add_root_node(elem)
-                self._build_subtree(root_node, elem)
-        else:
-            # Start with the current element as root
-            root_node = self.scene.add_root_node(self.current_element)
-            # Build the complete hierarchy under the current element
-            self._build_subtree(root_node, self.current_element)
+        if rebuild_tree:
+            self.tree_widget.clear()
+            self._tree_items = {}
+        
+        all_elements = self.arxml_model.element_index.get_all_elements()
+        children_map = self._get_children_map()
+        root_elements = self._get_root_elements(all_elements)
+        
+        # No scene signals while the nodes are created
+        self.scene.blockSignals(True)
+        try:
+            self._build_subtrees(root_elements, children_map)
+        finally:
+            self.scene.blockSignals(False)
+        self.scene.show_hierarchy()
+        
+        self._root_paths = [elem.path for elem in root_elements]
+        self._visible_paths = set(self.scene.all_nodes)
+        self._index_generation = self.arxml_model.element_index.generation
         
         # Ensure all nodes are visible initially (they should be expanded by default)
-        visible_count = 0
         for node in self.scene.all_nodes.values():
             node.setVisible(True)
-            if node.isVisible():
-                visible_count += 1
         
-        print(f"Debug: Set {visible_count} nodes to visible out of {len(self.scene.all_nodes)}")
+        logger.debug("Built hierarchy with %d nodes", len(self.scene.all_nodes))
         
-        # Defer layout slightly to allow the window and compositor to settle
-        # (prevents rapid buffer reconfiguration on Wayland which can lead
-        # to protocol errors when the surface is maximized).
-        def _deferred_layout():
-            try:
-                self.scene._apply_tree_layout()
-            except Exception:
-                logging.getLogger(__name__).exception("Hierarchy layout failed")
-
         # Disable viewport updates while building the scene to reduce stress on
         # the compositor and avoid resizing artifacts.
         try:
@@ -519,7 +671,13 @@ class HierarchyViewWidget(QWidget):
         except Exception:
             pass
 
-        QTimer.singleShot(150, lambda: (_deferred_layout(), self.view.setUpdatesEnabled(True)))
+        # Lay out once control is back in the event loop, after pending
+        # window and surface configure events (rapid buffer reconfiguration
+        # on Wayland can lead to protocol errors when the surface is
+        # maximized). Large hierarchies are laid out in chunks so the UI
+        # keeps responding; updates resume when the layout is done.
+        QTimer.singleShot(0, lambda: self.scene.apply_tree_layout_deferred(
+            lambda: self.view.setUpdatesEnabled(True)))
         
         # Enable toolbar buttons
         self.auto_layout_button.setEnabled(True)
@@ -532,37 +690,69 @@ class HierarchyViewWidget(QWidget):
         # Update status
         node_count = len(self.scene.all_nodes)
         self.status_label.setText(f"Hierarchy: {node_count} nodes")
+        
+        # The navigation tree starts at the current element, unfiltered;
+        # expand its first level
+        if rebuild_tree:
+            root_item = self._create_tree_item(self.current_element)
+            self.tree_widget.addTopLevelItem(root_item)
+            root_item.setExpanded(True)
+    
+    def _build_children_map(self, all_elements: List[ElementInfo]) -> Dict[str, List[ElementInfo]]:
+        """Group all elements by parent once instead of querying the index per node."""
+        children_map: Dict[str, List[ElementInfo]] = defaultdict(list)
+        for elem in all_elements:
+            if elem.parent_path:
+                children_map[elem.parent_path].append(elem)
+        return children_map
+    
+    def _get_children_map(self) -> Dict[str, List[ElementInfo]]:
+        """Get the children map, regrouping only when the index has changed."""
+        element_index = self.arxml_model.element_index
+        generation = element_index.generation
+        if generation != self._children_map_generation:
+            self._children_map = self._build_children_map(element_index.get_all_elements())
+            self._children_map_generation = generation
+        return self._children_map
+    
+    def _get_root_elements(self, all_elements: List[ElementInfo]) -> List[ElementInfo]:
+        """Get the elements the scene hierarchy starts from."""
+        # If user requested full hierarchy, start from top-level packages
+        if self.show_full_hierarchy_checkbox.isChecked():
+            # build roots from all top-level elements (parent_path empty)
+            return [e for e in all_elements if not e.parent_path]
+        # Start with the current element as root
+        return [self.current_element]
     
-    def _build_subtree(self, parent_node: HierarchyTreeNode, element: ElementInfo):
-        """Build a subtree starting from the given element."""
-        # Optionally filter by the selected type
-        selected_type = self.type_selector.currentText() if hasattr(self, 'type_selector') else "All Types"
-        children = self.arxml_model.element_index.get_children(element.path)
+    def _get_allowed_types(self) -> Optional[Set[str]]:
+        """Get the element types selected for the scene, or None for all types."""
+        selected_type = self.type_selector.currentText()
         if selected_type and selected_type != "All Types":
-            children = [c for c in children if c.element_type == selected_type]
-        print(f"Debug: Building subtree for {element.short_name}, found {len(children)} children")
-        
-        for child in children:
-            child_node = self.scene.add_child_node(element.path, child)
-            if child_node:
-                print(f"Debug: Added child {child.short_name}, visible: {child_node.isVisible()}")
-                # Recursively build children
-                self._build_subtree(child_node, child)
-    
-    def _populate_tree_widget(self):
-        """Populate the tree widget with ARXML structure."""
-        self.tree_widget.clear()
-        
-        if not self.current_element:
-            return
+            return {selected_type}
+        return None
+    
+    def _build_subtrees(self, root_elements: List[ElementInfo],
+                        children_map: Dict[str, List[ElementInfo]]):
+        """Create scene nodes for the hierarchy in one breadth-first pass.
         
-        # Build tree widget items
-        root_item = self._create_tree_item(self.current_element)
-        self.tree_widget.addTopLevelItem(root_item)
-        self._populate_tree_subtree(root_item, self.current_element)
+        Nodes are created below ``root_elements``, dropping children that do
+        not match the selected type.
+        """
+        # Optionally filter by the selected type
+        allowed_types = self._get_allowed_types()
+        debug = logger.isEnabledFor(logging.DEBUG)
         
-        # Expand first level
-        root_item.setExpanded(True)
+        queue = deque((elem, self.scene.add_root_node(elem)) for elem in root_elements)
+        while queue:
+            element, node = queue.popleft()
+            
+            children = children_map.get(element.path, ())
+            if debug:
+                logger.debug("Building subtree for %s, found %d children", element.short_name, len(children))
+            
+            for child in children:
+                if allowed_types is None or child.element_type in allowed_types:
+                    queue.append((child, self.scene.add_child_node(element.path, child)))
     
     def _create_tree_item(self, element: ElementInfo) -> QTreeWidgetItem:
         """Create a tree widget item for an element."""
@@ -571,6 +761,11 @@ class HierarchyViewWidget(QWidget):
         
         item = QTreeWidgetItem([short_name, element_type])
         item.setData(0, Qt.UserRole, element.path)
+        self._tree_items[element.path] = item
+        
+        # Children are created when the item is first expanded
+        if self._children_map.get(element.path):
+            item.addChild(QTreeWidgetItem([_PLACEHOLDER_TEXT]))
         
         # Set icon based on element type
         from PySide6.QtWidgets import QStyle
@@ -583,30 +778,37 @@ class HierarchyViewWidget(QWidget):
         
         return item
     
-    def _populate_tree_subtree(self, parent_item: QTreeWidgetItem, element: ElementInfo):
-        """Populate tree widget subtree."""
-        children = self.arxml_model.element_index.get_children(element.path)
-        
-        for child in children:
-            child_item = self._create_tree_item(child)
-            parent_item.addChild(child_item)
-            self._populate_tree_subtree(child_item, child)
-    
     def _apply_auto_layout(self):
         """Apply automatic layout to the hierarchy."""
         self.scene._apply_tree_layout()
     
     def _expand_all(self):
         """Expand all nodes in the hierarchy."""
-        for node in self.scene.all_nodes.values():
-            self.scene.expand_node(node.element_info.path, True)
-        self.tree_widget.expandAll()
+        self.scene.bulk_set_expanded(list(self.scene.all_nodes), True)
+        
+        # expandAll only opens items that exist, so fill in the whole tree first
+        stack = [self.tree_widget.topLevelItem(i) for i in range(self.tree_widget.topLevelItemCount())]
+        while stack:
+            item = stack.pop()
+            self._populate_tree_item(item)
+            stack.extend(item.child(i) for i in range(item.childCount()))
+        
+        # The scene is already expanded; keep the tree from syncing it item by item
+        self.tree_widget.blockSignals(True)
+        try:
+            self.tree_widget.expandAll()
+        finally:
+            self.tree_widget.blockSignals(False)
     
     def _collapse_all(self):
         """Collapse all nodes in the hierarchy."""
-        for node in self.scene.all_nodes.values():
-            self.scene.expand_node(node.element_info.path, False)
-        self.tree_widget.collapseAll()
+        self.scene.bulk_set_expanded(list(self.scene.all_nodes), False)
+        
+        self.tree_widget.blockSignals(True)
+        try:
+            self.tree_widget.collapseAll()
+        finally:
+            self.tree_widget.blockSignals(False)
     
     def _zoom_in(self):
         """Zoom in on the view."""
@@ -623,14 +825,14 @@ class HierarchyViewWidget(QWidget):
     def _toggle_types(self, show: bool):
         """Toggle display of element types."""
         for node in self.scene.all_nodes.values():
-            if hasattr(node, 'type_item'):
-                node.type_item.setVisible(show)
+            node.show_type = show
+            node.update()
     
     def _toggle_levels(self, show: bool):
         """Toggle display of level indicators."""
         for node in self.scene.all_nodes.values():
-            if hasattr(node, 'expand_indicator'):
-                node.expand_indicator.setVisible(show)
+            node.show_expand_indicator = show
+            node.update()
     
     def _on_node_selected(self, path: str):
         """Handle node selection."""
@@ -642,16 +844,77 @@ class HierarchyViewWidget(QWidget):
         self._update_tree_item_expansion(path, expanded)
 
     def _on_type_selector_changed(self, text: str):
-        """Handle type selection change - rebuild hierarchy with filter."""
-        # Rebuild current hierarchy view using the newly selected type
-        self._build_hierarchy()
-        self._populate_tree_widget()
+        """Handle type selection change - refilter hierarchy."""
+        self._refilter()
 
     def _on_full_hierarchy_toggled(self, checked: bool):
-        """Handle full-hierarchy toggle - rebuild view."""
-        # Rebuild to either show all top-level roots or only the selected element subtree
-        self._build_hierarchy()
-        self._populate_tree_widget()
+        """Handle full-hierarchy toggle - refilter hierarchy."""
+        # Either show all top-level roots or only the selected element subtree
+        self._refilter()
+    
+    def _refilter(self):
+        """Update the scene to the current filter, touching only nodes that change.
+        
+        Nodes that no longer match are hidden, newly matching ones are shown or
+        created. A change of roots (full hierarchy toggle) changes every node's
+        level, so the scene is rebuilt instead, as it is after model changes.
+        The navigation tree does not depend on the filter and is only rebuilt
+        after model changes.
+        """
+        if not self.current_element:
+            return
+        
+        element_index = self.arxml_model.element_index
+        all_elements = element_index.get_all_elements()
+        root_elements = self._get_root_elements(all_elements)
+        index_changed = element_index.generation != self._index_generation
+        if index_changed or [elem.path for elem in root_elements] != self._root_paths:
+            self._build_hierarchy(rebuild_tree=index_changed)
+            return
+        
+        children_map = self._get_children_map()
+        allowed_types = self._get_allowed_types()
+        
+        # Paths matching the filter, parents before children
+        matches: List[ElementInfo] = []
+        queue = deque(root_elements)
+        while queue:
+            element = queue.popleft()
+            matches.append(element)
+            for child in children_map.get(element.path, ()):
+                if allowed_types is None or child.element_type in allowed_types:
+                    queue.append(child)
+        new_paths = {elem.path for elem in matches}
+        
+        for path in self._visible_paths - new_paths:
+            node = self.scene.get_node(path)
+            node.is_filtered_out = True
+            node.setVisible(False)
+        
+        changed_parents: Set[str] = set()
+        for elem in matches:
+            if elem.path in self._visible_paths:
+                continue
+            node = self.scene.get_node(elem.path)
+            if node is not None:
+                node.is_filtered_out = False
+            else:
+                self.scene.add_child_node(elem.parent_path, elem)
+                changed_parents.add(elem.parent_path)
+        
+        # New nodes were appended; restore document order among siblings
+        for parent_path in changed_parents:
+            parent_node = self.scene.get_node(parent_path)
+            parent_node.children_nodes = [
+                self.scene.all_nodes[child.path] for child in children_map[parent_path]
+                if child.path in self.scene.all_nodes
+            ]
+        
+        self._visible_paths = new_paths
+        self.scene._update_visibility()
+        self.scene._apply_tree_layout()
+        
+        self.status_label.setText(f"Hierarchy: {len(new_paths)} nodes")
     
     def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle tree item click."""
@@ -666,10 +929,20 @@ class HierarchyViewWidget(QWidget):
     
     def _on_tree_item_expanded(self, item: QTreeWidgetItem):
         """Handle tree item expansion."""
+        self._populate_tree_item(item)
         path = item.data(0, Qt.UserRole)
         if path:
             self.scene.expand_node(path, True)
     
+    def _populate_tree_item(self, item: QTreeWidgetItem):
+        """Replace the placeholder of a tree item with items for its children."""
+        if item.childCount() != 1 or item.child(0).data(0, Qt.UserRole) is not None:
+            return
+        
+        item.takeChild(0)
+        children = self._get_children_map().get(item.data(0, Qt.UserRole), ())
+        item.addChildren([self._create_tree_item(child) for child in children])
+    
     def _on_tree_item_collapsed(self, item: QTreeWidgetItem):
         """Handle tree item collapse."""
         path = item.data(0, Qt.UserRole)
@@ -678,19 +951,9 @@ class HierarchyViewWidget(QWidget):
     
     def _update_tree_item_expansion(self, path: str, expanded: bool):
         """Update tree item expansion state."""
-        # Find and update the corresponding tree item
-        for i in range(self.tree_widget.topLevelItemCount()):
-            item = self.tree_widget.topLevelItem(i)
-            self._update_tree_item_recursive(item, path, expanded)
-    
-    def _update_tree_item_recursive(self, item: QTreeWidgetItem, path: str, expanded: bool):
-        """Recursively update tree item expansion."""
-        if item.data(0, Qt.UserRole) == path:
+        item = self._tree_items.get(path)
+        if item is not None:
             item.setExpanded(expanded)
-            return
-        
-        for i in range(item.childCount()):
-            self._update_tree_item_recursive(item.child(i), path, expanded)
     
     def _show_context_menu(self, position):
         """Show context menu for the view."""
@@ -729,7 +992,12 @@ class HierarchyViewWidget(QWidget):
     def _clear_hierarchy(self):
         """Clear the hierarchy display."""
         self.scene.clear_hierarchy()
+        # No layout is coming that would resume updates
+        self.view.setUpdatesEnabled(True)
         self.tree_widget.clear()
+        self._tree_items = {}
+        self._children_map = {}
+        self._children_map_generation = -1
         self.status_label.setText("No hierarchy loaded")
         
         # Disable toolbar buttons
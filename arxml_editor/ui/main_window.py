@@ -6,14 +6,16 @@ Provides the main application interface with dockable panels and menu system.
 
 import sys
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from xml.parsers import expat
+from typing import Optional, List, Set
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QMenuBar, QMenu, QToolBar, QStatusBar, QFileDialog, QMessageBox,
-    QDockWidget, QApplication, QProgressBar, QLabel
+    QDockWidget, QApplication, QProgressDialog, QLabel
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QRunnable, QThreadPool, QSettings
 from PySide6.QtGui import QAction, QIcon, QKeySequence
 
 from .package_tree import PackageTreeWidget
@@ -24,6 +26,45 @@ from .validation_panel import ValidationPanelWidget
 from ..core.arxml_model import ARXMLModel
 from ..core.schema_manager import AUTOSARRelease
 
+logger = logging.getLogger(__name__)
+
+
+# Where window geometry and panel layout are kept between sessions
+_SETTINGS_ORGANIZATION = "RefinedARXML"
+_SETTINGS_APPLICATION = "MainWindow"
+
+# Quiet period before a tree selection is shown in the other panels
+_SELECTION_DELAY_MS = 50
+
+# Bytes read per step when probing a file for well-formedness
+_PROBE_CHUNK_SIZE = 64 * 1024
+
+
+class _RootElementFound(Exception):
+    """Stops the well-formedness probe at the root element."""
+
+
+def _probe_xml(file_path: Path) -> None:
+    """Check that ``file_path`` is well-formed XML up to its root element.
+    
+    Raises ``expat.ExpatError`` on a parse error. Only the prolog and the
+    root start tag are parsed, with no element objects built.
+    """
+    def _on_start(name, attributes):
+        raise _RootElementFound()
+    
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = _on_start
+    try:
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = f.read(_PROBE_CHUNK_SIZE)
+                parser.Parse(chunk, not chunk)
+                if not chunk:
+                    break
+    except _RootElementFound:
+        pass
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -40,6 +81,18 @@ class MainWindow(QMainWindow):
         self.current_file: Optional[Path] = None
         self.is_modified = False
         
+        # Hidden panels skip updates and catch up when shown again
+        self._selected_path: Optional[str] = None
+        self._stale_panels: Set[QWidget] = set()
+        self._pending_errors: Optional[list] = None
+        
+        # Selection bursts (e.g. arrowing through the tree) are coalesced
+        self._pending_selection: Optional[str] = None
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(_SELECTION_DELAY_MS)
+        self._select_timer.timeout.connect(self._flush_selection)
+        
         self._setup_ui()
         self._setup_connections()
         self._setup_menu()
@@ -48,10 +101,10 @@ class MainWindow(QMainWindow):
         
         # Set window properties
         self.setWindowTitle("ARXML Editor")
-        self._setup_window_geometry()
+        self._restore_window_state()
         
-        # Show welcome message
-        self._show_welcome_message()
+        # Show welcome message once the window has been painted
+        QTimer.singleShot(0, self._show_welcome_message)
     
     def _setup_ui(self):
         """Set up the main UI layout."""
@@ -136,24 +189,22 @@ class MainWindow(QMainWindow):
     
     def _setup_connections(self):
         """Set up signal connections."""
+        # Everything below is emitted on the GUI thread, so skip the
+        # per-emit thread check of automatic connections
         # File operations
-        self.file_opened.connect(self._on_file_opened)
-        self.file_saved.connect(self._on_file_saved)
+        self.file_opened.connect(self._on_file_opened, Qt.DirectConnection)
+        self.file_saved.connect(self._on_file_saved, Qt.DirectConnection)
         
         # Element selection
-        self.package_tree.element_selected.connect(self._on_element_selected)
-        self.element_selected.connect(self.property_editor.set_element)
-        self.element_selected.connect(self.diagram_view.set_element)
-        self.element_selected.connect(self.hierarchy_view.set_element)
+        self.package_tree.element_selected.connect(self._on_element_selected, Qt.DirectConnection)
         
         # Diagram toggle actions are already connected in their creation
         
         # Validation
-        self.validation_completed.connect(self.validation_panel.update_errors)
+        self.validation_completed.connect(self._update_validation_panel, Qt.DirectConnection)
         
         # Model changes
-        self.arxml_model.is_modified = True
-        self._update_window_title()
+        self.property_editor.element_modified.connect(self._on_model_changed, Qt.DirectConnection)
     
     def _setup_menu(self):
         """Set up menu bar."""
@@ -161,32 +212,13 @@ class MainWindow(QMainWindow):
         
         # File menu
         file_menu = menubar.addMenu("&File")
-        
-        # New
-        new_action = QAction("&New", self)
-        new_action.setShortcut(QKeySequence.New)
-        new_action.triggered.connect(self._new_file)
-        file_menu.addAction(new_action)
-        
-        # Open
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut(QKeySequence.Open)
-        open_action.triggered.connect(self._open_file)
-        file_menu.addAction(open_action)
-        
-        # Save
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.Save)
-        save_action.triggered.connect(self._save_file)
-        file_menu.addAction(save_action)
-        
-        # Save As
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut(QKeySequence.SaveAs)
-        save_as_action.triggered.connect(self._save_file_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
+        self._add_menu_actions(file_menu, [
+            ("&New", QKeySequence.New, self._new_file),
+            ("&Open...", QKeySequence.Open, self._open_file),
+            ("&Save", QKeySequence.Save, self._save_file),
+            ("Save &As...", QKeySequence.SaveAs, self._save_file_as),
+            None,
+        ])
         
         # Export
         export_menu = file_menu.addMenu("&Export")
@@ -194,38 +226,22 @@ class MainWindow(QMainWindow):
         # Export to different schema versions
         for release in AUTOSARRelease:
             export_action = QAction(f"Export as {release.value}", self)
-            export_action.triggered.connect(lambda checked, r=release: self._export_as_schema(r))
+            export_action.triggered.connect(partial(self._export_as_schema, release))
             export_menu.addAction(export_action)
         
-        file_menu.addSeparator()
+        self._add_menu_actions(file_menu, [
+            None,
+            ("E&xit", QKeySequence.Quit, self.close),
+        ])
         
-        # Exit
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
+        # Edit menu; Undo/Redo are placeholders without a callback
         edit_menu = menubar.addMenu("&Edit")
-        
-        # Undo/Redo (placeholder)
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut(QKeySequence.Undo)
-        undo_action.setEnabled(False)
-        edit_menu.addAction(undo_action)
-        
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut(QKeySequence.Redo)
-        redo_action.setEnabled(False)
-        edit_menu.addAction(redo_action)
-        
-        edit_menu.addSeparator()
-        
-        # Find
-        find_action = QAction("&Find...", self)
-        find_action.setShortcut(QKeySequence.Find)
-        find_action.triggered.connect(self._show_find_dialog)
-        edit_menu.addAction(find_action)
+        self._add_menu_actions(edit_menu, [
+            ("&Undo", QKeySequence.Undo, None),
+            ("&Redo", QKeySequence.Redo, None),
+            None,
+            ("&Find...", QKeySequence.Find, self._show_find_dialog),
+        ])
         
         # View menu
         view_menu = menubar.addMenu("&View")
@@ -260,54 +276,70 @@ class MainWindow(QMainWindow):
         
         view_menu.addSeparator()
         
-        # Reset layout action
-        reset_layout_action = QAction("&Reset Layout", self)
-        reset_layout_action.triggered.connect(self._reset_layout)
-        view_menu.addAction(reset_layout_action)
+        self._add_menu_actions(view_menu, [
+            ("&Reset Layout", None, self._reset_layout),
+        ])
         
         # Tools menu
         tools_menu = menubar.addMenu("&Tools")
-        
-        # Validate
-        validate_action = QAction("&Validate", self)
-        validate_action.triggered.connect(self._validate_model)
-        tools_menu.addAction(validate_action)
+        self._add_menu_actions(tools_menu, [
+            ("&Validate", None, self._validate_model),
+        ])
         
         # Schema conversion
         schema_menu = tools_menu.addMenu("&Schema Conversion")
         for release in AUTOSARRelease:
             convert_action = QAction(f"Convert to {release.value}", self)
-            convert_action.triggered.connect(lambda checked, r=release: self._convert_schema(r))
+            convert_action.triggered.connect(partial(self._convert_schema, release))
             schema_menu.addAction(convert_action)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
+        self._add_menu_actions(help_menu, [
+            ("&About", None, self._show_about),
+        ])
+    
+    def _add_menu_actions(self, menu: QMenu, entries):
+        """Add actions to a menu from (text, shortcut, callback) entries.
         
-        # About
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        ``None`` entries add a separator. Entries without a callback are added
+        disabled.
+        """
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, callback = entry
+            action = QAction(text, self)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            if callback is None:
+                action.setEnabled(False)
+            else:
+                action.triggered.connect(callback)
+            menu.addAction(action)
     
     def _setup_toolbar(self):
         """Set up toolbar."""
         toolbar = self.addToolBar("Main")
-        
-        # File operations
-        toolbar.addAction(self._create_action("New", "document-new", self._new_file))
-        toolbar.addAction(self._create_action("Open", "document-open", self._open_file))
-        toolbar.addAction(self._create_action("Save", "document-save", self._save_file))
-        
-        toolbar.addSeparator()
-        
-        # Validation
-        toolbar.addAction(self._create_action("Validate", "checkmark", self._validate_model))
-        
-        toolbar.addSeparator()
-        
-        # View operations
-        toolbar.addAction(self._create_action("Find", "edit-find", self._show_find_dialog))
-        
-        toolbar.addSeparator()
+        # Named so saveState()/restoreState() can match it
+        toolbar.setObjectName("MainToolBar")
+        
+        # File operations, validation and view operations; None is a separator
+        for entry in [
+            ("New", "document-new", self._new_file),
+            ("Open", "document-open", self._open_file),
+            ("Save", "document-save", self._save_file),
+            None,
+            ("Validate", "checkmark", self._validate_model),
+            None,
+            ("Find", "edit-find", self._show_find_dialog),
+            None,
+        ]:
+            if entry is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(self._create_action(*entry))
         
         # Diagram view toggle
         self.diagram_toolbar_action = self._create_action("Diagram View", "view-preview", self._sync_diagram_toggle)
@@ -327,10 +359,12 @@ class MainWindow(QMainWindow):
         self.schema_label = QLabel("")
         self.status_bar.addPermanentWidget(self.schema_label)
         
-        # Progress bar (hidden by default)
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.status_bar.addPermanentWidget(self.progress_bar)
+        # Busy indicator in its own window, so toggling it does not
+        # relayout the status bar (hidden by default)
+        self._progress_dlg = QProgressDialog("", "", 0, 0, self)
+        self._progress_dlg.setWindowModality(Qt.NonModal)
+        self._progress_dlg.setCancelButton(None)
+        self._progress_dlg.reset()
     
     def _create_action(self, text: str, icon_name: str, callback):
         """Create a toolbar action."""
@@ -389,46 +423,21 @@ class MainWindow(QMainWindow):
     def _load_file(self, file_path: Path, validate_first: bool = True):
         """Load ARXML file.
 
-        validate_first: when True perform a lightweight well-formedness check
-        before launching the background load thread. This avoids attempting
-        to fully parse obviously malformed files at startup and produces a
-        gentler warning instead of a blocking critical dialog.
+        validate_first: when True the background load starts with a
+        lightweight well-formedness check. This avoids attempting to fully
+        parse obviously malformed files at startup and produces a gentler
+        warning instead of a blocking critical dialog.
         """
         self._show_progress("Loading file...")
 
-        # Optional lightweight validation to catch common parse errors early
-        if validate_first:
-            try:
-                import xml.etree.ElementTree as ET
-                # Use iterparse to quickly check basic well-formedness without
-                # building the full tree in the main thread.
-                iterator = ET.iterparse(str(file_path), events=("start",))
-                # consume one event to trigger any ParseError early
-                next(iterator, None)
-            except ET.ParseError as pe:
-                logging.getLogger(__name__).warning(
-                    "Quick-parse failed for %s: %s", file_path, pe
-                )
-                self._hide_progress()
-                # Show a non-fatal warning and avoid starting the heavy load
-                self.status_bar.showMessage(f"Failed to load (not well-formed): {file_path.name}", 8000)
-                QMessageBox.warning(
-                    self,
-                    "Invalid ARXML",
-                    f"File is not well-formed XML and was not loaded:\n{file_path}\n\nParse error: {pe}"
-                )
-                return
-            except Exception as e:
-                # Any IO or unexpected error should be logged but not crash
-                logging.getLogger(__name__).warning(
-                    "Could not pre-validate file %s: %s", file_path, e
-                )
-
-        # Load in background thread to avoid UI freezing
-        self.load_thread = LoadFileThread(file_path, self.arxml_model)
-        self.load_thread.file_loaded.connect(self._on_file_loaded)
-        self.load_thread.error_occurred.connect(self._on_load_error)
-        self.load_thread.start()
+        # Load on a pooled worker thread to avoid UI freezing; even the
+        # well-formedness check opens the file, so it runs there too
+        self.load_task = LoadFileRunnable(file_path, self.arxml_model, validate_first)
+        signals = self.load_task.signals
+        signals.file_loaded.connect(self._on_file_loaded, Qt.QueuedConnection)
+        signals.parse_error.connect(self._on_parse_error, Qt.QueuedConnection)
+        signals.error_occurred.connect(self._on_load_error, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self.load_task)
     
     def _save_to_file(self, file_path: Path, target_schema: Optional[AUTOSARRelease] = None):
         """Save model to file."""
@@ -464,38 +473,51 @@ class MainWindow(QMainWindow):
             self.is_modified = False
             self._update_window_title()
             self._update_status_bar()
-            # Refresh package tree so UI widgets have the latest model
-            self.package_tree.refresh()
-
-            # If nothing is selected yet, preselect the first root element so
-            # the property editor, diagram and hierarchy panes populate on load.
+            # Rebuild and preselect without repainting the tree in between
+            self.package_tree.setUpdatesEnabled(False)
             try:
-                current_selected = self.package_tree.get_selected_element()
-                if not current_selected:
-                    all_elements = self.arxml_model.element_index.get_all_elements()
-                    # Root elements have no parent_path or an empty parent_path
-                    root_elements = [e for e in all_elements if not e.parent_path]
-                    if root_elements:
-                        # Choose the first root element (stable ordering not guaranteed)
-                        root_path = root_elements[0].path
-                        self.package_tree.expand_to_path(root_path)
-            except Exception:
-                # Be defensive: do not let UI population errors break loading
-                logging.getLogger(__name__).exception("Failed to preselect root element")
+                # Refresh package tree so UI widgets have the latest model
+                self.package_tree.refresh()
+
+                # If nothing is selected yet, preselect the first root element so
+                # the property editor, diagram and hierarchy panes populate on load.
+                try:
+                    current_selected = self.package_tree.get_selected_element()
+                    if not current_selected:
+                        # Choose the first root element in indexing order
+                        root = next(self.arxml_model.element_index.iter_roots(), None)
+                        if root is not None:
+                            self.package_tree.expand_to_path(root.path)
+                except Exception:
+                    # Be defensive: do not let UI population errors break loading
+                    logger.exception("Failed to preselect root element")
+            finally:
+                self.package_tree.setUpdatesEnabled(True)
 
             self.file_opened.emit(str(file_path))
             self.status_bar.showMessage(f"File loaded: {file_path.name}", 3000)
         else:
             # Show a non-fatal warning for load failures (parsing/indexing issues)
-            logging.getLogger(__name__).warning("Failed to load file: %s", file_path)
+            logger.warning("Failed to load file: %s", file_path)
             self.status_bar.showMessage(f"Failed to load file: {file_path.name}", 5000)
             QMessageBox.warning(self, "Load Error", f"Failed to load file: {file_path}")
     
+    def _on_parse_error(self, file_path: Path, error_message: str):
+        """Handle a file that failed the well-formedness check."""
+        self._hide_progress()
+        # Show a non-fatal warning; the heavy load was not started
+        self.status_bar.showMessage(f"Failed to load (not well-formed): {file_path.name}", 8000)
+        QMessageBox.warning(
+            self,
+            "Invalid ARXML",
+            f"File is not well-formed XML and was not loaded:\n{file_path}\n\nParse error: {error_message}"
+        )
+    
     def _on_load_error(self, error_message: str):
         """Handle load error."""
         self._hide_progress()
         # Log and display a non-fatal warning so startup isn't blocked by a modal
-        logging.getLogger(__name__).warning("Load error: %s", error_message)
+        logger.warning("Load error: %s", error_message)
         self.status_bar.showMessage("Error loading file", 5000)
         QMessageBox.warning(self, "Load Error", error_message)
     
@@ -507,10 +529,48 @@ class MainWindow(QMainWindow):
         """Handle file saved signal."""
         pass  # Implement if needed
     
+    def _on_model_changed(self, path: str):
+        """Mark the document as modified after an edit."""
+        if not self.is_modified:
+            self.is_modified = True
+            self._update_window_title()
+    
     def _on_element_selected(self, path: str):
-        """Handle element selection."""
+        """Queue a selection; only the last one of a burst is shown."""
+        self._pending_selection = path
+        self._select_timer.start()
+    
+    def _flush_selection(self):
+        """Show the pending selection in all panels."""
+        path, self._pending_selection = self._pending_selection, None
+        if path is None:
+            return
+        self._selected_path = path
+        self.property_editor.set_element(path)
+        for panel in (self.diagram_view, self.hierarchy_view):
+            if panel.isHidden():
+                self._stale_panels.add(panel)
+            else:
+                panel.set_element(path)
         self.element_selected.emit(path)
     
+    def _update_validation_panel(self, errors):
+        """Show validation results, or keep them until the panel is shown."""
+        if self.validation_panel.isHidden():
+            self._pending_errors = errors
+        else:
+            self.validation_panel.update_errors(errors)
+    
+    def _on_panel_shown(self, panel: QWidget):
+        """Bring a panel up to date with updates it skipped while hidden."""
+        if panel is self.validation_panel:
+            if self._pending_errors is not None:
+                errors, self._pending_errors = self._pending_errors, None
+                panel.update_errors(errors)
+        elif panel in self._stale_panels:
+            self._stale_panels.discard(panel)
+            panel.set_element(self._selected_path)
+    
     def _toggle_package_tree(self):
         """Toggle package tree visibility."""
         is_visible = self.package_tree.isVisible()
@@ -522,12 +582,16 @@ class MainWindow(QMainWindow):
         is_visible = self.hierarchy_view.isVisible()
         self.hierarchy_view.setVisible(not is_visible)
         self.hierarchy_toggle_action.setChecked(not is_visible)
+        if not is_visible:
+            self._on_panel_shown(self.hierarchy_view)
     
     def _toggle_validation_panel(self):
         """Toggle validation panel visibility."""
         is_visible = self.validation_panel.isVisible()
         self.validation_panel.setVisible(not is_visible)
         self.validation_toggle_action.setChecked(not is_visible)
+        if not is_visible:
+            self._on_panel_shown(self.validation_panel)
     
     def _sync_diagram_toggle(self):
         """Sync diagram toggle actions between menu and toolbar."""
@@ -536,6 +600,8 @@ class MainWindow(QMainWindow):
         self.diagram_toolbar_action.setChecked(is_checked)
         
         self.diagram_view.setVisible(is_checked)
+        if is_checked:
+            self._on_panel_shown(self.diagram_view)
     
     def _reset_layout(self):
         """Reset the layout to default proportions."""
@@ -551,6 +617,8 @@ class MainWindow(QMainWindow):
         self.property_editor.setVisible(True)
         self.diagram_view.setVisible(True)
         self.validation_panel.setVisible(True)
+        for panel in (self.hierarchy_view, self.diagram_view, self.validation_panel):
+            self._on_panel_shown(panel)
         
         # Update toggle actions
         self.package_tree_toggle_action.setChecked(True)
@@ -584,6 +652,31 @@ class MainWindow(QMainWindow):
             # Fallback to default geometry
             self.setGeometry(100, 100, 1600, 1000)
     
+    def _restore_window_state(self):
+        """Restore geometry and panel layout from the last session, if saved."""
+        settings = QSettings(_SETTINGS_ORGANIZATION, _SETTINGS_APPLICATION)
+        geometry = settings.value("geometry")
+        if geometry is None or not self.restoreGeometry(geometry):
+            self._setup_window_geometry()
+        
+        window_state = settings.value("windowState")
+        if window_state is not None:
+            self.restoreState(window_state)
+        
+        for key, splitter in (("verticalSplitter", self.main_vertical_splitter),
+                              ("horizontalSplitter", self.main_horizontal_splitter)):
+            splitter_state = settings.value(key)
+            if splitter_state is not None:
+                splitter.restoreState(splitter_state)
+    
+    def _save_window_state(self):
+        """Save geometry and panel layout for the next session."""
+        settings = QSettings(_SETTINGS_ORGANIZATION, _SETTINGS_APPLICATION)
+        settings.setValue("geometry", self.saveGeometry())
+        settings.setValue("windowState", self.saveState())
+        settings.setValue("verticalSplitter", self.main_vertical_splitter.saveState())
+        settings.setValue("horizontalSplitter", self.main_horizontal_splitter.saveState())
+    
     def changeEvent(self, event):
         """Handle window state changes."""
         from PySide6.QtCore import QEvent
@@ -606,19 +699,18 @@ class MainWindow(QMainWindow):
         """Validate the current model."""
         self._show_progress("Validating...")
         
-        # Run validation in background
-        self.validation_thread = ValidationThread(self.arxml_model)
-        self.validation_thread.validation_completed.connect(self._on_validation_completed)
-        self.validation_thread.start()
+        # Run validation on a pooled worker thread
+        self.validation_task = ValidationRunnable(self.arxml_model)
+        self.validation_task.signals.validation_completed.connect(
+            self._on_validation_completed, Qt.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(self.validation_task)
     
-    def _on_validation_completed(self, errors):
+    def _on_validation_completed(self, errors, error_count: int, warning_count: int):
         """Handle validation completion."""
         self._hide_progress()
         self.validation_completed.emit(errors)
         
-        error_count = len([e for e in errors if e.level.value == "error"])
-        warning_count = len([e for e in errors if e.level.value == "warning"])
-        
         self.status_bar.showMessage(
             f"Validation complete: {error_count} errors, {warning_count} warnings", 5000
         )
@@ -663,17 +755,29 @@ class MainWindow(QMainWindow):
         )
     
     def _show_welcome_message(self):
-        """Show welcome message."""
-        QMessageBox.information(
-            self, "Welcome to ARXML Editor",
+        """Show welcome message without blocking the event loop.
+        
+        Only shown on the first start; returning users go straight to work.
+        """
+        settings = QSettings(_SETTINGS_ORGANIZATION, _SETTINGS_APPLICATION)
+        if settings.value("welcomeShown", False, type=bool):
+            return
+        settings.setValue("welcomeShown", True)
+        
+        message_box = QMessageBox(
+            QMessageBox.Information, "Welcome to ARXML Editor",
             "Welcome to ARXML Editor!\n\n"
             "To get started:\n"
             "1. Open an ARXML file using File > Open\n"
             "2. Navigate the package tree on the left\n"
             "3. Edit properties in the center panel\n"
             "4. View diagrams on the right\n"
-            "5. Check validation results at the bottom"
+            "5. Check validation results at the bottom",
+            QMessageBox.Ok, self
         )
+        message_box.setModal(False)
+        message_box.setAttribute(Qt.WA_DeleteOnClose)
+        message_box.show()
     
     def _check_unsaved_changes(self) -> bool:
         """Check for unsaved changes and prompt user."""
@@ -719,51 +823,86 @@ class MainWindow(QMainWindow):
             self.schema_label.setText("")
     
     def _show_progress(self, message: str):
-        """Show progress bar."""
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        """Show progress dialog."""
+        self._progress_dlg.setLabelText(message)
+        self._progress_dlg.show()
         self.status_bar.showMessage(message)
     
     def _hide_progress(self):
-        """Hide progress bar."""
-        self.progress_bar.setVisible(False)
+        """Hide progress dialog."""
+        self._progress_dlg.reset()
     
     def closeEvent(self, event):
         """Handle window close event."""
         if self._check_unsaved_changes():
+            self._save_window_state()
             event.accept()
         else:
             event.ignore()
 
 
-class LoadFileThread(QThread):
-    """Thread for loading ARXML files."""
+class LoadFileSignals(QObject):
+    """Signals emitted by LoadFileRunnable."""
     
     file_loaded = Signal(Path, bool)
+    parse_error = Signal(Path, str)
     error_occurred = Signal(str)
+
+
+class LoadFileRunnable(QRunnable):
+    """Task for loading ARXML files on the global thread pool."""
     
-    def __init__(self, file_path: Path, arxml_model: ARXMLModel):
+    def __init__(self, file_path: Path, arxml_model: ARXMLModel, validate_first: bool = True):
         super().__init__()
         self.file_path = file_path
         self.arxml_model = arxml_model
+        self.validate_first = validate_first
+        # Created on the GUI thread, so connected slots run there
+        self.signals = LoadFileSignals()
+        # The window keeps the task, and with it the signals, alive
+        self.setAutoDelete(False)
     
     def run(self):
         """Load file in background thread."""
+        # Optional lightweight validation to catch common parse errors early
+        if self.validate_first:
+            try:
+                _probe_xml(self.file_path)
+            except expat.ExpatError as pe:
+                logger.warning("Quick-parse failed for %s: %s", self.file_path, pe)
+                self.signals.parse_error.emit(self.file_path, str(pe))
+                return
+            except Exception as e:
+                # Any IO or unexpected error should be logged but not crash
+                logger.warning("Could not pre-validate file %s: %s", self.file_path, e)
+        
         try:
             success = self.arxml_model.load_file(self.file_path)
-            self.file_loaded.emit(self.file_path, success)
+            self.signals.file_loaded.emit(self.file_path, success)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
 
 
-class ValidationThread(QThread):
-    """Thread for running validation."""
+class ValidationSignals(QObject):
+    """Signals emitted by ValidationRunnable."""
     
-    validation_completed = Signal(list)
+    validation_completed = Signal(list, int, int)
+
+
+class ValidationRunnable(QRunnable):
+    """Task for running validation on the global thread pool.
+    
+    Results are emitted with their error and warning counts, so the GUI
+    thread does not have to walk the list.
+    """
     
     def __init__(self, arxml_model: ARXMLModel):
         super().__init__()
         self.arxml_model = arxml_model
+        # Created on the GUI thread, so connected slots run there
+        self.signals = ValidationSignals()
+        # The window keeps the task, and with it the signals, alive
+        self.setAutoDelete(False)
     
     def run(self):
         """Run validation in background thread."""
@@ -775,7 +914,7 @@ class ValidationThread(QThread):
                 self.arxml_model.reference_manager
             )
             errors = validator.validate_all()
-            self.validation_completed.emit(errors)
+            self._emit_results(errors)
         except Exception as e:
             # Return error as validation result
             from ..validation.types import ValidationError, ValidationLevel
@@ -784,4 +923,15 @@ class ValidationThread(QThread):
                 message=f"Validation failed: {str(e)}",
                 level=ValidationLevel.ERROR
             )
-            self.validation_completed.emit([error])
\ No newline at end of file
+            self._emit_results([error])
+    
+    def _emit_results(self, errors):
+        """Count errors and warnings in one pass and emit the results."""
+        error_count = warning_count = 0
+        for error in errors:
+            level = error.level.value
+            if level == "error":
+                error_count += 1
+            elif level == "warning":
+                warning_count += 1
+        self.signals.validation_completed.emit(errors, error_count, warning_count)
\ No newline at end of file
@@ -337,12 +337,19 @@ class PropertyEditorWidget(QWidget):
         self.path_label.setText(element.path)
         self.file_label.setText(element.file_path or "Unknown")
         
-        # Text content
-        text_content = element.element.text or ""
-        self.text_content_edit.setText(text_content)
-        
-        # Attributes
-        self._populate_attributes()
+        # Showing an element is not an edit, so keep the change handlers quiet
+        self.text_content_edit.blockSignals(True)
+        self.attributes_table.blockSignals(True)
+        try:
+            # Text content
+            text_content = element.element.text or ""
+            self.text_content_edit.setText(text_content)
+            
+            # Attributes
+            self._populate_attributes()
+        finally:
+            self.text_content_edit.blockSignals(False)
+            self.attributes_table.blockSignals(False)
         
         # Child elements
         self._populate_children()
@@ -457,6 +464,7 @@ class PropertyEditorWidget(QWidget):
         attr_value = value_item.text()
         
         XMLUtils.set_element_attribute(self.current_element.element, attr_name, attr_value)
+        self.arxml_model.element_index.refresh_reference(self.current_element.path)
         
         # Mark as modified
         self.arxml_model.is_modified = True
@@ -471,6 +479,7 @@ class PropertyEditorWidget(QWidget):
         
         new_text = self.text_content_edit.toPlainText()
         XMLUtils.set_element_text(self.current_element.element, new_text)
+        self.arxml_model.element_index.refresh_reference(self.current_element.path)
         
         # Mark as modified
         self.arxml_model.is_modified = True
@@ -483,18 +492,22 @@ class PropertyEditorWidget(QWidget):
         if not self.current_element:
             return
         
+        changed = False
+        
         # Update SHORT-NAME
         new_short_name = self.short_name_edit.text()
         if new_short_name != self.current_element.short_name:
             XMLUtils.set_short_name(self.current_element.element, new_short_name)
             # Update index
             self.arxml_model.element_index.update_element(self.current_element.path, self.current_element.element)
+            changed = True
         
         # Update LONG-NAME
         new_long_name = self.long_name_edit.text()
         current_long_name = XMLUtils.get_long_name(self.current_element.element)
         if new_long_name != current_long_name:
             XMLUtils.set_long_name(self.current_element.element, new_long_name)
+            changed = True
         
         # Update UUID
         new_uuid = self.uuid_edit.text()
@@ -502,6 +515,10 @@ class PropertyEditorWidget(QWidget):
             XMLUtils.set_element_attribute(self.current_element.element, "UUID", new_uuid)
             # Update index
             self.arxml_model.element_index.update_element(self.current_element.path, self.current_element.element)
+            changed = True
+        
+        if not changed:
+            return
         
         # Mark as modified
         self.arxml_model.is_modified = True
@@ -538,6 +555,7 @@ class PropertyEditorWidget(QWidget):
             # Add to element
             if self.current_element:
                 XMLUtils.set_element_attribute(self.current_element.element, attr_name, attr_value)
+                self.arxml_model.element_index.refresh_reference(self.current_element.path)
                 self.element_modified.emit(self.current_element.path)
     
     def _remove_attribute(self):
@@ -549,6 +567,7 @@ class PropertyEditorWidget(QWidget):
             # Remove from element
             if self.current_element and attr_name in self.current_element.element.attrib:
                 del self.current_element.element.attrib[attr_name]
+                self.arxml_model.element_index.refresh_reference(self.current_element.path)
                 self.element_modified.emit(self.current_element.path)
             
             # Remove from table
@@ -168,8 +168,12 @@ class XMLUtils:
         return "/" + "/".join(path_parts)
     
     @staticmethod
-    def validate_xml_structure(element: ET.Element) -> List[str]:
-        """Basic XML structure validation."""
+    def validate_xml_structure(element: ET.Element, recursive: bool = True) -> List[str]:
+        """Basic XML structure validation.
+        
+        With ``recursive=False`` only the element itself is checked, which lets
+        callers that already walk the tree avoid visiting subtrees twice.
+        """
         errors = []
         
         # Check for empty tags with both text and children
@@ -183,7 +187,8 @@ class XMLUtils:
                 errors.append(f"Element {element.tag} missing required SHORT-NAME")
         
         # Recursively check children
-        for child in element:
-            errors.extend(XMLUtils.validate_xml_structure(child))
+        if recursive:
+            for child in element:
+                errors.extend(XMLUtils.validate_xml_structure(child))
         
         return errors
\ No newline at end of file
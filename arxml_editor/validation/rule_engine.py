@@ -307,7 +307,7 @@ class RuleEngine:
         errors = []
         
         if element_info.is_reference:
-            ref_value, dest = XMLUtils.get_reference_value(element_info.element)
+            ref_value, dest = element_info.ref_value, element_info.reference_dest
             if ref_value:
                 # Check if reference resolves
                 if dest == "DEST":
@@ -337,7 +337,7 @@ class RuleEngine:
         errors = []
         
         if element_info.is_reference:
-            ref_value, dest = XMLUtils.get_reference_value(element_info.element)
+            ref_value, dest = element_info.ref_value, element_info.reference_dest
             if ref_value:
                 # Find target element
                 target_element = None
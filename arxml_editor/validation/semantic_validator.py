@@ -4,8 +4,10 @@ Semantic validation for ARXML files.
 Validates business rules and semantic constraints beyond XSD validation.
 """
 
-from typing import List, Set, Dict, Optional
-from collections import defaultdict
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, List, Set, Dict, Optional, Tuple
 
 from .types import ValidationError, ValidationLevel
 from ..core.element_index import ElementInfo
@@ -14,30 +16,127 @@ from ..utils.xml_utils import XMLUtils
 from ..utils.path_utils import PathUtils
 
 
+# The checks are pure Python, so threads only pay off without the GIL
+# (free-threaded builds); with it they are slower than running in sequence
+_PARALLEL_CHECKS = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Error constructors per rule, with the level and rule id already bound
+_UNI001 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="UNI001")
+_REF001 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF001")
+_REF002 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF002")
+_REF003 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF003")
+_REF004 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF004")
+_REF005 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF005")
+_REF006 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF006")
+_REF007 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="REF007")
+_STR001 = partial(ValidationError, level=ValidationLevel.WARNING, rule_id="STR001")
+_STR002 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="STR002")
+_STR003 = partial(ValidationError, level=ValidationLevel.WARNING, rule_id="STR003")
+_ATTR001 = partial(ValidationError, level=ValidationLevel.ERROR, rule_id="ATTR001")
+_ECUC001 = partial(ValidationError, level=ValidationLevel.WARNING, rule_id="ECUC001")
+_PKG001 = partial(ValidationError, level=ValidationLevel.WARNING, rule_id="PKG001")
+
+# Metadata elements that are not checked for SHORT-NAME uniqueness
+_SKIP_UNIQUENESS_TYPES = frozenset({"SHORT-NAME", "LONG-NAME"})
+
+# Required child elements per element type. Tuples keep the error order stable.
+_REQUIRED_CHILDREN: Dict[str, tuple] = {
+    "AR-PACKAGE": ("SHORT-NAME",),
+    "ELEMENT": ("SHORT-NAME",),
+    "CONTAINER": ("SHORT-NAME",),
+    "PARAMETER": ("SHORT-NAME",),
+    "REF": ()  # REF elements don't require children
+}
+
+# Element types that must not be empty
+_CONTENT_REQUIRED_TYPES = frozenset({"SHORT-NAME", "LONG-NAME", "VALUE"})
+
+# Valid parent-child relationships
+_VALID_CHILDREN: Dict[str, frozenset] = {
+    "AUTOSAR": frozenset({"AR-PACKAGES"}),
+    "AR-PACKAGES": frozenset({"AR-PACKAGE"}),
+    "AR-PACKAGE": frozenset({"SHORT-NAME", "LONG-NAME", "ELEMENTS"}),
+    "ELEMENTS": frozenset({"ELEMENT"}),
+    "ELEMENT": frozenset({"SHORT-NAME", "LONG-NAME", "REF", "DEST"})
+}
+
+# Element types with type specific rules
+_RULE_TYPES = ("AR-PACKAGE", "ELEMENT", "CONTAINER", "PARAMETER", "REF")
+
+
+def _describe_cycle(component: List[str]) -> str:
+    """Render a reference cycle component as 'A -> B -> A', eliding long ones."""
+    if len(component) > 3:
+        return " -> ".join(component[:3] + ["…"])
+    return " -> ".join(component + component[:1])
+
+
 class SemanticValidator:
     """Validates semantic rules and business constraints."""
     
     def __init__(self, element_index, reference_manager):
         self.element_index = element_index
         self.reference_manager = reference_manager
+        
+        # Elements grouped by type, shared by the business rule checks
+        self._type_index: Dict[str, List[ElementInfo]] = {}
+        self._build_type_index()
+        
+        # Per parent path: (element type, SHORT-NAME) -> children. Valid for
+        # one ElementIndex generation only.
+        self._sibling_name_cache: Dict[str, Dict[Tuple[str, str], List[ElementInfo]]] = {}
+        self._sibling_cache_generation = -1
+    
+    def _build_type_index(self) -> None:
+        """Group all indexed elements by type in a single pass."""
+        type_index: Dict[str, List[ElementInfo]] = {}
+        for element_info in self.element_index.get_all_elements():
+            bucket = type_index.get(element_info.element_type)
+            if bucket is None:
+                type_index[element_info.element_type] = [element_info]
+            else:
+                bucket.append(element_info)
+        self._type_index = type_index
     
     def validate_all(self) -> List[ValidationError]:
         """Validate all semantic rules."""
+        if not _PARALLEL_CHECKS:
+            return list(self.iter_errors())
+        
         errors = []
         
-        # Uniqueness validation
-        errors.extend(self._validate_uniqueness())
+        # The index may have changed since the last run
+        self._build_type_index()
         
-        # Reference integrity validation
-        errors.extend(self._validate_reference_integrity())
+        # The checks only read the index, so they can run side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(list, check()) for check in self._checks()]
+            # Collect in submission order so the error list is deterministic
+            for future in futures:
+                errors.extend(future.result())
         
-        # Structural validation
-        errors.extend(self._validate_structure())
+        return errors
+    
+    def iter_errors(self) -> Iterator[ValidationError]:
+        """Yield the errors of all semantic rules as they are found.
         
-        # Business rule validation
-        errors.extend(self._validate_business_rules())
+        Same errors in the same order as ``validate_all``. Consumers that stop
+        iterating early (e.g. to cap a display or cancel) skip the remaining work.
+        """
+        # The index may have changed since the last run
+        self._build_type_index()
         
-        return errors
+        for check in self._checks():
+            yield from check
+    
+    def _checks(self) -> Tuple[Iterator[ValidationError], ...]:
+        """Uniqueness, reference integrity, structural and business rule validation."""
+        return (
+            self._validate_uniqueness(),
+            self._validate_reference_integrity(),
+            self._validate_structure(),
+            self._validate_business_rules()
+        )
     
     def validate_element(self, element_info: ElementInfo) -> List[ValidationError]:
         """Validate semantic rules for specific element."""
@@ -55,107 +154,85 @@ class SemanticValidator:
         
         return errors
     
-    def _validate_uniqueness(self) -> List[ValidationError]:
+    def _validate_uniqueness(self) -> Iterator[ValidationError]:
         """Validate uniqueness constraints."""
-        errors = []
-        
-        # Group elements by parent and type
-        parent_groups = defaultdict(lambda: defaultdict(list))
-        
-        for element_info in self.element_index.get_all_elements():
-            if element_info.parent_path is not None:
-                parent_groups[element_info.parent_path][element_info.element_type].append(element_info)
-        
-        # Check uniqueness within each group
-        for parent_path, type_groups in parent_groups.items():
-            for element_type, elements in type_groups.items():
-                if element_type in ["SHORT-NAME", "LONG-NAME"]:
-                    continue  # Skip metadata elements
-                
-                # Check SHORT-NAME uniqueness
-                short_names = defaultdict(list)
-                for element in elements:
-                    if element.short_name:
-                        short_names[element.short_name].append(element)
-                
-                for short_name, elements_with_name in short_names.items():
-                    if len(elements_with_name) > 1:
-                        for element in elements_with_name:
-                            errors.append(ValidationError(
-                                path=element.path,
-                                message=f"Duplicate SHORT-NAME '{short_name}' in {element_type}",
-                                level=ValidationLevel.ERROR,
-                                rule_id="UNI001"
-                            ))
-        
-        return errors
+        # Duplicate groups come back in index order of their first element
+        for group in self.element_index.find_duplicate_groups(_SKIP_UNIQUENESS_TYPES):
+            element_type = group[0].element_type
+            short_name = group[0].short_name
+            for element in group:
+                yield _UNI001(
+                    path=element.path,
+                    message=f"Duplicate SHORT-NAME '{short_name}' in {element_type}"
+                )
     
-    def _validate_reference_integrity(self) -> List[ValidationError]:
+    def _validate_reference_integrity(self) -> Iterator[ValidationError]:
         """Validate reference integrity."""
-        errors = []
+        # A source can hold several entries for the same rule (e.g. after its
+        # target was edited); report each (source, rule) pair only once
+        seen: Set[Tuple[str, str]] = set()
         
         # Check for unresolved references
         unresolved_refs = self.reference_manager.get_unresolved_references()
         for ref in unresolved_refs:
-            errors.append(ValidationError(
+            key = (ref.source_path, "REF001")
+            if key in seen:
+                continue
+            seen.add(key)
+            yield _REF001(
                 path=ref.source_path,
-                message=f"Unresolved reference: {ref.target_path}",
-                level=ValidationLevel.ERROR,
-                rule_id="REF001"
-            ))
+                message=f"Unresolved reference: {ref.target_path}"
+            )
         
         # Check for invalid references
         invalid_refs = self.reference_manager.get_invalid_references()
         for ref in invalid_refs:
-            errors.append(ValidationError(
+            key = (ref.source_path, "REF002")
+            if key in seen:
+                continue
+            seen.add(key)
+            yield _REF002(
                 path=ref.source_path,
-                message=f"Invalid reference: {ref.error_message}",
-                level=ValidationLevel.ERROR,
-                rule_id="REF002"
-            ))
-        
-        # Check for circular references
-        cycles = self.reference_manager.find_reference_cycles()
-        for cycle in cycles:
-            errors.append(ValidationError(
-                path=cycle[0],
-                message=f"Circular reference detected: {' -> '.join(cycle)}",
-                level=ValidationLevel.ERROR,
-                rule_id="REF003"
-            ))
-        
-        return errors
+                message=f"Invalid reference: {ref.error_message}"
+            )
+        
+        # Check for circular references, once per group of mutually referencing
+        # elements; rotations of the same cycle are already folded together
+        for component in self.reference_manager.find_reference_sccs():
+            yield _REF003(
+                path=component[0],
+                message=f"Circular reference detected: {_describe_cycle(component)}"
+            )
     
-    def _validate_structure(self) -> List[ValidationError]:
+    def _validate_structure(self) -> Iterator[ValidationError]:
         """Validate structural constraints."""
-        errors = []
-        
+        # Parent path -> parent type for the types with hierarchy rules, taken
+        # from the type index so the check needs no ElementInfo lookup
+        parent_types: Dict[str, str] = {}
+        for parent_type in _VALID_CHILDREN:
+            for parent_info in self._type_index.get(parent_type, ()):
+                parent_types[parent_info.path] = parent_type
+        
+        # One fused pass: required children, hierarchy and attribute constraints.
+        # Errors are collected per element and handed on right away.
+        errors: List[ValidationError] = []
+        validate_element_structural = self._validate_element_structural
         for element_info in self.element_index.get_all_elements():
-            # Check required children
-            errors.extend(self._validate_required_children(element_info))
-            
-            # Check element hierarchy
-            errors.extend(self._validate_element_hierarchy(element_info))
-            
-            # Check attribute constraints
-            errors.extend(self._validate_attribute_constraints(element_info))
-        
-        return errors
+            validate_element_structural(element_info, parent_types, errors)
+            if errors:
+                yield from errors
+                errors.clear()
     
-    def _validate_business_rules(self) -> List[ValidationError]:
+    def _validate_business_rules(self) -> Iterator[ValidationError]:
         """Validate AUTOSAR business rules."""
-        errors = []
-        
         # ECUC validation
-        errors.extend(self._validate_ecuc_rules())
+        yield from self._validate_ecuc_rules()
         
         # Package structure validation
-        errors.extend(self._validate_package_structure())
+        yield from self._validate_package_structure()
         
         # Element type specific validation
-        errors.extend(self._validate_element_type_rules())
-        
-        return errors
+        yield from self._validate_element_type_rules()
     
     def _validate_element_uniqueness(self, element_info: ElementInfo) -> List[ValidationError]:
         """Validate uniqueness for specific element."""
@@ -164,34 +241,51 @@ class SemanticValidator:
         if not element_info.short_name or not element_info.parent_path:
             return errors
         
-        # Find siblings with same type
-        siblings = self.element_index.get_children(element_info.parent_path)
-        same_type_siblings = [s for s in siblings if s.element_type == element_info.element_type and s.path != element_info.path]
+        # Find siblings with same type and SHORT-NAME
+        sibling_names = self._get_sibling_names(element_info.parent_path)
+        same_name_siblings = sibling_names.get((element_info.element_type, element_info.short_name), ())
         
         # Check for duplicate SHORT-NAME
-        for sibling in same_type_siblings:
-            if sibling.short_name == element_info.short_name:
-                errors.append(ValidationError(
+        for sibling in same_name_siblings:
+            if sibling.path != element_info.path:
+                errors.append(_UNI001(
                     path=element_info.path,
-                    message=f"Duplicate SHORT-NAME '{element_info.short_name}' in {element_info.element_type}",
-                    level=ValidationLevel.ERROR,
-                    rule_id="UNI001"
+                    message=f"Duplicate SHORT-NAME '{element_info.short_name}' in {element_info.element_type}"
                 ))
                 break
         
         return errors
     
+    def _get_sibling_names(self, parent_path: str) -> Dict[Tuple[str, str], List[ElementInfo]]:
+        """Get the children of a parent keyed by (element type, SHORT-NAME)."""
+        if self._sibling_cache_generation != self.element_index.generation:
+            self._sibling_name_cache.clear()
+            self._sibling_cache_generation = self.element_index.generation
+        
+        sibling_names = self._sibling_name_cache.get(parent_path)
+        if sibling_names is None:
+            sibling_names = {}
+            for sibling in self.element_index.get_children(parent_path):
+                key = (sibling.element_type, sibling.short_name)
+                group = sibling_names.get(key)
+                if group is None:
+                    sibling_names[key] = [sibling]
+                else:
+                    group.append(sibling)
+            self._sibling_name_cache[parent_path] = sibling_names
+        
+        return sibling_names
+    
     def _validate_element_reference(self, element_info: ElementInfo) -> List[ValidationError]:
         """Validate reference element."""
         errors = []
         
-        ref_value, dest = XMLUtils.get_reference_value(element_info.element)
+        # Read once at index time instead of from the XML on every check
+        ref_value, dest = element_info.ref_value, element_info.reference_dest
         if not ref_value:
-            errors.append(ValidationError(
+            errors.append(_REF004(
                 path=element_info.path,
-                message="Reference element has empty value",
-                level=ValidationLevel.ERROR,
-                rule_id="REF004"
+                message="Reference element has empty value"
             ))
             return errors
         
@@ -199,20 +293,16 @@ class SemanticValidator:
         if dest == "DEST":
             target_element = self.element_index.get_element_by_path(ref_value)
             if not target_element:
-                errors.append(ValidationError(
+                errors.append(_REF005(
                     path=element_info.path,
-                    message=f"Referenced path not found: {ref_value}",
-                    level=ValidationLevel.ERROR,
-                    rule_id="REF005"
+                    message=f"Referenced path not found: {ref_value}"
                 ))
         else:
             target_element = self.element_index.get_element_by_uuid(ref_value)
             if not target_element:
-                errors.append(ValidationError(
+                errors.append(_REF006(
                     path=element_info.path,
-                    message=f"Referenced UUID not found: {ref_value}",
-                    level=ValidationLevel.ERROR,
-                    rule_id="REF006"
+                    message=f"Referenced UUID not found: {ref_value}"
                 ))
         
         return errors
@@ -221,108 +311,68 @@ class SemanticValidator:
         """Validate element structure."""
         errors = []
         
-        # Check for empty elements that should have content
-        if not element_info.element.text and len(element_info.element) == 0:
-            if element_info.element_type in ["SHORT-NAME", "LONG-NAME", "VALUE"]:
-                errors.append(ValidationError(
+        # Check for empty elements that should have content. Only a few types
+        # need content, so test the type before touching the element.
+        if element_info.element_type in _CONTENT_REQUIRED_TYPES:
+            element = element_info.element
+            if not element.text and len(element) == 0:
+                errors.append(_STR001(
                     path=element_info.path,
-                    message=f"Element {element_info.element_type} should not be empty",
-                    level=ValidationLevel.WARNING,
-                    rule_id="STR001"
+                    message=f"Element {element_info.element_type} should not be empty"
                 ))
         
         return errors
     
-    def _validate_required_children(self, element_info: ElementInfo) -> List[ValidationError]:
-        """Validate required child elements."""
-        errors = []
-        
-        # Define required children for common element types
-        required_children = {
-            "AR-PACKAGE": ["SHORT-NAME"],
-            "ELEMENT": ["SHORT-NAME"],
-            "CONTAINER": ["SHORT-NAME"],
-            "PARAMETER": ["SHORT-NAME"],
-            "REF": []  # REF elements don't require children
-        }
-        
+    def _validate_element_structural(self, element_info: ElementInfo,
+                                     parent_types: Dict[str, str],
+                                     errors: List[ValidationError]) -> None:
+        """Check required children, parent-child relationship and attributes of one element.
+        
+        ``parent_types`` maps the paths of parents with hierarchy rules to their type.
+        Errors are appended to ``errors`` directly.
+        """
+        element = element_info.element
         element_type = element_info.element_type
-        if element_type in required_children:
-            required = required_children[element_type]
-            present_children = [child.tag.split('}')[-1] for child in element_info.element]
-            
+        path = element_info.path
+        
+        # Check required children. Most element types have none; skip them
+        # before looking at any child tags.
+        required = _REQUIRED_CHILDREN.get(element_type)
+        if required:
+            # Children share the parent's namespace; an exact-tag find() scans
+            # the children in C and stops at the first match
+            tag = element.tag
+            namespace = tag[:tag.index('}') + 1] if tag[:1] == '{' else ''
             for required_child in required:
-                if required_child not in present_children:
-                    errors.append(ValidationError(
-                        path=element_info.path,
-                        message=f"Missing required child element: {required_child}",
-                        level=ValidationLevel.ERROR,
-                        rule_id="STR002"
+                if element.find(namespace + required_child) is None:
+                    errors.append(_STR002(
+                        path=path,
+                        message=f"Missing required child element: {required_child}"
                     ))
         
-        return errors
-    
-    def _validate_element_hierarchy(self, element_info: ElementInfo) -> List[ValidationError]:
-        """Validate element hierarchy constraints."""
-        errors = []
-        
         # Check for invalid parent-child relationships
-        parent_path = element_info.parent_path
-        if parent_path:
-            parent_element = self.element_index.get_element_by_path(parent_path)
-            if parent_element:
-                # Define valid parent-child relationships
-                valid_children = {
-                    "AUTOSAR": ["AR-PACKAGES"],
-                    "AR-PACKAGES": ["AR-PACKAGE"],
-                    "AR-PACKAGE": ["SHORT-NAME", "LONG-NAME", "ELEMENTS"],
-                    "ELEMENTS": ["ELEMENT"],
-                    "ELEMENT": ["SHORT-NAME", "LONG-NAME", "REF", "DEST"]
-                }
-                
-                parent_type = parent_element.element_type
-                child_type = element_info.element_type
-                
-                if parent_type in valid_children:
-                    if child_type not in valid_children[parent_type]:
-                        errors.append(ValidationError(
-                            path=element_info.path,
-                            message=f"Invalid parent-child relationship: {parent_type} -> {child_type}",
-                            level=ValidationLevel.WARNING,
-                            rule_id="STR003"
-                        ))
-        
-        return errors
-    
-    def _validate_attribute_constraints(self, element_info: ElementInfo) -> List[ValidationError]:
-        """Validate attribute constraints."""
-        errors = []
+        parent_type = parent_types.get(element_info.parent_path)
+        if parent_type is not None and element_type not in _VALID_CHILDREN[parent_type]:
+            errors.append(_STR003(
+                path=path,
+                message=f"Invalid parent-child relationship: {parent_type} -> {element_type}"
+            ))
         
         # Check for required attributes
-        if element_info.element_type == "REF":
-            dest = XMLUtils.get_element_attribute(element_info.element, "DEST")
-            if not dest:
-                errors.append(ValidationError(
-                    path=element_info.path,
-                    message="REF element missing required DEST attribute",
-                    level=ValidationLevel.ERROR,
-                    rule_id="ATTR001"
-                ))
-        
-        return errors
+        if element_type == "REF" and not XMLUtils.get_element_attribute(element, "DEST"):
+            errors.append(_ATTR001(
+                path=path,
+                message="REF element missing required DEST attribute"
+            ))
     
-    def _validate_ecuc_rules(self) -> List[ValidationError]:
+    def _validate_ecuc_rules(self) -> Iterator[ValidationError]:
         """Validate ECUC-specific rules."""
-        errors = []
-        
         # Find ECUC elements
-        ecuc_elements = self.element_index.get_elements_by_type("ECUC-VALUE-COLLECTION")
+        ecuc_elements = self._type_index.get("ECUC-VALUE-COLLECTION", ())
         
         for ecuc_element in ecuc_elements:
             # Validate ECUC structure
-            errors.extend(self._validate_ecuc_structure(ecuc_element))
-        
-        return errors
+            yield from self._validate_ecuc_structure(ecuc_element)
     
     def _validate_ecuc_structure(self, element_info: ElementInfo) -> List[ValidationError]:
         """Validate ECUC element structure."""
@@ -331,62 +381,40 @@ class SemanticValidator:
         # ECUC elements should have proper definition references
         definition_refs = XMLUtils.find_elements_by_tag(element_info.element, "DEFINITION-REF")
         if not definition_refs:
-            errors.append(ValidationError(
+            errors.append(_ECUC001(
                 path=element_info.path,
-                message="ECUC element missing DEFINITION-REF",
-                level=ValidationLevel.WARNING,
-                rule_id="ECUC001"
+                message="ECUC element missing DEFINITION-REF"
             ))
         
         return errors
     
-    def _validate_package_structure(self) -> List[ValidationError]:
+    def _validate_package_structure(self) -> Iterator[ValidationError]:
         """Validate AR package structure."""
-        errors = []
-        
         # Check for proper package hierarchy
-        packages = self.element_index.get_elements_by_type("AR-PACKAGE")
+        packages = self._type_index.get("AR-PACKAGE", ())
         
         for package in packages:
             # Packages should have ELEMENTS
             elements_container = XMLUtils.find_element_by_tag(package.element, "ELEMENTS")
             if not elements_container:
-                errors.append(ValidationError(
+                yield _PKG001(
                     path=package.path,
-                    message="AR-PACKAGE missing ELEMENTS container",
-                    level=ValidationLevel.WARNING,
-                    rule_id="PKG001"
-                ))
-        
-        return errors
+                    message="AR-PACKAGE missing ELEMENTS container"
+                )
     
-    def _validate_element_type_rules(self) -> List[ValidationError]:
+    def _validate_element_type_rules(self) -> Iterator[ValidationError]:
         """Validate element type specific rules."""
-        errors = []
-        
-        # Validate different element types
-        element_types = ["AR-PACKAGE", "ELEMENT", "CONTAINER", "PARAMETER", "REF"]
-        
-        for element_type in element_types:
-            elements = self.element_index.get_elements_by_type(element_type)
-            for element in elements:
-                errors.extend(self._validate_specific_element_type(element, element_type))
-        
-        return errors
-    
-    def _validate_specific_element_type(self, element_info: ElementInfo, element_type: str) -> List[ValidationError]:
-        """Validate specific element type rules."""
-        errors = []
-        
-        if element_type == "REF":
-            # REF elements should have both text content and DEST attribute
-            ref_value, dest = XMLUtils.get_reference_value(element_info.element)
-            if not ref_value:
-                errors.append(ValidationError(
-                    path=element_info.path,
-                    message="REF element missing reference value",
-                    level=ValidationLevel.ERROR,
-                    rule_id="REF007"
-                ))
-        
-        return errors
\ No newline at end of file
+        for element_type in _RULE_TYPES:
+            elements = self._type_index.get(element_type)
+            if not elements:
+                continue
+            
+            # Only REF has type specific rules so far
+            if element_type == "REF":
+                # REF elements should have both text content and DEST attribute
+                for element_info in elements:
+                    if not element_info.ref_value:
+                        yield _REF007(
+                            path=element_info.path,
+                            message="REF element missing reference value"
+                        )
@@ -9,7 +9,7 @@ import xml.etree.ElementTree as ET
 
 from .types import ValidationError, ValidationLevel
 from .xsd_validator import XSDValidator
-from .semantic_validator import SemanticValidator
+from .semantic_validator import SemanticValidator, _describe_cycle
 from .rule_engine import RuleEngine
 from ..core.schema_manager import AUTOSARRelease
 from ..core.element_index import ElementInfo
@@ -161,11 +161,10 @@ class ARXMLValidator:
             ))
         
         # Check for reference cycles
-        cycles = self.reference_manager.find_reference_cycles()
-        for cycle in cycles:
+        for component in self.reference_manager.find_reference_sccs():
             errors.append(ValidationError(
-                path=cycle[0],
-                message=f"Circular reference detected: {' -> '.join(cycle)}",
+                path=component[0],
+                message=f"Circular reference detected: {_describe_cycle(component)}",
                 level=ValidationLevel.ERROR,
                 rule_id="REF003"
             ))
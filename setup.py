@@ -4,7 +4,7 @@ Setup script for ARXML Editor.
 Installs the ARXML Editor package and its dependencies.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 from pathlib import Path
 
 # Read README file
@@ -18,6 +18,18 @@ if requirements_file.exists():
     requirements = requirements_file.read_text(encoding="utf-8").strip().split('\n')
     requirements = [req.strip() for req in requirements if req.strip() and not req.startswith('#')]
 
+# Optional compiled tree indexer; the package falls back to pure Python without it
+ext_modules = []
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("arxml_editor.core._index_fast", ["arxml_editor/core/_index_fast.pyx"],
+                   optional=True)],
+        compiler_directives={"language_level": "3"},
+    )
+except ImportError:
+    pass
+
 setup(
     name="arxml-editor",
     version="0.1.0",
@@ -31,6 +43,7 @@ setup(
     packages=find_packages(),
     python_requires=">=3.9",
     install_requires=requirements,
+    ext_modules=ext_modules,
     extras_require={
         "dev": [
             "pytest>=7.0.0",
@@ -83,7 +83,11 @@ class TestARXMLModel:
             element = model.get_element_by_path("/TestPackage")
             assert element is not None
             assert element.short_name == "TestPackage"
-            
+
+            # Top-level packages are the roots
+            roots = list(model.element_index.iter_roots())
+            assert [root.path for root in roots] == ["/TestPackage"]
+
         finally:
             temp_path.unlink()
     
@@ -205,6 +209,45 @@ class TestARXMLModel:
         finally:
             temp_path.unlink()
     
+    def test_recently_added_tracks_live_elements(self):
+        """Test that edits between loads leave no stale recently added elements."""
+        model = ARXMLModel()
+
+        sample_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.2">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>TestPackage</SHORT-NAME>
+      <ELEMENTS></ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.arxml', delete=False) as f:
+            f.write(sample_content)
+            temp_path = Path(f.name)
+
+        try:
+            model.load_file(temp_path)
+            index = model.element_index
+
+            kept_path = model.create_element("/TestPackage", "ELEMENT", "Kept")
+            removed_path = model.create_element("/TestPackage", "ELEMENT", "Removed")
+            model.delete_element(removed_path)
+
+            # Updating re-adds the element; only the live info is kept
+            kept = index.get_element_by_path(kept_path)
+            index.update_element(kept_path, kept.element)
+            index.update_element(kept_path, kept.element)
+
+            added = index.take_recently_added()
+            assert [info.path for info in added] == [kept_path]
+            assert added[0] is index.get_element_by_path(kept_path)
+            assert index.take_recently_added() == []
+
+        finally:
+            temp_path.unlink()
+
     def test_search_functionality(self):
         """Test element search functionality."""
         model = ARXMLModel()
@@ -245,6 +288,126 @@ class TestARXMLModel:
         finally:
             temp_path.unlink()
 
+    def test_element_tree(self):
+        """Test building the element tree."""
+        model = ARXMLModel()
+
+        sample_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.2">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>TestPackage</SHORT-NAME>
+      <ELEMENTS>
+        <ELEMENT>
+          <SHORT-NAME>TestElement</SHORT-NAME>
+        </ELEMENT>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.arxml', delete=False) as f:
+            f.write(sample_content)
+            temp_path = Path(f.name)
+
+        try:
+            model.load_file(temp_path)
+
+            tree = model.get_element_tree("/TestPackage")
+            assert tree.short_name == "TestPackage"
+
+            children = tree.children
+            assert [child.path for child in children] == ["/TestPackage/TestElement"]
+            assert tree.children is children  # Resolved once, then kept
+            assert children[0].children == []
+
+            # The dict form carries the whole subtree
+            assert tree.to_dict()["children"][0]["path"] == "/TestPackage/TestElement"
+
+            root = model.get_element_tree()
+            assert [child.path for child in root.children] == ["/TestPackage"]
+            assert model.get_element_tree("/Missing") is None
+
+        finally:
+            temp_path.unlink()
+
+    def test_load_multiple_files(self):
+        """Test loading several files at once."""
+        model = ARXMLModel()
+
+        temp_paths = []
+        for package_name in ("PackageA", "PackageB"):
+            sample_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.2">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>{package_name}</SHORT-NAME>
+      <ELEMENTS>
+        <ELEMENT>
+          <SHORT-NAME>TestElement</SHORT-NAME>
+        </ELEMENT>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.arxml', delete=False) as f:
+                f.write(sample_content)
+                temp_paths.append(Path(f.name))
+
+        try:
+            success = model.load_files(temp_paths)
+            assert success
+            assert len(model.files) == 2
+
+            element = model.get_element_by_path("/PackageB/TestElement")
+            assert element is not None
+            assert element.file_path == str(temp_paths[1])
+
+            # Indexed elements must belong to the stored tree
+            root = model.files[temp_paths[1]].root_element
+            assert any(e is element.element for e in root.iter())
+
+        finally:
+            for temp_path in temp_paths:
+                temp_path.unlink()
+
+    def test_reload_replaces_references(self):
+        """Test that reloading a file drops the references of its old contents."""
+        model = ARXMLModel()
+
+        sample_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.2">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>P</SHORT-NAME>
+      <ELEMENTS>
+        <ELEMENT>
+          <SHORT-NAME>E</SHORT-NAME>
+        </ELEMENT>
+        <ELEMENT-REF DEST="DEST">{target}<SHORT-NAME>RA</SHORT-NAME></ELEMENT-REF>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.arxml', delete=False) as f:
+            f.write(sample_content.format(target="/P/E"))
+            temp_path = Path(f.name)
+
+        try:
+            model.load_file(temp_path)
+            references = model.reference_manager.references
+            assert [(key, ref.is_valid) for key, ref in references.items()] == [("/P/RA:/P/E", True)]
+
+            # Reload an edited copy from the same path
+            temp_path.write_text(sample_content.format(target="/P/F"))
+            model.load_file(temp_path)
+            references = model.reference_manager.references
+            assert [(key, ref.is_valid) for key, ref in references.items()] == [("/P/RA:/P/F", False)]
+
+        finally:
+            temp_path.unlink()
+
 
 if __name__ == "__main__":
     # Simple test runner
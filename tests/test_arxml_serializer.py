@@ -0,0 +1,88 @@
+"""
+Tests for ARXML serialization.
+"""
+
+import xml.etree.ElementTree as ET
+from arxml_editor.serialization.arxml_serializer import ARXMLSerializer
+
+
+NS = "http://autosar.org/schema/r4.2"
+
+# camelCase tags, unordered children and attributes, in the AUTOSAR namespace
+SOURCE = f'''<autosar xmlns="{NS}" T="2024" uuid="root-1" dest="X">
+  <arPackages>
+    <arPackage uuid="pkg-1">
+      <elements>
+        <ecucTextualParamValue>
+          <valueRef DEST="ECUC-PARAM">/P/V</valueRef>
+          <definitionRef dest="DEF">/P/D</definitionRef>
+          <shortName>Param</shortName>
+        </ecucTextualParamValue>
+        <element S="s" uuid="el-1">
+          <desc>text</desc>
+          <longName><l4>Name</l4></longName>
+          <shortName>First</shortName>
+          <customThing>x</customThing>
+        </element>
+      </elements>
+      <shortName>Pkg</shortName>
+    </arPackage>
+  </arPackages>
+</autosar>'''
+
+# Output of the separate rename and sort passes the fused walk replaced
+EXPECTED = '''<AUTOSAR t="2024" uuid="root-1" dest="X">
+  <AR-PACKAGES>
+    <AR-PACKAGE uuid="pkg-1">
+      <SHORT-NAME>Pkg</SHORT-NAME>
+      <ELEMENTS>
+        <ELEMENT s="s" uuid="el-1">
+          <SHORT-NAME>First</SHORT-NAME>
+          <LONG-NAME>
+            <L-4>Name</L-4>
+          </LONG-NAME>
+          <DESC>text</DESC>
+          <CUSTOM-THING>x</CUSTOM-THING>
+        </ELEMENT>
+        <ECUC-TEXTUAL-PARAM-VALUE>
+          <SHORT-NAME>Param</SHORT-NAME>
+          <DEFINITION-REF dest="DEF">/P/D</DEFINITION-REF>
+          <VALUE-REF dest="ECUC-PARAM">/P/V</VALUE-REF>
+        </ECUC-TEXTUAL-PARAM-VALUE>
+      </ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+
+class TestARXMLSerializer:
+    """Test cases for ARXMLSerializer."""
+
+    def test_serialize_element_output(self):
+        """Test renaming and sorting produce the established output."""
+        root = ET.fromstring(SOURCE)
+        assert ARXMLSerializer().serialize_element(root) == EXPECTED
+
+    def test_transform_keeps_namespace(self):
+        """Test the tree is renamed and sorted in place with namespaces kept."""
+        root = ET.fromstring(SOURCE)
+        ARXMLSerializer().serialize_element(root)
+
+        assert root.tag == f"{{{NS}}}AUTOSAR"
+        assert list(root.attrib) == ["t", "uuid", "dest"]
+
+        package = root.find(f"{{{NS}}}AR-PACKAGES/{{{NS}}}AR-PACKAGE")
+        assert [child.tag for child in package] == [f"{{{NS}}}SHORT-NAME", f"{{{NS}}}ELEMENTS"]
+
+        element = package.find(f"{{{NS}}}ELEMENTS/{{{NS}}}ELEMENT")
+        assert [child.tag.split("}")[1] for child in element] == [
+            "SHORT-NAME", "LONG-NAME", "DESC", "CUSTOM-THING"
+        ]
+        assert list(element.attrib) == ["s", "uuid"]
+
+    def test_serialize_is_idempotent(self):
+        """Test serializing an already serialized tree changes nothing."""
+        serializer = ARXMLSerializer()
+        root = ET.fromstring(SOURCE)
+        first = serializer.serialize_element(root)
+        assert serializer.serialize_element(root) == first
@@ -0,0 +1,135 @@
+"""
+Tests for the compiled and pure Python ElementIndex implementations.
+"""
+
+import xml.etree.ElementTree as ET
+import pytest
+from arxml_editor.core import element_index as element_index_module
+from arxml_editor.core.element_index import ElementIndex, ElementInfo
+
+
+SAMPLE_CONTENT = '''<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.2">
+  <AR-PACKAGES>
+    <AR-PACKAGE UUID="pkg-1">
+      <SHORT-NAME>Outer</SHORT-NAME>
+      <AR-PACKAGES>
+        <AR-PACKAGE>
+          <SHORT-NAME>Inner</SHORT-NAME>
+          <ELEMENTS>
+            <ELEMENT UUID="el-1">
+              <SHORT-NAME>First</SHORT-NAME>
+              <CONTAINERS>
+                <CONTAINER>
+                  <SHORT-NAME>Deep</SHORT-NAME>
+                </CONTAINER>
+              </CONTAINERS>
+            </ELEMENT>
+            <ELEMENT-REF DEST="DEST">/Outer/Inner/First<SHORT-NAME>Ref</SHORT-NAME></ELEMENT-REF>
+            <ELEMENT>
+              <DESC>Unnamed elements are not indexed</DESC>
+            </ELEMENT>
+          </ELEMENTS>
+        </AR-PACKAGE>
+      </AR-PACKAGES>
+    </AR-PACKAGE>
+    <AR-PACKAGE>
+      <SHORT-NAME>Other</SHORT-NAME>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+
+def _compiled_module():
+    """Return the compiled indexer, skipping the test when it is not built."""
+    return pytest.importorskip("arxml_editor.core._index_fast")
+
+
+def _use_implementation(monkeypatch, compiled):
+    """Select the compiled module's functions, or the Python fallback for None."""
+    monkeypatch.setattr(element_index_module, "_index_tree_fast",
+                        compiled.index_tree if compiled else None)
+    monkeypatch.setattr(element_index_module, "_group_duplicates_fast",
+                        compiled.group_duplicates if compiled else None)
+
+
+def _index_snapshot(root):
+    """Index ``root`` and return everything the index recorded per element."""
+    index = ElementIndex()
+    index.index_tree(root, "sample.arxml")
+    return [
+        (info.path, info.short_name, info.uuid, info.parent_path, info.element_type,
+         info.file_path, info.is_reference, info.reference_dest, info.ref_value,
+         info.segments, info.row, id(info.element))
+        for info in index.get_all_elements()
+    ]
+
+
+def _duplicate_groups():
+    """Group a crafted set of infos that share keys under distinct paths."""
+    def info(path, short_name, parent_path, element_type):
+        return ElementInfo(element=ET.Element(element_type or "X"), path=path,
+                           short_name=short_name, parent_path=parent_path,
+                           element_type=element_type)
+
+    index = ElementIndex()
+    index.merge([
+        info("/P/A#1", "A", "/P", "ELEMENT"),
+        info("/P/B#1", "B", "/P", "ELEMENT"),
+        info("/P/A#2", "A", "/P", "ELEMENT"),
+        info("/P/A#3", "A", "/P", "CONTAINER"),
+        info("/Q/A#1", "A", "/Q", "ELEMENT"),
+        info("/P/B#2", "B", "/P", "ELEMENT"),
+        info("/P/A#4", "A", "/P", "ELEMENT"),
+        info("/P/S#1", "S", "/P", "SKIPPED"),
+        info("/P/S#2", "S", "/P", "SKIPPED"),
+        info("/P/N#1", "", "/P", "ELEMENT"),
+        info("/P/N#2", "", "/P", "ELEMENT"),
+        info("/R#1", "R", None, "ELEMENT"),
+        info("/R#2", "R", None, "ELEMENT"),
+    ])
+    groups = index.find_duplicate_groups(frozenset({"SKIPPED"}))
+    return [[element.path for element in group] for group in groups]
+
+
+class TestElementIndexImplementations:
+    """Both indexer implementations must produce the same results."""
+
+    def test_python_index_tree(self, monkeypatch):
+        """Test the pure Python indexer on its own."""
+        _use_implementation(monkeypatch, None)
+        snapshot = _index_snapshot(ET.fromstring(SAMPLE_CONTENT.encode()))
+
+        assert [entry[0] for entry in snapshot] == [
+            "/Outer", "/Outer/Inner", "/Outer/Inner/First", "/Outer/Inner/First/Deep",
+            "/Outer/Inner/Ref", "/Other"
+        ]
+        ref = snapshot[4]
+        assert ref[6:10] == (True, "DEST", "/Outer/Inner/First", ("Outer", "Inner", "Ref"))
+
+    def test_python_duplicate_groups(self, monkeypatch):
+        """Test the pure Python duplicate grouping on its own."""
+        _use_implementation(monkeypatch, None)
+        assert _duplicate_groups() == [
+            ["/P/A#1", "/P/A#2", "/P/A#4"],
+            ["/P/B#1", "/P/B#2"],
+        ]
+
+    def test_compiled_index_tree_matches_python(self, monkeypatch):
+        """Test the compiled indexer records exactly what the Python one does."""
+        compiled = _compiled_module()
+        root = ET.fromstring(SAMPLE_CONTENT.encode())
+
+        _use_implementation(monkeypatch, None)
+        expected = _index_snapshot(root)
+        _use_implementation(monkeypatch, compiled)
+        assert _index_snapshot(root) == expected
+
+    def test_compiled_duplicate_groups_match_python(self, monkeypatch):
+        """Test the compiled duplicate grouping matches the Python one."""
+        compiled = _compiled_module()
+
+        _use_implementation(monkeypatch, None)
+        expected = _duplicate_groups()
+        _use_implementation(monkeypatch, compiled)
+        assert _duplicate_groups() == expected
@@ -0,0 +1,107 @@
+"""
+Tests for reference cycle detection.
+"""
+
+import tempfile
+from pathlib import Path
+from arxml_editor.core.arxml_model import ARXMLModel
+from arxml_editor.validation.validator import ARXMLValidator
+from arxml_editor.validation.semantic_validator import SemanticValidator
+
+
+def _reference(name: str, target: str) -> str:
+    """Return a named path reference element pointing at ``target``."""
+    return f'<ELEMENT-REF DEST="DEST">{target}<SHORT-NAME>{name}</SHORT-NAME></ELEMENT-REF>'
+
+
+class TestReferenceCycles:
+    """Test cases for ReferenceManager.find_reference_sccs and REF003."""
+
+    def setup_method(self):
+        self.temp_paths = []
+
+    def teardown_method(self):
+        for temp_path in self.temp_paths:
+            temp_path.unlink()
+
+    def _load(self, elements: str) -> ARXMLModel:
+        """Load a model whose package P holds ``elements``."""
+        sample_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.2">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>P</SHORT-NAME>
+      <ELEMENTS>{elements}</ELEMENTS>
+    </AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>'''
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.arxml', delete=False) as f:
+            f.write(sample_content)
+            self.temp_paths.append(Path(f.name))
+
+        model = ARXMLModel()
+        assert model.load_file(self.temp_paths[-1])
+        return model
+
+    def _load_mixed(self) -> ARXMLModel:
+        """Load a model with a self-reference, cycles and acyclic chains."""
+        return self._load("".join([
+            # Self-reference
+            _reference("Self", "/P/Self"),
+            # 2-cycle
+            _reference("A", "/P/B"),
+            _reference("B", "/P/A"),
+            # 4-cycle with a chord, one component
+            _reference("C1", "/P/C2"),
+            _reference("C2", "/P/C3"),
+            _reference("C3", "/P/C4"),
+            _reference("C4", "/P/C1"),
+            _reference("Chord", "/P/C3"),
+            # Acyclic chain ending at a plain element
+            _reference("X", "/P/Y"),
+            _reference("Y", "/P/Z"),
+            "<ELEMENT><SHORT-NAME>Z</SHORT-NAME></ELEMENT>",
+            # Chain leading into the 2-cycle, outside of it
+            _reference("Feeder", "/P/A"),
+        ]))
+
+    def test_components_are_found_once(self):
+        """Test each cycle is reported exactly once, acyclic paths never."""
+        sccs = self._load_mixed().reference_manager.find_reference_sccs()
+        assert sorted(sorted(component) for component in sccs) == [
+            ["/P/A", "/P/B"],
+            ["/P/C1", "/P/C2", "/P/C3", "/P/C4"],
+            ["/P/Self"],
+        ]
+
+    def test_component_order_follows_references(self):
+        """Test a component's paths are listed along its references."""
+        for component in self._load_mixed().reference_manager.find_reference_sccs():
+            if len(component) == 4:
+                start = component.index("/P/C1")
+                rotated = component[start:] + component[:start]
+                assert rotated == ["/P/C1", "/P/C2", "/P/C3", "/P/C4"]
+
+    def test_acyclic_chain_is_not_reported(self):
+        """Test that a chain of references without a cycle is not reported."""
+        model = self._load("".join([
+            _reference("X", "/P/Y"),
+            _reference("Y", "/P/Z"),
+            "<ELEMENT><SHORT-NAME>Z</SHORT-NAME></ELEMENT>",
+        ]))
+        assert len(model.reference_manager.references) == 2
+        assert model.reference_manager.find_reference_sccs() == []
+
+    def test_validators_report_ref003_per_component(self):
+        """Test both validators emit one REF003 error per component."""
+        model = self._load_mixed()
+        validator = ARXMLValidator(model.schema_manager, model.element_index, model.reference_manager)
+        semantic = SemanticValidator(model.element_index, model.reference_manager)
+
+        for errors in (validator.validate_references(), semantic.validate_all()):
+            ref003 = [error for error in errors if error.rule_id == "REF003"]
+            assert len(ref003) == 3
+            assert {error.path for error in ref003} <= {
+                "/P/Self", "/P/A", "/P/B", "/P/C1", "/P/C2", "/P/C3", "/P/C4"
+            }
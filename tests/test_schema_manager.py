@@ -0,0 +1,111 @@
+"""
+Tests for AUTOSAR schema version detection.
+"""
+
+import pickle
+from arxml_editor.core import schema_manager as schema_manager_module
+from arxml_editor.core.schema_manager import SchemaManager, AUTOSARRelease, _SNIFF_SIZE
+
+
+def _document(root_start_tag: str, prolog: str = "") -> str:
+    """Return a minimal ARXML document with the given root start tag."""
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+{prolog}{root_start_tag}
+  <AR-PACKAGES></AR-PACKAGES>
+</AUTOSAR>'''
+
+
+class TestSchemaDetection:
+    """Test cases for SchemaManager.detect_schema_version."""
+
+    def setup_method(self):
+        self.schema_manager = SchemaManager()
+
+    def test_str_content(self):
+        """Test detection from str content, answered by the sniffer."""
+        content = _document('<AUTOSAR xmlns="http://autosar.org/schema/r4.1">')
+
+        assert self.schema_manager._sniff_schema_version(content) == AUTOSARRelease.R21_11
+        assert self.schema_manager.detect_schema_version(content) == AUTOSARRelease.R21_11
+
+    def test_bytes_content(self):
+        """Test detection from bytes content with a BOM, answered by the sniffer."""
+        content = b"\xef\xbb\xbf" + _document(
+            "<AUTOSAR xmlns:xsi='http://www.w3.org/2001/XMLSchema-instance'"
+            " xmlns='http://autosar.org/schema/r4.4'>"
+        ).encode("utf-8")
+
+        assert self.schema_manager._sniff_schema_version(content) == AUTOSARRelease.R24_11
+        assert self.schema_manager.detect_schema_version(content) == AUTOSARRelease.R24_11
+
+    def test_prefixed_root(self):
+        """Test that the namespace bound to the root's prefix is used."""
+        content = ('<?xml version="1.0"?>\n'
+                   '<ar:AUTOSAR xmlns="http://autosar.org/schema/r4.2"'
+                   ' xmlns:ar="http://autosar.org/schema/r4.0"></ar:AUTOSAR>')
+
+        assert self.schema_manager.detect_schema_version(content) == AUTOSARRelease.R20_11
+
+    def test_namespace_past_sniff_window(self):
+        """Test that a root tag beyond the first 4096 bytes falls back to parsing."""
+        comment = "<!-- " + "x" * _SNIFF_SIZE + " -->\n"
+        content = _document('<AUTOSAR xmlns="http://autosar.org/schema/r4.0">', prolog=comment)
+
+        assert content.index("<AUTOSAR") > _SNIFF_SIZE
+        assert self.schema_manager._sniff_schema_version(content[:_SNIFF_SIZE]) is None
+        assert self.schema_manager.detect_schema_version(content) == AUTOSARRelease.R20_11
+
+    def test_unknown_namespace(self):
+        """Test that an unknown namespace falls back to the schema location."""
+        unknown = _document('<AUTOSAR xmlns="http://example.com/not-autosar">')
+        assert self.schema_manager._sniff_schema_version(unknown) is None
+        assert self.schema_manager.detect_schema_version(unknown) is None
+
+        located = _document(
+            '<AUTOSAR xmlns="http://example.com/not-autosar"'
+            ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+            ' xsi:schemaLocation="http://example.com/not-autosar AUTOSAR_R22.11.xsd">'
+        )
+        assert self.schema_manager._sniff_schema_version(located) is None
+        assert self.schema_manager.detect_schema_version(located) == AUTOSARRelease.R22_11
+
+    def test_malformed_content(self):
+        """Test that content that cannot be parsed yields no release."""
+        assert self.schema_manager.detect_schema_version("<AUTOSAR") is None
+
+
+MINIMAL_XSD = '''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="AUTOSAR" type="xs:string"/>
+</xs:schema>'''
+
+
+class TestSchemaCache:
+    """Test cases for the on-disk compiled schema cache."""
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """Test that a failing pickle write removes its temporary file."""
+        schema_path = tmp_path / "AUTOSAR_test.xsd"
+        schema_path.write_text(MINIMAL_XSD)
+        cache_dir = tmp_path / "cache"
+        schema_manager = SchemaManager(schema_dir=tmp_path, cache_dir=cache_dir)
+
+        def failing_dump(*args, **kwargs):
+            raise pickle.PicklingError("cannot pickle")
+
+        monkeypatch.setattr(schema_manager_module.pickle, "dump", failing_dump)
+        validator = schema_manager._load_xsd_validator(schema_path)
+
+        assert validator.is_valid("<AUTOSAR>text</AUTOSAR>")
+        assert list(cache_dir.iterdir()) == []
+
+    def test_cached_validator_is_reused(self, tmp_path):
+        """Test that a written cache entry is loaded on the next call."""
+        schema_path = tmp_path / "AUTOSAR_test.xsd"
+        schema_path.write_text(MINIMAL_XSD)
+        cache_dir = tmp_path / "cache"
+        schema_manager = SchemaManager(schema_dir=tmp_path, cache_dir=cache_dir)
+
+        schema_manager._load_xsd_validator(schema_path)
+        assert [path.suffix for path in cache_dir.iterdir()] == [".pkl"]
+        assert schema_manager._load_xsd_validator(schema_path).is_valid("<AUTOSAR/>")